@@ -1,79 +1,86 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from tkinter import ttk, messagebox, filedialog, simpledialog
+import argparse
+import base64
 import json
 import os
 from datetime import datetime
-import sys
 import traceback
 import logging
+import adaptive
+import classification
+import plotting
+import scoring
+from autosave import DebouncedWriter, atomic_write_json
+from chart_cache import ChartCache
+from instrumentation import Metrics, enabled_from_env
+from log_setup import LOG_FILE, configure_logging
+from progress_store import DEFAULT_DB_PATH, ProgressStore, migrate_legacy_json, new_session_key
+from results_journal import ResultsJournal
+from session_manager import SessionManager
+from session_record import SessionRecord, compact_record, expand_record
+from task_model import TaskModel
+from task_view import TaskListView
+from theme import COLORS
 
-# Set up logging
-logging.basicConfig(level=logging.DEBUG,
-                   format='%(asctime)s - %(levelname)s - %(message)s',
-                   handlers=[
-                       logging.FileHandler('personality_analyzer.log'),
-                       logging.StreamHandler()
-                   ])
+# Task progress is written in the background once clicks settle for this long
+AUTOSAVE_DELAY = float(os.environ.get("PERSONALITY_ANALYZER_AUTOSAVE_DELAY", "0.5"))
 
-# Modern color scheme
-COLORS = {
-    'bg': '#1E1E1E',
-    'fg': '#FFFFFF',
-    'accent': '#007ACC',
-    'secondary': '#2D2D2D',
-    'text': '#CCCCCC',
-    'success': '#4CAF50',
-    'warning': '#FFC107',
-    'error': '#F44336'
-}
+TASK_PROGRESS_DB = os.environ.get("PERSONALITY_ANALYZER_PROGRESS_DB", DEFAULT_DB_PATH)
+
+# Methods timed when instrumentation is enabled (see instrumentation.py)
+INSTRUMENTED_METHODS = ("setup_ui", "start_analysis", "show_question", "process_answer",
+                        "show_results", "create_chart", "load_results")
+# save_task_progress() only queues changes; the autosave thread's writes are
+# timed instead, as "save_tasks"
+INSTRUMENTED_STORE_METHODS = ("save_tasks",)
 
 class PersonalityAnalyzer:
-    def __init__(self, root):
+    def __init__(self, root, preload_charts=True, autosave_delay=AUTOSAVE_DELAY,
+                 metrics=None, metrics_dir=".", session_manager=None,
+                 chart_cache=None):
         try:
             logging.info("Initializing PersonalityAnalyzer")
             self.root = root
+            
+            # Opt-in timing; with metrics=None no method is wrapped
+            self.metrics = metrics
+            self.metrics_dir = metrics_dir
+            if self.metrics is not None:
+                self.metrics.instrument(self, INSTRUMENTED_METHODS)
             self.root.title("Personality Analyzer")
             self.root.geometry("1000x700")
             self.root.configure(bg=COLORS['bg'])
             
-            # Set dark theme for matplotlib
-            plt.style.use('dark_background')
+            # matplotlib is loaded lazily (see plotting.py); when enabled it is
+            # warmed up in the background once the questionnaire starts
+            self.preload_charts = preload_charts
             
             # Initialize variables
             self.name = tk.StringVar()
-            self.current_question = 0
-            self.scores = {
-                "📚 studying": 0,
-                "🎨 hobbies": 0,
-                "💪 fitness": 0
-            }
-            self.responses = []
-            
-            # Questions
-            self.questions = [
-                # Studying questions
-                {"text": "📚 Do you enjoy studying and learning new things?", "category": "studying", "emoji": "📚"},
-                {"text": "📚 Do you find yourself studying for long hours regularly?", "category": "studying", "emoji": "📚"},
-                {"text": "📚 Do you prefer quiet environments for studying?", "category": "studying", "emoji": "📚"},
-                {"text": "📚 Do you enjoy taking notes and organizing information?", "category": "studying", "emoji": "📚"},
-                {"text": "📚 Do you often research topics outside of required coursework?", "category": "studying", "emoji": "📚"},
-                
-                # Hobbies questions
-                {"text": "🎨 Do you have any hobbies or creative interests?", "category": "hobbies", "emoji": "🎨"},
-                {"text": "🎨 Do you spend significant time on your hobbies?", "category": "hobbies", "emoji": "🎨"},
-                {"text": "🎨 Do you enjoy creating art or music?", "category": "hobbies", "emoji": "🎨"},
-                {"text": "🎨 Do you like trying new creative activities?", "category": "hobbies", "emoji": "🎨"},
-                {"text": "🎨 Do you find joy in expressing yourself creatively?", "category": "hobbies", "emoji": "🎨"},
-                
-                # Fitness questions
-                {"text": "💪 Do you enjoy physical exercise or sports?", "category": "fitness", "emoji": "💪"},
-                {"text": "💪 Do you maintain a regular fitness routine?", "category": "fitness", "emoji": "💪"},
-                {"text": "💪 Do you enjoy outdoor activities and sports?", "category": "fitness", "emoji": "💪"},
-                {"text": "💪 Do you prefer team sports or individual workouts?", "category": "fitness", "emoji": "💪"},
-                {"text": "💪 Do you set fitness goals and track your progress?", "category": "fitness", "emoji": "💪"}
-            ]
+            self.scores = scoring.empty_scores()
+            # Questionnaire state lives in the session manager (see
+            # session_manager.py); this window drives one session at a time
+            self.sessions = session_manager if session_manager is not None else SessionManager(ttl=None)
+            self.active_session = None
+            # Set once the results screen shows the active session's results
+            self.results_shown = False
+            # Options > Questions: see adaptive.py
+            self.question_mode = tk.StringVar(value=adaptive.DEFAULT_MODE)
+            # Rendered charts are cached as PNGs by score vector (see chart_cache.py)
+            self.chart_cache = chart_cache if chart_cache is not None else ChartCache()
+            self.chart = None
+            self.chart_image = None
+            self.progress_store = ProgressStore(TASK_PROGRESS_DB)
+            migrate_legacy_json(self.progress_store)
+            if self.metrics is not None:
+                self.metrics.instrument(self.progress_store, INSTRUMENTED_STORE_METHODS)
+            self.session_key = None
+            self.task_saver = DebouncedWriter(self.progress_store.save_tasks, delay=autosave_delay,
+                                              name="task-progress-autosave")
+            
+            # Questions (shared with headless scoring, see scoring.py)
+            self.questions = scoring.QUESTIONS
             
             self.setup_ui()
             logging.info("PersonalityAnalyzer initialized successfully")
@@ -167,6 +174,7 @@ class PersonalityAnalyzer:
             
             # Create menu bar
             self.create_menu()
+            self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
             
             # Welcome screen
             self.welcome_frame = ttk.Frame(self.main_frame)
@@ -260,6 +268,24 @@ class PersonalityAnalyzer:
                                          width=15)
             start_over_button.pack(side=tk.LEFT, padx=20)
             
+            # Task list (built once, its rows are reused for every result);
+            # task state lives in the model, see task_model.py
+            self.task_model = TaskModel()
+            self.task_view = TaskListView(self.results_frame, COLORS, self.update_task_progress,
+                                          model=self.task_model)
+            self.task_view.frame.pack(expand=True, fill=tk.BOTH, padx=50, pady=20)
+            
+            # Task progress tracking
+            self.progress_frame = ttk.Frame(self.task_view.frame)
+            self.progress_frame.pack(pady=20)
+            
+            self.progress_label = ttk.Label(self.progress_frame, 
+                                          text="Task Progress: 0/12",
+                                          font=('Segoe UI', 12),
+                                          foreground=COLORS['fg'])
+            self.progress_label.pack(side=tk.LEFT, padx=5)
+            self.task_model.add_listener(lambda positions: self.update_progress_label())
+            
             logging.info("UI setup completed successfully")
         except Exception as e:
             logging.error(f"Error in UI setup: {str(e)}")
@@ -277,7 +303,19 @@ class PersonalityAnalyzer:
         file_menu.add_command(label="Save Results", command=self.save_results)
         file_menu.add_command(label="Load Results", command=self.load_results)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Export to Journal...", command=self.export_to_journal)
+        file_menu.add_command(label="Import from Journal...", command=self.import_from_journal)
+        if self.metrics is not None:
+            file_menu.add_command(label="Export Metrics", command=self.export_metrics)
+        file_menu.add_separator()
+        file_menu.add_command(label="Exit", command=self.exit_app)
+        
+        options_menu = tk.Menu(menubar, tearoff=0)
+        menubar.add_cascade(label="Options", menu=options_menu)
+        questions_menu = tk.Menu(options_menu, tearoff=0)
+        options_menu.add_cascade(label="Questions", menu=questions_menu)
+        for mode, label in adaptive.QUESTION_MODES.items():
+            questions_menu.add_radiobutton(label=label, value=mode, variable=self.question_mode)
         
         help_menu = tk.Menu(menubar, tearoff=0)
         menubar.add_cascade(label="Help", menu=help_menu)
@@ -289,357 +327,145 @@ class PersonalityAnalyzer:
             messagebox.showerror("Error", "Please enter your name")
             return
             
+        if self.preload_charts and not plotting.is_loaded():
+            plotting.warm_up()
+            
+        self.active_session = self.sessions.create(self.name.get().strip(),
+                                                   mode=self.question_mode.get())
+        self.results_shown = False
         self.welcome_frame.pack_forget()
         self.question_frame.pack(fill=tk.BOTH, expand=True)
         self.show_question()
         
-        # Load any existing task progress
-        self.load_task_progress()
-        
     def show_question(self):
-        if self.current_question < len(self.questions):
-            question = self.questions[self.current_question]
+        question = self.active_session.question()
+        if question is not None:
             self.question_label.config(text=question["text"])
-            self.progress["value"] = (self.current_question / len(self.questions)) * 100
+            self.progress["value"] = (self.active_session.current_question / len(self.questions)) * 100
         else:
             self.show_results()
             
     def process_answer(self, answer):
-        question = self.questions[self.current_question]
-        if answer:
-            self.scores[f"{question['emoji']} {question['category']}"] += 1
-        self.responses.append({
-            "question": question["text"],
-            "answer": "Yes" if answer else "No"
-        })
-        self.current_question += 1
+        self.active_session = self.sessions.answer(self.active_session.session_id, answer)
         self.show_question()
         
     def show_results(self):
         self.question_frame.pack_forget()
         self.results_frame.pack(fill=tk.BOTH, expand=True)
         
+        self.scores = self.active_session.scores()
+        self.results_shown = True
         category, description, tasks = self.analyze_results()
         self.category_label.config(text=f"Category: {category}")
         self.description_label.config(text=description)
         
-        # Create a container frame for centered content
-        container_frame = ttk.Frame(self.results_frame)
-        container_frame.pack(expand=True, fill=tk.BOTH, padx=50, pady=20)
-        
-        # Create tasks frame with a title
-        tasks_title = ttk.Label(container_frame, 
-                              text="Your Personalized Tasks",
-                              font=('Segoe UI', 16, 'bold'),
-                              foreground=COLORS['fg'])
-        tasks_title.pack(pady=(0, 20))
+        self.task_view.set_tasks(tasks)
+        self.session_key = new_session_key()
         
-        tasks_frame = ttk.Frame(container_frame)
-        tasks_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Create a canvas with scrollbar for tasks
-        canvas = tk.Canvas(tasks_frame, bg=COLORS['bg'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(tasks_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Initialize task tracking variables
-        self.task_vars = []
-        self.task_checkboxes = []
-        
-        # Add tasks to the scrollable frame
-        for task in tasks:
-            if task:  # Skip empty lines
-                if task.endswith(":"):  # Category headers
-                    ttk.Label(scrollable_frame, text=task, 
-                             font=('Segoe UI', 12, 'bold'),
-                             foreground=COLORS['fg']).pack(pady=(15, 5))
-                else:  # Task items
-                    var = tk.BooleanVar(value=False)
-                    self.task_vars.append(var)
-                    cb = ttk.Checkbutton(scrollable_frame, text=task, 
-                                      variable=var, 
-                                      command=lambda v=var, t=task: self.update_task_progress(v, t),
-                                      style='TCheckbutton')
-                    cb.pack(anchor="w", padx=20, pady=5)
-                    self.task_checkboxes.append(cb)
-        
-        # Pack the canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Add progress tracking
-        self.progress_frame = ttk.Frame(container_frame)
-        self.progress_frame.pack(pady=20)
-        
-        self.progress_label = ttk.Label(self.progress_frame, 
-                                      text="Task Progress: 0/12",
-                                      font=('Segoe UI', 12),
-                                      foreground=COLORS['fg'])
-        self.progress_label.pack(side=tk.LEFT, padx=5)
+        # Load any existing task progress
+        if self.load_task_progress():
+            self.save_task_progress()
         
         self.create_chart()
         
-    def update_task_progress(self, var, task):
-        completed = sum(1 for v in self.task_vars if v.get())
-        total = len(self.task_vars)
-        self.progress_label.config(text=f"Task Progress: {completed}/{total}")
-        
-        # Update the task in responses
-        for response in self.responses:
-            if response.get("task") == task:
-                response["completed"] = var.get()
-                break
+    def update_progress_label(self):
+        self.progress_label.config(text=f"Task Progress: {self.task_model.completed}/{len(self.task_model)}")
         
+    def update_task_progress(self, position, task, completed):
         # Auto-save progress
-        self.save_task_progress()
+        self.save_task_progress([position])
         
-    def save_task_progress(self):
+    def save_task_progress(self, positions=None):
+        # Only the given task positions (default: all tasks) are queued; the
+        # autosave thread writes them once clicks settle
         try:
-            progress = {
-                "name": self.name.get(),
-                "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "tasks": []
-            }
-            
-            for i, (var, cb) in enumerate(zip(self.task_vars, self.task_checkboxes)):
-                progress["tasks"].append({
-                    "text": cb.cget("text"),
-                    "completed": var.get()
-                })
-            
-            # Save to a hidden file in the user's directory
-            save_path = os.path.join(os.path.expanduser("~"), 
-                                   ".personality_analyzer_tasks.json")
-            with open(save_path, 'w') as f:
-                json.dump(progress, f, indent=4)
+            if self.session_key is None:
+                self.session_key = new_session_key()
+            name = self.name.get()
+            date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            texts = self.task_model.texts
+            states = self.task_model.states
+            if positions is None:
+                positions = range(len(texts))
+            
+            for position in positions:
+                self.task_saver.submit((self.session_key, position),
+                                       (name, date, texts[position], states[position]))
         except Exception as e:
             logging.error(f"Error saving task progress: {str(e)}")
             
     def load_task_progress(self):
+        # Returns True if earlier progress for this user was restored
         try:
-            save_path = os.path.join(os.path.expanduser("~"), 
-                                   ".personality_analyzer_tasks.json")
-            if os.path.exists(save_path):
-                with open(save_path, 'r') as f:
-                    progress = json.load(f)
-                
-                # Only load if it's for the current user
-                if progress.get("name") == self.name.get():
-                    for task_data, var in zip(progress["tasks"], self.task_vars):
-                        var.set(task_data["completed"])
-                    
-                    completed = sum(1 for v in self.task_vars if v.get())
-                    total = len(self.task_vars)
-                    self.progress_label.config(text=f"Task Progress: {completed}/{total}")
+            # Make sure a save still waiting in the background is written
+            self.task_saver.flush()
+            progress = self.progress_store.load_latest(self.name.get())
+            if progress is not None:
+                completed = {task_data["text"]: task_data["completed"]
+                             for task_data in progress["tasks"]}
+                # Tasks start out not completed, so only saved states are applied
+                self.task_model.update_by_text(completed)
+                return True
         except Exception as e:
             logging.error(f"Error loading task progress: {str(e)}")
+        return False
         
     def analyze_results(self):
-        if self.scores["📚 studying"] >= 1 and self.scores["🎨 hobbies"] == 0 and self.scores["💪 fitness"] == 0:
-            return ("1. 📚 The Border Collie Scholar", 
-                   "Like a Border Collie, you're highly intelligent and focused on learning. You excel in academic pursuits and enjoy mental challenges, but might need encouragement to take breaks and explore other activities.",
-                   [
-                       "🎨 Creative Tasks:",
-                       "1. Try painting or drawing for 30 minutes",
-                       "2. Learn to play a musical instrument",
-                       "3. Write a short story or poem",
-                       "4. Take a photography walk",
-                       "",
-                       "💪 Fitness Tasks:",
-                       "5. Go for a 20-minute walk",
-                       "6. Try yoga or stretching",
-                       "7. Join a beginner's sports class",
-                       "8. Do 10 minutes of home exercises",
-                       "",
-                       "📚 Study Balance:",
-                       "9. Take regular study breaks",
-                       "10. Set a timer for study sessions",
-                       "11. Create a balanced daily schedule",
-                       "12. Try studying in different environments"
-                   ])
-        elif self.scores["🎨 hobbies"] >= 1 and self.scores["📚 studying"] == 0 and self.scores["💪 fitness"] == 0:
-            return ("2. 🎨 The Golden Retriever Creative", 
-                   "Like a Golden Retriever, you're friendly, enthusiastic, and love engaging in creative activities. You bring joy to others through your hobbies and artistic pursuits, always ready to try something new and fun.",
-                   [
-                       "📚 Study Tasks:",
-                       "1. Read a non-fiction book for 30 minutes",
-                       "2. Take an online course in a new subject",
-                       "3. Learn a new language basics",
-                       "4. Study a topic you're curious about",
-                       "5. Watch educational documentaries",
-                       "6. Practice mental math exercises",
-                       "",
-                       "💪 Fitness Tasks:",
-                       "7. Start with 10 minutes of daily exercise",
-                       "8. Try a new sport or physical activity",
-                       "9. Join a fitness class",
-                       "",
-                       "🎨 Creative Balance:",
-                       "10. Set time limits for creative projects",
-                       "11. Schedule regular study breaks",
-                       "12. Create a balanced weekly routine"
-                   ])
-        elif self.scores["💪 fitness"] >= 1 and self.scores["📚 studying"] == 0 and self.scores["🎨 hobbies"] == 0:
-            return ("3. 💪 The Siberian Husky Athlete", 
-                   "Like a Siberian Husky, you're energetic, athletic, and love physical challenges. You thrive on exercise and outdoor activities, always ready for the next adventure or workout.",
-                   [
-                       "📚 Study Tasks:",
-                       "1. Read for 20 minutes daily",
-                       "2. Take an online course",
-                       "3. Learn about nutrition and health",
-                       "4. Study exercise science basics",
-                       "5. Watch educational fitness videos",
-                       "6. Read sports psychology articles",
-                       "",
-                       "🎨 Creative Tasks:",
-                       "7. Try a creative hobby",
-                       "8. Learn to cook healthy meals",
-                       "9. Start a fitness journal",
-                       "",
-                       "💪 Fitness Balance:",
-                       "10. Schedule rest days",
-                       "11. Try different types of exercise",
-                       "12. Set realistic fitness goals"
-                   ])
-        elif self.scores["📚 studying"] >= 1 and self.scores["🎨 hobbies"] >= 1 and self.scores["💪 fitness"] == 0:
-            return ("4. 📚🎨 The Poodle Polymath", 
-                   "Like a Poodle, you're both intelligent and creative. You excel in both academic and artistic pursuits, showing versatility and adaptability in your interests. You might need a nudge to get more physically active.",
-                   [
-                       "💪 Fitness Tasks:",
-                       "1. Start with 10 minutes of daily exercise",
-                       "2. Try yoga or stretching",
-                       "3. Go for a 20-minute walk",
-                       "4. Join a beginner's fitness class",
-                       "5. Try home workout videos",
-                       "6. Set step goals for the day",
-                       "",
-                       "📚 Study Balance:",
-                       "7. Take active study breaks",
-                       "8. Try studying while walking",
-                       "9. Create an exercise schedule",
-                       "",
-                       "🎨 Creative Balance:",
-                       "10. Combine art with movement",
-                       "11. Try outdoor photography",
-                       "12. Set fitness-related creative goals"
-                   ])
-        elif self.scores["📚 studying"] >= 1 and self.scores["💪 fitness"] >= 1 and self.scores["🎨 hobbies"] == 0:
-            return ("5. 📚💪 The German Shepherd Scholar-Athlete", 
-                   "Like a German Shepherd, you're both intelligent and physically capable. You excel in both academic and physical pursuits, showing discipline and dedication in everything you do. You might want to explore more creative outlets.",
-                   [
-                       "🎨 Creative Tasks:",
-                       "1. Try drawing or painting",
-                       "2. Learn to play an instrument",
-                       "3. Start a creative journal",
-                       "4. Take a photography class",
-                       "5. Try creative writing",
-                       "6. Explore digital art",
-                       "",
-                       "📚 Study Balance:",
-                       "7. Study in creative environments",
-                       "8. Try mind mapping for notes",
-                       "9. Use creative study techniques",
-                       "",
-                       "💪 Fitness Balance:",
-                       "10. Try creative movement",
-                       "11. Join a dance class",
-                       "12. Combine art with exercise"
-                   ])
-        elif self.scores["🎨 hobbies"] >= 1 and self.scores["💪 fitness"] >= 1 and self.scores["📚 studying"] == 0:
-            return ("6. 🎨💪 The Labrador Adventurer", 
-                   "Like a Labrador, you're both creative and athletic. You love exploring new hobbies and staying active, bringing energy and enthusiasm to everything you do. You might want to balance your activities with some academic pursuits.",
-                   [
-                       "📚 Study Tasks:",
-                       "1. Read for 30 minutes daily",
-                       "2. Take an online course",
-                       "3. Learn about a new subject",
-                       "4. Study exercise science",
-                       "5. Read about art history",
-                       "6. Learn about nutrition",
-                       "7. Study time management",
-                       "8. Read about psychology",
-                       "",
-                       "🎨 Creative Balance:",
-                       "9. Set study goals",
-                       "10. Create a study schedule",
-                       "",
-                       "💪 Fitness Balance:",
-                       "11. Study while walking",
-                       "12. Take active study breaks"
-                   ])
-        else:
-            return ("🌟 The Mixed Breed All-Rounder", 
-                   "Like a well-balanced mixed breed, you show interest in multiple areas, making you a versatile and well-rounded individual! You adapt well to different situations and can excel in various pursuits.",
-                   [
-                       "📚 Study Tasks:",
-                       "1. Set specific learning goals",
-                       "2. Try new study techniques",
-                       "",
-                       "🎨 Creative Tasks:",
-                       "3. Explore new creative outlets",
-                       "4. Challenge your artistic skills",
-                       "",
-                       "💪 Fitness Tasks:",
-                       "5. Try new physical activities",
-                       "6. Set fitness challenges",
-                       "",
-                       "🌟 Balance Tasks:",
-                       "7. Create a weekly schedule",
-                       "8. Track your progress",
-                       "9. Set new goals regularly",
-                       "10. Try cross-training activities",
-                       "11. Maintain variety in activities",
-                       "12. Review and adjust your routine"
-                   ])
+        # (category, description, tasks) from the precompiled table
+        return classification.classify(self.scores)
         
     def create_chart(self):
-        # Clear previous chart if exists
-        for widget in self.chart_frame.winfo_children():
-            widget.destroy()
-            
-        fig = plt.figure(figsize=(8, 4), facecolor=COLORS['bg'])
-        ax = fig.add_subplot(111)
-        ax.set_facecolor(COLORS['bg'])
-        
-        bars = ax.bar(self.scores.keys(), self.scores.values(), 
-                     color=[COLORS['accent'], COLORS['success'], COLORS['warning']])
-        
-        plt.xticks(rotation=45, ha='right', color=COLORS['fg'])
-        plt.yticks(color=COLORS['fg'])
-        ax.set_ylabel("Interest Level", fontsize=10, color=COLORS['fg'])
-        ax.set_title(f"{self.name.get()}'s Activity Preferences", 
-                    fontsize=12, pad=20, color=COLORS['fg'])
-        
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}',
-                   ha='center', va='bottom', color=COLORS['fg'])
-        
-        ax.grid(axis='y', linestyle='--', alpha=0.3, color=COLORS['fg'])
-        plt.tight_layout()
-        
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # The chart is a cached PNG shown in a label; matplotlib only runs
+        # for a score vector and name that have not been rendered before
+        png = self.chart_cache.chart("activity", self.scores, self.name.get(), COLORS)
+        self.chart_image = tk.PhotoImage(data=base64.b64encode(png))
+        if self.chart is None:
+            self.chart = tk.Label(self.chart_frame, bg=COLORS['bg'], borderwidth=0)
+            self.chart.pack(fill=tk.BOTH, expand=True)
+        self.chart.config(image=self.chart_image)
+        
+    def close_chart(self):
+        if self.chart is not None:
+            self.chart.destroy()
+            self.chart = None
+            self.chart_image = None
+        self.chart_cache.close()
+            
+    def export_metrics(self, show_message=True):
+        try:
+            json_path, prom_path = self.metrics.export(self.metrics_dir)
+            logging.info(f"Metrics exported to {json_path} and {prom_path}")
+            if show_message:
+                messagebox.showinfo("Metrics", f"Metrics exported to:\n{json_path}\n{prom_path}")
+        except Exception as e:
+            logging.error(f"Error exporting metrics: {str(e)}")
+            if show_message:
+                messagebox.showerror("Error", f"Failed to export metrics: {str(e)}")
+            
+    def exit_app(self):
+        # Write any pending task progress before leaving
+        self.task_saver.close()
+        self.progress_store.close()
+        if self.metrics is not None:
+            self.export_metrics(show_message=False)
+        self.close_chart()
+        self.root.quit()
+        
+    def results_record(self):
+        # Category, description and scores are rebuilt from the session on load
+        return compact_record(self.name.get(), datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                              self.active_session.record)
+        
+    def has_results(self):
+        # Loaded results are recreated as a "full" session, so a record that
+        # stopped early (stop/reorder modes, older files) is not `finished`;
+        # whatever is on the results screen can be saved
+        return self.active_session is not None and self.results_shown
         
     def save_results(self):
-        results = {
-            "name": self.name.get(),
-            "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "category": self.category_label.cget("text"),
-            "description": self.description_label.cget("text"),
-            "scores": self.scores,
-            "responses": self.responses
-        }
+        if not self.has_results():
+            messagebox.showerror("Error", "There are no results to save yet. Complete the analysis first.")
+            return
         
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
@@ -649,8 +475,8 @@ class PersonalityAnalyzer:
         
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    json.dump(results, f, indent=4)
+                # A failed save leaves any earlier file of that name intact
+                atomic_write_json(filename, self.results_record())
                 messagebox.showinfo("Success", "Results saved successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save results: {str(e)}")
@@ -665,29 +491,84 @@ class PersonalityAnalyzer:
                 with open(filename, 'r') as f:
                     results = json.load(f)
                 
-                self.name.set(results["name"])
-                self.scores = results["scores"]
-                self.responses = results["responses"]
+                self.show_loaded_results(results)
                 
-                self.welcome_frame.pack_forget()
-                self.question_frame.pack_forget()
-                self.results_frame.pack(fill=tk.BOTH, expand=True)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load results: {str(e)}")
                 
-                self.category_label.config(text=results["category"])
-                self.description_label.config(text=results["description"])
-                self.create_chart()
+    def show_loaded_results(self, results):
+        if "session" in results:
+            record = SessionRecord.decode(results["session"])
+            results = expand_record(results)
+        else:
+            # Results saved before sessions were stored compactly
+            record = SessionRecord.from_responses(results["responses"])
+        self.end_session()
+        self.active_session = self.sessions.create(results["name"], record)
+        self.results_shown = True
+        self.name.set(results["name"])
+        self.scores = results["scores"]
+        
+        self.welcome_frame.pack_forget()
+        self.question_frame.pack_forget()
+        self.results_frame.pack(fill=tk.BOTH, expand=True)
+        
+        self.category_label.config(text=results["category"])
+        self.description_label.config(text=results["description"])
+        self.task_view.set_tasks(self.analyze_results()[2])
+        self.create_chart()
+        
+    def export_to_journal(self):
+        # Append the current results to a JSONL journal (see results_journal.py)
+        if not self.has_results():
+            messagebox.showerror("Error", "There are no results to export yet. Complete the analysis first.")
+            return
+        
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".jsonl",
+            filetypes=[("Results journal", "*.jsonl"), ("All files", "*.*")],
+            initialfile="personality_results.jsonl",
+            confirmoverwrite=False
+        )
+        
+        if filename:
+            try:
+                ResultsJournal(filename).append(self.results_record())
+                messagebox.showinfo("Success", "Results added to the journal!")
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to export results: {str(e)}")
                 
+    def import_from_journal(self):
+        filename = filedialog.askopenfilename(
+            filetypes=[("Results journal", "*.jsonl"), ("All files", "*.*")]
+        )
+        
+        if filename:
+            try:
+                journal = ResultsJournal(filename)
+                name = simpledialog.askstring("Import from Journal",
+                                              "Load the latest results for:",
+                                              initialvalue=self.name.get(),
+                                              parent=self.root)
+                if name is None:
+                    return
+                results = journal.latest(name.strip())
+                if results is None:
+                    messagebox.showerror("Error", f"No results for '{name}' in the journal")
+                    return
+                self.show_loaded_results(results)
             except Exception as e:
-                messagebox.showerror("Error", f"Failed to load results: {str(e)}")
+                messagebox.showerror("Error", f"Failed to import results: {str(e)}")
                 
+    def end_session(self):
+        if self.active_session is not None:
+            self.sessions.end(self.active_session.session_id)
+            self.active_session = None
+        self.results_shown = False
+            
     def start_over(self):
-        self.current_question = 0
-        self.scores = {
-            "📚 studying": 0,
-            "🎨 hobbies": 0,
-            "💪 fitness": 0
-        }
-        self.responses = []
+        self.end_session()
+        self.scores = scoring.empty_scores()
         
         self.results_frame.pack_forget()
         self.welcome_frame.pack(fill=tk.BOTH, expand=True)
@@ -704,6 +585,7 @@ class PersonalityAnalyzer:
         
         1. Enter your name and click 'Start Analysis'
         2. Answer each question with Yes or No
+           (Options > Questions can end early once your result is certain)
         3. View your results and category
         4. Save your results for future reference
         5. Load previous results if needed
@@ -715,18 +597,41 @@ class PersonalityAnalyzer:
         """
         messagebox.showinfo("Help", help_text)
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Personality Analyzer")
+    parser.add_argument("--log-level",
+                        help="DEBUG, INFO, WARNING, ERROR or CRITICAL "
+                             "(default: $PERSONALITY_ANALYZER_LOG_LEVEL or DEBUG)")
+    parser.add_argument("--log-file", default=LOG_FILE, help="log file path ('' to disable)")
+    parser.add_argument("--log-max-bytes", type=int, default=1024 * 1024,
+                        help="rotate the log file at this size")
+    parser.add_argument("--log-rotate-when",
+                        help="rotate by time instead of size (e.g. 'midnight', 'H')")
+    parser.add_argument("--log-backups", type=int, default=5,
+                        help="rotated log files to keep")
+    parser.add_argument("--metrics", action="store_true", default=enabled_from_env(),
+                        help="time UI methods and export the metrics on exit "
+                             "(also enabled by PERSONALITY_ANALYZER_METRICS=1)")
+    parser.add_argument("--metrics-dir", default=".",
+                        help="where metrics JSON and Prometheus files are written")
+    args = parser.parse_args(argv)
+    
+    # Log records are handed to a background thread; see log_setup.py
+    configure_logging(args.log_level, args.log_file, args.log_max_bytes,
+                      args.log_backups, args.log_rotate_when)
+    
     try:
         logging.info("Starting application")
         root = tk.Tk()
-        app = PersonalityAnalyzer(root)
+        app = PersonalityAnalyzer(root, metrics=Metrics() if args.metrics else None,
+                                  metrics_dir=args.metrics_dir)
         root.mainloop()
-except Exception as e:
+    except Exception as e:
         logging.error(f"Critical error in main: {str(e)}")
         logging.error(traceback.format_exc())
         print(f"An error occurred: {str(e)}")
-    traceback.print_exc()
-    input("Press Enter to exit...")
+        traceback.print_exc()
+        input("Press Enter to exit...")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,99 @@
+"""Adaptive early stopping for the Personality Analyzer questionnaire.
+
+After each answer, the outcomes that can still be reached are worked out
+from the classification table. In category c, the current score s_c and
+the r_c unanswered questions allow any final score from s_c to s_c + r_c,
+so the reachable outcomes are the table entries over the product of those
+ranges. Once only one outcome is left, the remaining answers cannot change
+what analyze_results() returns and the session ends.
+
+Modes (QUESTION_MODES):
+
+  full      every question, in order (the classic questionnaire)
+  stop      questions in order, stopping as soon as the outcome is decided
+  reorder   stopping early, and always asking the question that minimises
+            the expected number of questions still to come, assuming
+            each answer is equally likely to be yes or no
+
+Questions of the same category are interchangeable for the outcome, so
+"reorder" chooses a category and asks its first unanswered question.
+Everything is computed on (scores, remaining) per category, so the
+lookups are memoised over at most 21^3 states.
+
+A session that stops early keeps the scores of the questions it asked;
+its category, description and tasks are the same as if every remaining
+question had been answered (benchmarks/check_adaptive.py checks this for
+every possible answer vector).
+"""
+import itertools
+from functools import lru_cache
+
+import classification
+import scoring
+
+QUESTION_MODES = {
+    "full": "All questions",
+    "stop": "Stop when the result is certain",
+    "reorder": "Stop early, most informative question first",
+}
+DEFAULT_MODE = "full"
+
+
+@lru_cache(maxsize=None)
+def reachable_outcomes(scores, remaining):
+    """Classification records still reachable from these per-category scores."""
+    ranges = [range(score, score + left + 1) for score, left in zip(scores, remaining)]
+    return frozenset(classification.classify_scores(final) for final in itertools.product(*ranges))
+
+
+def is_decided(scores, remaining):
+    return len(reachable_outcomes(scores, remaining)) == 1
+
+
+def _after(scores, remaining, category, answer):
+    scores = scores[:category] + (scores[category] + answer,) + scores[category + 1:]
+    remaining = remaining[:category] + (remaining[category] - 1,) + remaining[category + 1:]
+    return scores, remaining
+
+
+@lru_cache(maxsize=None)
+def expected_questions(scores, remaining):
+    """Expected questions still to ask with the best order (yes/no equally likely)."""
+    return _best_category(scores, remaining)[1]
+
+
+@lru_cache(maxsize=None)
+def _best_category(scores, remaining):
+    if is_decided(scores, remaining):
+        return None, 0.0
+    best = None
+    for category, left in enumerate(remaining):
+        if not left:
+            continue
+        cost = 1 + (expected_questions(*_after(scores, remaining, category, 0))
+                    + expected_questions(*_after(scores, remaining, category, 1))) / 2
+        # Ties go to the lower category, i.e. the earliest question
+        if best is None or cost < best[1]:
+            best = (category, cost)
+    return best
+
+
+def next_question(record, mode=DEFAULT_MODE):
+    """Index (into the record's questions) of the next question to ask, or None when done."""
+    if record.count >= len(record.questions):
+        return None
+    if mode == "full":
+        return record.next_index()
+    scores, remaining = record.progress()
+    if is_decided(scores, remaining):
+        return None
+    if mode == "stop":
+        return record.next_index()
+    if mode != "reorder":
+        raise ValueError(f"Unknown question mode: {mode!r}")
+    category = _best_category(scores, remaining)[0]
+    asked = record.asked_mask()
+    for index, question_category in enumerate(scoring.question_categories(record.questions)):
+        if question_category == category and not asked >> index & 1:
+            return index
+    return None
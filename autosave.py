@@ -0,0 +1,134 @@
+"""Debounced background saving.
+
+DebouncedWriter collects changes submitted from the UI thread and hands
+them to a sink function on a background thread, once no new change has
+arrived for `delay` seconds. Changes are keyed, so a burst of checkbox
+clicks is written once with only the latest value per key. Pending
+changes are flushed by close(), which also runs at interpreter exit.
+"""
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+
+def _new_file_mode(path):
+    """Permissions for the replacement: the existing file's, else what open() would give."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write_json(path, data, indent=4):
+    """Write JSON to path via a temp file and rename.
+
+    A crash mid-write leaves the previous file in place instead of a
+    truncated one. mkstemp creates the temp file as 0600, so it is given
+    the permissions the file would otherwise have before the rename.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory,
+                                    prefix=f".{os.path.basename(path)}.",
+                                    suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _new_file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class DebouncedWriter:
+    def __init__(self, sink, delay=0.5, max_delay=None, name="autosave"):
+        # sink(changes) receives a dict of the latest value per key
+        self.sink = sink
+        self.delay = delay
+        # Upper bound on how long a steady stream of changes can defer a write
+        self.max_delay = max_delay if max_delay is not None else delay * 10
+        self._pending = {}
+        self._first_change = None
+        self._last_change = None
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def submit(self, key, value):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("DebouncedWriter is closed")
+            now = time.monotonic()
+            if not self._pending:
+                self._first_change = now
+            self._pending[key] = value
+            self._last_change = now
+            self._cond.notify_all()
+
+    def flush(self):
+        """Write pending changes now and wait until they are on disk."""
+        with self._cond:
+            if not self._pending and not self._writing:
+                return
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending or self._writing:
+                self._cond.wait()
+
+    def close(self):
+        with self._cond:
+            if self._closed:
+                return
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def _due_in(self):
+        # Seconds until the pending batch should be written (<= 0 means now)
+        if self._flush_requested:
+            return 0
+        now = time.monotonic()
+        return min(self._last_change + self.delay, self._first_change + self.max_delay) - now
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and not self._pending:
+                    self._cond.wait()
+                if self._closed and not self._pending:
+                    return
+                wait = self._due_in()
+                while wait > 0 and not self._closed:
+                    self._cond.wait(wait)
+                    wait = self._due_in()
+                batch, self._pending = self._pending, {}
+                self._writing = True
+
+            try:
+                self.sink(batch)
+            except Exception as e:
+                logging.error(f"Error in background save: {str(e)}")
+            finally:
+                with self._cond:
+                    self._writing = False
+                    if not self._pending:
+                        self._flush_requested = False
+                    self._cond.notify_all()
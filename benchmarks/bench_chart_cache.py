@@ -0,0 +1,81 @@
+"""Chart rendering vs the chart cache (chart_cache.py).
+
+Renders --charts random Personality Analyzer and personality assessment
+charts into an empty cache, then fetches the same charts again from the
+memory level and, through a fresh ChartCache on the same directory, from
+the disk level. A last run with --budget-kb of disk checks that eviction
+keeps the directory within budget.
+
+    python benchmarks/bench_chart_cache.py --charts 50
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import chart_cache
+from chart_cache import ChartCache
+
+# The analyzer's emoji labels are missing from the default font
+warnings.filterwarnings("ignore", message="Glyph .* missing")
+
+
+def fetch_all(cache, charts):
+    start = time.perf_counter()
+    for kind, scores in charts:
+        cache.chart(kind, scores, "user")
+    return (time.perf_counter() - start) / len(charts)
+
+
+def directory_size(path):
+    return sum(entry.stat().st_size for entry in os.scandir(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", type=int, default=50)
+    parser.add_argument("--budget-kb", type=int, default=256, help="disk budget of the eviction run")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    vectors = {"activity": list(chart_cache.activity_score_vectors()),
+               "traits": list(chart_cache.trait_score_vectors())}
+    charts = []
+    for i in range(args.charts):
+        kind = "activity" if i % 2 == 0 else "traits"
+        charts.append((kind, rng.choice(vectors[kind])))
+    distinct = len({(kind, tuple(scores.values())) for kind, scores in charts})
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ChartCache(cache_dir)
+        fetch_all(cache, charts[:2])  # loads matplotlib
+        cache.clear()
+        render = fetch_all(cache, charts)
+        memory = fetch_all(cache, charts)
+        cache.close()
+        disk = fetch_all(ChartCache(cache_dir), charts)
+        print(f"{args.charts} charts ({distinct} distinct), {cache.disk / 1024:.0f} KB on disk")
+        print(f"  render {render * 1e3:8.2f} ms/chart")
+        print(f"  memory {memory * 1e3:8.3f} ms/chart  ({render / memory:,.0f}x)")
+        print(f"  disk   {disk * 1e3:8.3f} ms/chart  ({render / disk:,.0f}x)")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = ChartCache(cache_dir, memory_budget=args.budget_kb * 1024,
+                           disk_budget=args.budget_kb * 1024)
+        fetch_all(cache, charts)
+        cache.close()
+        size = directory_size(cache_dir)
+        print(f"budget {args.budget_kb} KB: {cache.disk_entries} charts kept, {size / 1024:.0f} KB on disk, "
+              f"{cache.memory / 1024:.0f} KB in memory")
+        if size > args.budget_kb * 1024:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
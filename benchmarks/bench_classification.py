@@ -0,0 +1,242 @@
+"""Classification table: exhaustive equivalence check and micro-benchmark.
+
+Checks that classification.classify() returns exactly what the original
+if/elif chain in PersonalityAnalyzer.analyze_results() returned, for every
+one of the 216 possible score tuples, then times single and batch lookups
+against the chain.
+
+    python benchmarks/bench_classification.py --rows 1000000
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import classification
+import scoring
+
+
+def legacy_analyze_results(scores):
+    # Verbatim copy of the if/elif chain PersonalityAnalyzer.analyze_results() used to run
+    if scores["📚 studying"] >= 1 and scores["🎨 hobbies"] == 0 and scores["💪 fitness"] == 0:
+        return ("1. 📚 The Border Collie Scholar", 
+               "Like a Border Collie, you're highly intelligent and focused on learning. You excel in academic pursuits and enjoy mental challenges, but might need encouragement to take breaks and explore other activities.",
+               [
+                   "🎨 Creative Tasks:",
+                   "1. Try painting or drawing for 30 minutes",
+                   "2. Learn to play a musical instrument",
+                   "3. Write a short story or poem",
+                   "4. Take a photography walk",
+                   "",
+                   "💪 Fitness Tasks:",
+                   "5. Go for a 20-minute walk",
+                   "6. Try yoga or stretching",
+                   "7. Join a beginner's sports class",
+                   "8. Do 10 minutes of home exercises",
+                   "",
+                   "📚 Study Balance:",
+                   "9. Take regular study breaks",
+                   "10. Set a timer for study sessions",
+                   "11. Create a balanced daily schedule",
+                   "12. Try studying in different environments"
+               ])
+    elif scores["🎨 hobbies"] >= 1 and scores["📚 studying"] == 0 and scores["💪 fitness"] == 0:
+        return ("2. 🎨 The Golden Retriever Creative", 
+               "Like a Golden Retriever, you're friendly, enthusiastic, and love engaging in creative activities. You bring joy to others through your hobbies and artistic pursuits, always ready to try something new and fun.",
+               [
+                   "📚 Study Tasks:",
+                   "1. Read a non-fiction book for 30 minutes",
+                   "2. Take an online course in a new subject",
+                   "3. Learn a new language basics",
+                   "4. Study a topic you're curious about",
+                   "5. Watch educational documentaries",
+                   "6. Practice mental math exercises",
+                   "",
+                   "💪 Fitness Tasks:",
+                   "7. Start with 10 minutes of daily exercise",
+                   "8. Try a new sport or physical activity",
+                   "9. Join a fitness class",
+                   "",
+                   "🎨 Creative Balance:",
+                   "10. Set time limits for creative projects",
+                   "11. Schedule regular study breaks",
+                   "12. Create a balanced weekly routine"
+               ])
+    elif scores["💪 fitness"] >= 1 and scores["📚 studying"] == 0 and scores["🎨 hobbies"] == 0:
+        return ("3. 💪 The Siberian Husky Athlete", 
+               "Like a Siberian Husky, you're energetic, athletic, and love physical challenges. You thrive on exercise and outdoor activities, always ready for the next adventure or workout.",
+               [
+                   "📚 Study Tasks:",
+                   "1. Read for 20 minutes daily",
+                   "2. Take an online course",
+                   "3. Learn about nutrition and health",
+                   "4. Study exercise science basics",
+                   "5. Watch educational fitness videos",
+                   "6. Read sports psychology articles",
+                   "",
+                   "🎨 Creative Tasks:",
+                   "7. Try a creative hobby",
+                   "8. Learn to cook healthy meals",
+                   "9. Start a fitness journal",
+                   "",
+                   "💪 Fitness Balance:",
+                   "10. Schedule rest days",
+                   "11. Try different types of exercise",
+                   "12. Set realistic fitness goals"
+               ])
+    elif scores["📚 studying"] >= 1 and scores["🎨 hobbies"] >= 1 and scores["💪 fitness"] == 0:
+        return ("4. 📚🎨 The Poodle Polymath", 
+               "Like a Poodle, you're both intelligent and creative. You excel in both academic and artistic pursuits, showing versatility and adaptability in your interests. You might need a nudge to get more physically active.",
+               [
+                   "💪 Fitness Tasks:",
+                   "1. Start with 10 minutes of daily exercise",
+                   "2. Try yoga or stretching",
+                   "3. Go for a 20-minute walk",
+                   "4. Join a beginner's fitness class",
+                   "5. Try home workout videos",
+                   "6. Set step goals for the day",
+                   "",
+                   "📚 Study Balance:",
+                   "7. Take active study breaks",
+                   "8. Try studying while walking",
+                   "9. Create an exercise schedule",
+                   "",
+                   "🎨 Creative Balance:",
+                   "10. Combine art with movement",
+                   "11. Try outdoor photography",
+                   "12. Set fitness-related creative goals"
+               ])
+    elif scores["📚 studying"] >= 1 and scores["💪 fitness"] >= 1 and scores["🎨 hobbies"] == 0:
+        return ("5. 📚💪 The German Shepherd Scholar-Athlete", 
+               "Like a German Shepherd, you're both intelligent and physically capable. You excel in both academic and physical pursuits, showing discipline and dedication in everything you do. You might want to explore more creative outlets.",
+               [
+                   "🎨 Creative Tasks:",
+                   "1. Try drawing or painting",
+                   "2. Learn to play an instrument",
+                   "3. Start a creative journal",
+                   "4. Take a photography class",
+                   "5. Try creative writing",
+                   "6. Explore digital art",
+                   "",
+                   "📚 Study Balance:",
+                   "7. Study in creative environments",
+                   "8. Try mind mapping for notes",
+                   "9. Use creative study techniques",
+                   "",
+                   "💪 Fitness Balance:",
+                   "10. Try creative movement",
+                   "11. Join a dance class",
+                   "12. Combine art with exercise"
+               ])
+    elif scores["🎨 hobbies"] >= 1 and scores["💪 fitness"] >= 1 and scores["📚 studying"] == 0:
+        return ("6. 🎨💪 The Labrador Adventurer", 
+               "Like a Labrador, you're both creative and athletic. You love exploring new hobbies and staying active, bringing energy and enthusiasm to everything you do. You might want to balance your activities with some academic pursuits.",
+               [
+                   "📚 Study Tasks:",
+                   "1. Read for 30 minutes daily",
+                   "2. Take an online course",
+                   "3. Learn about a new subject",
+                   "4. Study exercise science",
+                   "5. Read about art history",
+                   "6. Learn about nutrition",
+                   "7. Study time management",
+                   "8. Read about psychology",
+                   "",
+                   "🎨 Creative Balance:",
+                   "9. Set study goals",
+                   "10. Create a study schedule",
+                   "",
+                   "💪 Fitness Balance:",
+                   "11. Study while walking",
+                   "12. Take active study breaks"
+               ])
+    else:
+        return ("🌟 The Mixed Breed All-Rounder", 
+               "Like a well-balanced mixed breed, you show interest in multiple areas, making you a versatile and well-rounded individual! You adapt well to different situations and can excel in various pursuits.",
+               [
+                   "📚 Study Tasks:",
+                   "1. Set specific learning goals",
+                   "2. Try new study techniques",
+                   "",
+                   "🎨 Creative Tasks:",
+                   "3. Explore new creative outlets",
+                   "4. Challenge your artistic skills",
+                   "",
+                   "💪 Fitness Tasks:",
+                   "5. Try new physical activities",
+                   "6. Set fitness challenges",
+                   "",
+                   "🌟 Balance Tasks:",
+                   "7. Create a weekly schedule",
+                   "8. Track your progress",
+                   "9. Set new goals regularly",
+                   "10. Try cross-training activities",
+                   "11. Maintain variety in activities",
+                   "12. Review and adjust your routine"
+               ])
+
+
+def all_score_dicts():
+    ranges = [range(classification.MAX_SCORE + 1)] * len(scoring.SCORE_KEYS)
+    for values in itertools.product(*ranges):
+        yield dict(zip(scoring.SCORE_KEYS, values))
+
+
+def check_equivalence():
+    checked = 0
+    for scores in all_score_dicts():
+        category, description, tasks = legacy_analyze_results(scores)
+        result = classification.classify(scores)
+        if (result.category, result.description, list(result.tasks)) != (category, description, tasks):
+            raise AssertionError(f"classification differs from the original chain for {scores}")
+        checked += 1
+    return checked
+
+
+def time_per_call(func, inputs, repeat=20):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for value in inputs:
+            func(value)
+    return (time.perf_counter() - start) / (repeat * len(inputs))
+
+
+def run(rows=1_000_000, seed=0):
+    results = {"score_tuples_checked": check_equivalence()}
+
+    inputs = list(all_score_dicts())
+    results["legacy_ns_per_call"] = time_per_call(legacy_analyze_results, inputs) * 1e9
+    results["table_ns_per_call"] = time_per_call(classification.classify, inputs) * 1e9
+
+    try:
+        import numpy as np
+    except ImportError:
+        return results
+    score_rows = np.random.default_rng(seed).integers(
+        0, classification.MAX_SCORE + 1, (rows, len(scoring.SCORE_KEYS)))
+    start = time.perf_counter()
+    classification.classify_batch(score_rows)
+    elapsed = time.perf_counter() - start
+    results["batch_rows"] = rows
+    results["batch_ns_per_row"] = elapsed / rows * 1e9
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="rows for the batch timing")
+    args = parser.parse_args()
+
+    results = run(args.rows)
+    print(f"equivalent to the original chain for all {results['score_tuples_checked']} score tuples")
+    print(f"if/elif chain: {results['legacy_ns_per_call']:8.0f} ns/call")
+    print(f"lookup table:  {results['table_ns_per_call']:8.0f} ns/call")
+    if "batch_ns_per_row" in results:
+        print(f"batch lookup:  {results['batch_ns_per_row']:8.1f} ns/row over {results['batch_rows']:,} rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Cohort analytics over a synthetic StudentStore.
+
+Writes --submissions random questionnaire submissions to a temporary
+store, then times:
+
+  build        CohortAnalytics.from_store (one pass over the store)
+  queries      option counts by class, a cross-tab and the top
+               needs_help_with subjects
+  add          folding in one new submission
+  refresh      folding in --batch submissions appended to the store
+
+The aggregates are checked against a plain loop over iter_rows().
+
+    python benchmarks/bench_cohort.py --submissions 100000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cohort_analytics import CohortAnalytics, class_label, help_subjects
+from student_store import MULTISELECT_FIELDS, StudentStore, TEXT_FIELDS
+
+CLASSES = [f"Grade {n}" for n in range(6, 13)] + ["BSc 1", "BSc 2", "BSc 3"]
+SUBJECTS = ["Maths", "Physics", "Chemistry", "Biology", "English", "History",
+            "Geography", "Computer Science", "Economics", "Accounts"]
+
+
+def synthetic_submission(rng, i):
+    data = {key: "" for key in TEXT_FIELDS}
+    data["name"] = f"student{i}"
+    data["class"] = rng.choice(CLASSES)
+    data["needs_help_with"] = ", ".join(rng.sample(SUBJECTS, rng.randint(0, 3)))
+    for key, options in MULTISELECT_FIELDS.items():
+        data[key] = [option for option in options if rng.random() < 0.3]
+    return data
+
+
+def timed(func, repeat=5):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def check(analytics, store):
+    option_counts = {key: Counter() for key in MULTISELECT_FIELDS}
+    crosstab = Counter()
+    help_counts = Counter()
+    for data in store.iter_rows():
+        for key in MULTISELECT_FIELDS:
+            option_counts[key].update((class_label(data["class"]), o) for o in data[key])
+        for a in data["study_time_preference"]:
+            for b in data["study_hours_per_day"]:
+                crosstab[a, b] += 1
+        help_counts.update(help_subjects(data["needs_help_with"]))
+
+    for key in MULTISELECT_FIELDS:
+        for label, counts in analytics.option_counts(key).items():
+            for option, n in counts.items():
+                assert option_counts[key][label, option] == n, (key, label, option)
+    table = analytics.crosstab("study_time_preference", "study_hours_per_day")
+    for i, a in enumerate(MULTISELECT_FIELDS["study_time_preference"]):
+        for j, b in enumerate(MULTISELECT_FIELDS["study_hours_per_day"]):
+            assert table[i, j] == crosstab[a, b], (a, b)
+    assert analytics.help_counts == help_counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submissions", type=int, default=100000)
+    parser.add_argument("--batch", type=int, default=1000, help="submissions per refresh")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = StudentStore(os.path.join(tmp, "student_data"))
+        start = time.perf_counter()
+        store.extend(synthetic_submission(rng, i) for i in range(args.submissions))
+        print(f"wrote {len(store)} submissions in {time.perf_counter() - start:.2f} s")
+
+        build = timed(lambda: CohortAnalytics.from_store(store), repeat=3)
+        analytics = CohortAnalytics.from_store(store)
+        print(f"build              {build * 1000:10.1f} ms")
+
+        queries = {
+            "option counts":  lambda: analytics.option_counts("learning_preference"),
+            "option totals":  lambda: analytics.option_counts("study_resources", by_class=False),
+            "cross-tab":      lambda: analytics.crosstab("study_time_preference", "study_hours_per_day"),
+            "top help":       lambda: analytics.top_help_subjects(10),
+        }
+        for label, query in queries.items():
+            print(f"{label:18s} {timed(query, repeat=100) * 1000:10.3f} ms")
+
+        check(analytics, store)
+
+        extra = [synthetic_submission(rng, args.submissions + i) for i in range(args.batch)]
+        add = timed(lambda: analytics.add(extra[0]), repeat=100)
+        print(f"add (one)          {add * 1000:10.3f} ms")
+
+        analytics = CohortAnalytics.from_store(store)
+        store.extend(extra)
+        start = time.perf_counter()
+        analytics.refresh(store)
+        print(f"refresh ({args.batch})     {(time.perf_counter() - start) * 1000:10.1f} ms")
+        check(analytics, store)
+        print("aggregates match a row-by-row count")
+        print("most needed help:", ", ".join(f"{s} ({n})" for s, n in analytics.top_help_subjects(5)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Hundreds of concurrent chatbot conversations in one process.
+
+Starts a ConversationServer (conversation.py) and --clients scripted
+clients, each answering the name prompt and ten random yes/no answers
+(with an occasional invalid answer to exercise the retry) over its own
+TCP or Unix socket connection. With --pace 0 there are no pauses, so the
+run measures the engine itself; with a pace > 0 the wall time should stay
+close to one conversation's worth of pauses however many clients run.
+
+    python benchmarks/bench_conversations.py --clients 500 --pace 0
+    python benchmarks/bench_conversations.py --clients 500 --pace 0.01 --unix
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from conversation import ANSWER_PROMPT, NAME_PROMPT, ConversationServer
+
+
+async def client(connect, index, rng):
+    reader, writer = await connect()
+    prompts = 0
+    buffer = b""
+    name_prompt, answer_prompt = NAME_PROMPT.encode('utf-8'), ANSWER_PROMPT.encode('utf-8')
+    while True:
+        chunk = await reader.read(4096)
+        if not chunk:
+            break
+        buffer += chunk
+        if buffer.endswith(name_prompt):
+            writer.write(f"user{index}\n".encode('utf-8'))
+            buffer = b""
+        elif buffer.endswith(answer_prompt):
+            prompts += 1
+            answer = "maybe" if rng.random() < 0.05 else rng.choice(("yes", "no"))
+            writer.write(f"{answer}\n".encode('utf-8'))
+            buffer = b""
+    writer.close()
+    return "That's a wrap" in buffer.decode('utf-8', errors='replace'), prompts
+
+
+async def run(args):
+    server = ConversationServer(args.pace)
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.unix:
+            path = os.path.join(tmp, "chat.sock")
+            await server.start(unix_path=path)
+            connect = lambda: asyncio.open_unix_connection(path)
+        else:
+            await server.start(port=0)
+            port = server.server.sockets[0].getsockname()[1]
+            connect = lambda: asyncio.open_connection("127.0.0.1", port)
+
+        rng = random.Random(args.seed)
+        start = time.perf_counter()
+        results = await asyncio.gather(*(client(connect, i, random.Random(rng.random()))
+                                         for i in range(args.clients)))
+        elapsed = time.perf_counter() - start
+        await server.close()
+
+    finished = sum(done for done, _ in results)
+    prompts = sum(p for _, p in results)
+    print(f"{args.clients} concurrent conversations over {'unix' if args.unix else 'tcp'} sockets, "
+          f"pace {args.pace}")
+    print(f"  {finished} finished, {prompts} answers ({prompts - 10 * finished} retries) "
+          f"in {elapsed:.2f} s: {finished / elapsed:.0f} conversations/s, "
+          f"{prompts / elapsed:.0f} answers/s")
+    if finished != args.clients:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--pace", type=float, default=0.0)
+    parser.add_argument("--unix", action="store_true", help="use a Unix socket instead of TCP")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
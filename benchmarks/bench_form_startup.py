@@ -0,0 +1,94 @@
+"""Time-to-interactive for the Student Academic Questionnaire form.
+
+Compares the paged form, which builds only the first section's widgets,
+with an eager build of every section up front (the old behaviour). Each
+sample runs in a fresh interpreter and measures from just before the
+StudentForm is created until its window is mapped and the Tk event queue
+has drained.
+
+The form module's file name contains spaces, so it is loaded with
+importlib rather than a plain import. Needs a display; without one the
+measurements are skipped.
+
+    python benchmarks/bench_form_startup.py --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FORM_PATH = os.path.join(REPO_ROOT, "import tkinter as tk.py")
+
+SAMPLE_SCRIPT = """
+import importlib.util
+import time
+spec = importlib.util.spec_from_file_location("student_form", {path!r})
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+
+start = time.perf_counter()
+app = module.StudentForm(eager={eager})
+while not app.winfo_ismapped():
+    app.update()
+app.update()
+interactive = time.perf_counter() - start
+
+# Time to open every remaining section once, which is where the lazy
+# form pays for the widgets it skipped at startup
+start = time.perf_counter()
+for index in range(1, len(module.SECTIONS)):
+    app.show_section(index)
+    app.update()
+print(interactive, time.perf_counter() - start)
+app.destroy()
+"""
+
+
+def run_sample(eager):
+    script = SAMPLE_SCRIPT.format(path=FORM_PATH, eager=eager)
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    with tempfile.TemporaryDirectory() as cwd:
+        result = subprocess.run([sys.executable, "-c", script], cwd=cwd, env=env,
+                                capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return tuple(float(value) for value in result.stdout.split())
+
+
+def run(runs=5):
+    results = {}
+    for mode, eager in (("lazy", False), ("eager", True)):
+        samples = []
+        for _ in range(runs):
+            sample = run_sample(eager)
+            if sample is None:
+                return None
+            samples.append(sample)
+        results[mode] = {
+            "interactive": statistics.median(s[0] for s in samples),
+            "all_sections": statistics.median(s[1] for s in samples),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="samples per mode")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    if results is None:
+        print("skipped (needs a display)")
+        return
+    lazy, eager = results["lazy"], results["eager"]
+    print(f"time to interactive  lazy {lazy['interactive'] * 1000:8.1f} ms   "
+          f"eager {eager['interactive'] * 1000:8.1f} ms")
+    print(f"open other sections  lazy {lazy['all_sections'] * 1000:8.1f} ms   "
+          f"eager {eager['all_sections'] * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""UI event latency with logging disabled, synchronous and queued.
+
+Each simulated UI event runs on the calling (Tk) thread and emits the
+log lines a typical results-screen event produces. Compared setups:
+
+  disabled   logging turned off
+  sync       the old setup: FileHandler + StreamHandler on the calling thread
+  queued     log_setup.configure_logging(): QueueHandler + background listener
+
+With a display, events are dispatched through a real Tk event loop
+(root.after) and latency is measured from scheduling to completion;
+without one the handler is timed directly.
+
+    python benchmarks/bench_logging.py --events 5000
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import log_setup
+
+LINES_PER_EVENT = 5
+
+
+def ui_event(i):
+    for line in range(LINES_PER_EVENT):
+        logging.info(f"Handling event {i}, step {line}")
+
+
+def configure(mode, log_dir, console):
+    root = logging.getLogger()
+    log_setup.stop_logging()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    logging.disable(logging.NOTSET)
+    log_file = os.path.join(log_dir, f"{mode}.log")
+
+    if mode == "disabled":
+        logging.disable(logging.CRITICAL)
+    elif mode == "sync":
+        formatter = logging.Formatter(log_setup.LOG_FORMAT)
+        for handler in (logging.FileHandler(log_file), logging.StreamHandler(console)):
+            handler.setFormatter(formatter)
+            root.addHandler(handler)
+        root.setLevel(logging.DEBUG)
+    else:
+        log_setup.configure_logging("DEBUG", log_file, stream=console)
+
+
+def measure_direct(events):
+    latencies = []
+    for i in range(events):
+        start = time.perf_counter()
+        ui_event(i)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def measure_tk(events):
+    import tkinter as tk
+
+    root = tk.Tk()
+    root.withdraw()
+    latencies = []
+
+    def fire(i):
+        if i == events:
+            root.quit()
+            return
+        scheduled = time.perf_counter()
+        root.after(0, handle, i, scheduled)
+
+    def handle(i, scheduled):
+        ui_event(i)
+        latencies.append(time.perf_counter() - scheduled)
+        fire(i + 1)
+
+    root.after(0, fire, 0)
+    root.mainloop()
+    root.destroy()
+    return latencies
+
+
+def run(events=5000, use_tk=None):
+    if use_tk is None:
+        try:
+            import tkinter as tk
+            tk.Tk().destroy()
+            use_tk = True
+        except Exception:
+            use_tk = False
+    measure = measure_tk if use_tk else measure_direct
+
+    results = {"events": events, "tk_event_loop": use_tk}
+    with tempfile.TemporaryDirectory() as log_dir, open(os.devnull, 'w') as console:
+        for mode in ("disabled", "sync", "queued"):
+            configure(mode, log_dir, console)
+            latencies = sorted(measure(events))
+            results[mode] = {
+                "p50_us": statistics.median(latencies) * 1e6,
+                "p99_us": latencies[int(len(latencies) * 0.99) - 1] * 1e6,
+                "mean_us": statistics.fmean(latencies) * 1e6,
+            }
+        configure("disabled", log_dir, console)
+        logging.disable(logging.NOTSET)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=5000)
+    args = parser.parse_args()
+
+    results = run(args.events)
+    source = "Tk event loop" if results["tk_event_loop"] else "direct calls (no display)"
+    print(f"{args.events} events, {LINES_PER_EVENT} log lines each, via {source}")
+    for mode in ("disabled", "sync", "queued"):
+        r = results[mode]
+        print(f"{mode:9s} p50 {r['p50_us']:8.1f} us   p99 {r['p99_us']:8.1f} us   mean {r['mean_us']:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Question bank load time: parsing question_bank.json vs the pickle cache.
+
+  parse      read, hash, json.loads, compile_bank and freeze (a launch
+             after the file changed)
+  cached     read, hash and unpickle (every other launch)
+
+The in-process memo is cleared between runs, so each one is a full load.
+
+    python benchmarks/bench_question_bank.py --repeat 200
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import question_bank
+
+
+def parse(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    hashlib.sha256(data).hexdigest()
+    return question_bank.freeze(question_bank.compile_bank(json.loads(data.decode('utf-8'))))
+
+
+def cached(path):
+    question_bank._loaded.clear()
+    return question_bank.load(path)
+
+
+def best(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--path", default=question_bank.BANK_PATH)
+    args = parser.parse_args()
+
+    question_bank.load(args.path)  # make sure the cache exists
+    assert parse(args.path) == cached(args.path)
+    parsed = best(lambda: parse(args.path), args.repeat)
+    from_cache = best(lambda: cached(args.path), args.repeat)
+    print(f"parse   {parsed * 1e6:9.1f} us")
+    print(f"cached  {from_cache * 1e6:9.1f} us   ({parsed / from_cache:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Batch scoring benchmark: NumPy matrix path vs the pure-Python fallback.
+
+Scores synthetic yes/no response sets with scoring.score_batch() and checks
+that both paths agree on a shared sample.
+
+    python benchmarks/bench_scoring.py --respondents 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import scoring
+
+
+def synthetic_answers(count, seed=0):
+    rng = random.Random(seed)
+    width = len(scoring.QUESTIONS)
+    return [[rng.getrandbits(1) for _ in range(width)] for _ in range(count)]
+
+
+def run(respondents=1_000_000, fallback_respondents=100_000, seed=0):
+    results = {"respondents": respondents}
+
+    sample = synthetic_answers(min(fallback_respondents, respondents), seed)
+    start = time.perf_counter()
+    expected = scoring.score_batch(sample, use_numpy=False)
+    results["python_seconds"] = time.perf_counter() - start
+    results["python_rows_per_second"] = len(sample) / results["python_seconds"]
+
+    try:
+        import numpy as np
+    except ImportError:
+        results["numpy_seconds"] = None
+        return results
+
+    answers = np.random.default_rng(seed).integers(0, 2, (respondents, len(scoring.QUESTIONS)),
+                                                  dtype=np.uint8)
+    start = time.perf_counter()
+    scores = scoring.score_batch(answers)
+    results["numpy_seconds"] = time.perf_counter() - start
+    results["numpy_rows_per_second"] = respondents / results["numpy_seconds"]
+
+    if scoring.score_batch(np.asarray(sample, dtype=np.uint8)).tolist() != expected:
+        raise AssertionError("NumPy and pure-Python scoring disagree")
+    if scores.sum() != answers.sum():
+        raise AssertionError("NumPy scores do not add up to the number of yes answers")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--respondents", type=int, default=1_000_000)
+    parser.add_argument("--fallback-respondents", type=int, default=100_000,
+                        help="rows scored (and cross-checked) with the pure-Python path")
+    args = parser.parse_args()
+
+    results = run(args.respondents, args.fallback_respondents)
+    print(f"pure Python: {results['python_rows_per_second']:,.0f} rows/s")
+    if results["numpy_seconds"] is None:
+        print("NumPy not installed; skipped matrix path")
+    else:
+        print(f"NumPy:       {results['respondents']:,} rows in {results['numpy_seconds']:.3f} s "
+              f"({results['numpy_rows_per_second']:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""SessionManager throughput with and without eviction to disk.
+
+Creates --sessions sessions, then answers --answers questions on randomly
+chosen sessions. The "in memory" run has a budget large enough for every
+session; the "evicting" run gets --budget-kb, so most lookups find the
+session already snapshotted to disk and load it back.
+
+    python benchmarks/bench_session_manager.py --sessions 100000 --answers 100000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from session_manager import SessionManager
+
+
+def run(manager, sessions, answers, rng):
+    start = time.perf_counter()
+    ids = [manager.create(f"user{i}").session_id for i in range(sessions)]
+    created = time.perf_counter() - start
+
+    targets = [rng.choice(ids) for _ in range(answers)]
+    start = time.perf_counter()
+    for session_id in targets:
+        session = manager.get(session_id)
+        if not session.finished:
+            session.answer(rng.getrandbits(1))
+    answered = time.perf_counter() - start
+    return created / sessions, answered / answers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100000)
+    parser.add_argument("--answers", type=int, default=100000)
+    parser.add_argument("--budget-kb", type=int, default=1024, help="memory budget of the evicting run")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    manager = SessionManager(ttl=None, memory_budget=1 << 40)
+    create, answer = run(manager, args.sessions, args.answers, random.Random(args.seed))
+    traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"in memory  create {create * 1e6:7.2f} us   get+answer {answer * 1e6:7.2f} us   "
+          f"estimated {manager.memory / len(manager):.0f} B/session, traced {traced / len(manager):.0f} B/session")
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        manager = SessionManager(snapshot_dir, memory_budget=args.budget_kb * 1024, ttl=None)
+        create, answer = run(manager, args.sessions, args.answers, random.Random(args.seed))
+        print(f"evicting   create {create * 1e6:7.2f} us   get+answer {answer * 1e6:7.2f} us   "
+              f"{len(manager)} in memory, {manager.evictions} evictions, "
+              f"{len(os.listdir(snapshot_dir))} snapshots on disk")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Memory and file size of sessions: responses lists vs SessionRecord.
+
+For --sessions random 15-answer sessions, compares
+
+  memory     bytes held by the in-memory session (tracemalloc), either the
+             old list of {"question", "answer"} dicts or a SessionRecord
+  file       bytes of the results record as save_results() writes it
+             (indent=4) and as one compact journal line
+
+A million old-style sessions need several GB of memory, so the old layout
+is measured on --sample sessions and scaled up; the SessionRecord side is
+measured over all of them. Every compact record is also expanded again
+and checked against the old layout.
+
+    python benchmarks/bench_sessions.py --sessions 1000000
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import classification
+import scoring
+from session_record import SessionRecord, compact_record, expand_record
+
+DATE = "2024-01-01 12:00:00"
+
+
+def legacy_responses(answers):
+    return [{"question": q["text"], "answer": "Yes" if a else "No"}
+            for q, a in zip(scoring.QUESTIONS, answers)]
+
+
+def legacy_record(name, answers):
+    scores = scoring.score_answers(answers)
+    category, description, _ = classification.classify(scores)
+    return {
+        "name": name,
+        "date": DATE,
+        "category": f"Category: {category}",
+        "description": description,
+        "scores": scores,
+        "responses": legacy_responses(answers),
+    }
+
+
+def traced(build):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    value = build()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return value, used
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=1000000)
+    parser.add_argument("--sample", type=int, default=20000,
+                        help="sessions used to measure the old layout")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    count = len(scoring.QUESTIONS)
+    masks = [rng.getrandbits(count) for _ in range(args.sessions)]
+    sample = masks[:args.sample]
+    scale = args.sessions / len(sample)
+
+    def answers_of(mask):
+        return [mask >> i & 1 for i in range(count)]
+
+    _, legacy_memory = traced(lambda: [legacy_responses(answers_of(m)) for m in sample])
+    _, compact_memory = traced(lambda: [SessionRecord(m, count) for m in masks])
+    legacy_memory *= scale
+
+    legacy_file = legacy_line = compact_file = compact_line = 0
+    for i, mask in enumerate(sample):
+        old = legacy_record(f"user{i}", answers_of(mask))
+        new = compact_record(f"user{i}", DATE, SessionRecord(mask, count))
+        assert expand_record(new) == old
+        legacy_file += len(json.dumps(old, indent=4).encode())
+        legacy_line += len(json.dumps(old, separators=(",", ":")).encode()) + 1
+    for i, mask in enumerate(masks):
+        new = compact_record(f"user{i}", DATE, SessionRecord(mask, count))
+        compact_file += len(json.dumps(new, indent=4).encode())
+        compact_line += len(json.dumps(new, separators=(",", ":")).encode()) + 1
+    legacy_file *= scale
+    legacy_line *= scale
+
+    mb = 1024 * 1024
+    print(f"{args.sessions} sessions (old layout measured on {len(sample)} and scaled)")
+    print(f"{'':16s} {'responses':>12s} {'SessionRecord':>14s} {'ratio':>8s}")
+    for label, old, new in (("memory", legacy_memory, compact_memory),
+                            ("results files", legacy_file, compact_file),
+                            ("journal lines", legacy_line, compact_line)):
+        print(f"{label:16s} {old / mb:9.1f} MB {new / mb:11.1f} MB {old / new:7.1f}x")
+    print(f"per session: {legacy_memory / args.sessions:.0f} B -> {compact_memory / args.sessions:.0f} B in memory")
+    print("compact records expand to the old layout exactly")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Startup benchmark for AltF4.py: lazy vs eager matplotlib import.
+
+Each sample runs in a fresh interpreter (matplotlib caches imports, so
+in-process timings would be meaningless). Two numbers are reported per mode:
+
+  import          time to import AltF4 (eager mode also imports pyplot,
+                  the TkAgg backend and applies the style first, which is
+                  what the module used to do at top level)
+  first frame     time from interpreter start of the sample script until
+                  the welcome screen is mapped on screen
+
+The first-frame numbers need a display; they are skipped without one.
+
+    python benchmarks/bench_startup.py --runs 5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EAGER_IMPORTS = """
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+plt.style.use('dark_background')
+"""
+
+IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+{eager}
+import AltF4
+print(time.perf_counter() - start)
+"""
+
+FIRST_FRAME_SCRIPT = """
+import time
+start = time.perf_counter()
+{eager}
+import tkinter as tk
+import AltF4
+root = tk.Tk()
+app = AltF4.PersonalityAnalyzer(root, preload_charts=False)
+while not app.welcome_frame.winfo_ismapped():
+    root.update()
+print(time.perf_counter() - start)
+root.destroy()
+"""
+
+
+def run_sample(template, eager):
+    script = template.format(eager=EAGER_IMPORTS if eager else "")
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    # Run from a scratch directory so the app's log file does not land in the repo
+    with tempfile.TemporaryDirectory() as cwd:
+        result = subprocess.run([sys.executable, "-c", script], cwd=cwd, env=env,
+                                capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def measure(template, eager, runs):
+    samples = []
+    for _ in range(runs):
+        sample = run_sample(template, eager)
+        if sample is None:
+            return None
+        samples.append(sample)
+    return statistics.median(samples)
+
+
+def run(runs=5):
+    results = {}
+    for label, template in (("import", IMPORT_SCRIPT), ("first_frame", FIRST_FRAME_SCRIPT)):
+        for mode, eager in (("lazy", False), ("eager", True)):
+            results[f"{label}_{mode}"] = measure(template, eager, runs)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="samples per measurement")
+    args = parser.parse_args()
+
+    results = run(args.runs)
+    for label in ("import", "first_frame"):
+        lazy, eager = results[f"{label}_lazy"], results[f"{label}_eager"]
+        if lazy is None or eager is None:
+            print(f"{label:12s} skipped (needs a display)" if label == "first_frame"
+                  else f"{label:12s} failed")
+            continue
+        print(f"{label:12s} lazy {lazy * 1000:8.1f} ms   eager {eager * 1000:8.1f} ms   "
+              f"saved {(eager - lazy) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
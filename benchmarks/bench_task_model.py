@@ -0,0 +1,84 @@
+"""Task toggles and progress restores with TaskModel vs recounting the list.
+
+The baseline is what the results screen did before task_model.py: a toggle
+stored the new state and recounted every task for the progress label, and
+restoring saved progress rebuilt the state list for every task before
+recounting. TaskModel keeps a running count and a text index, so a toggle
+is O(1) and a restore costs O(saved tasks) once the list is shown. Both
+restore timings include showing the task list (set_tasks).
+
+    python benchmarks/bench_task_model.py --tasks 1000 10000 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from task_model import TaskModel
+
+
+def per_call(function, calls):
+    start = time.perf_counter()
+    function()
+    return (time.perf_counter() - start) / calls
+
+
+def bench(tasks, toggles, saved, rng):
+    texts = [f"{i + 1}. Synthetic task number {i + 1}" for i in range(tasks)]
+    positions = [rng.randrange(tasks) for _ in range(toggles)]
+    progress = {text: True for text in rng.sample(texts, min(saved, tasks))}
+    labels = []
+
+    states = [False] * tasks
+
+    def recount_toggles():
+        for position in positions:
+            states[position] = not states[position]
+            labels.append(sum(states))
+
+    def recount_restore():
+        shown = list(texts)
+        states[:] = [False] * len(shown)
+        states[:] = [progress.get(text, False) for text in shown]
+        labels.append(sum(states))
+
+    model = TaskModel()
+    model.set_tasks(texts)
+    model.add_listener(lambda changed: labels.append(model.completed))
+
+    def model_toggles():
+        for position in positions:
+            model.toggle(position)
+
+    def model_restore():
+        model.set_tasks(texts)
+        model.update_by_text(progress)
+
+    results = (per_call(recount_toggles, toggles), per_call(model_toggles, toggles),
+               per_call(recount_restore, 1), per_call(model_restore, 1))
+    if states != model.states:
+        sys.exit("TaskModel and the recounted list disagree")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--toggles", type=int, default=2000)
+    parser.add_argument("--saved", type=int, default=20, help="completed tasks in the restored progress")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'tasks':>8s} {'toggle: recount':>16s} {'TaskModel':>10s} {'show+restore: rebuild':>22s} {'TaskModel':>10s}")
+    for tasks in args.tasks:
+        toggle_old, toggle_new, restore_old, restore_new = bench(tasks, args.toggles, args.saved, rng)
+        print(f"{tasks:8d} {toggle_old * 1e6:13.2f} us {toggle_new * 1e6:7.2f} us "
+              f"{restore_old * 1e3:19.3f} ms {restore_new * 1e3:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
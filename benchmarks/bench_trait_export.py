@@ -0,0 +1,71 @@
+"""Headless trait graph export: a new pyplot figure per chart vs export_trait_chart().
+
+The baseline draws each chart the way show_trait_chart() does, on a fresh
+pyplot figure (Agg backend), saves it and closes it.
+export_trait_chart() renders through the chart cache, which updates one
+reused Figure in place (the charts all have different names, so none is
+served from the cache).
+
+    python benchmarks/bench_trait_export.py --charts 50 --format png
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+import personality_assessment
+from chart_cache import ChartCache
+
+
+def pyplot_export(name, scores, format):
+    plt.figure(figsize=(10, 6))
+    plt.bar(scores.keys(), scores.values(), color='skyblue')
+    plt.xticks(rotation=45)
+    plt.ylabel("Trait Score")
+    plt.title(f"{name}'s Personality Trait Graph")
+    plt.tight_layout()
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format=format)
+    plt.close()
+    return buffer.getvalue()
+
+
+def timed(export, charts, format):
+    export("warmup", charts[0], format)
+    start = time.perf_counter()
+    for i, scores in enumerate(charts):
+        export(f"user{i}", scores, format)
+    return (time.perf_counter() - start) / len(charts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--charts", type=int, default=50)
+    parser.add_argument("--format", choices=personality_assessment.CHART_FORMATS, default="png")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Keep the benchmark out of the user's chart cache; every chart here is a miss
+    personality_assessment._chart_cache = ChartCache(None)
+    rng = random.Random(args.seed)
+    charts = [{trait: rng.getrandbits(1) for trait in personality_assessment.empty_scores()}
+              for _ in range(args.charts)]
+    baseline = timed(pyplot_export, charts, args.format)
+    reused = timed(lambda name, scores, format: personality_assessment.export_trait_chart(
+        name, scores, format=format), charts, args.format)
+    print(f"{args.charts} {args.format} charts")
+    print(f"  new pyplot figure per chart {baseline * 1e3:7.2f} ms")
+    print(f"  export_trait_chart          {reused * 1e3:7.2f} ms  ({baseline / reused:.2f}x)")
+    print(f"  pyplot figures left open: {len(plt.get_fignums())}")
+
+
+if __name__ == "__main__":
+    main()
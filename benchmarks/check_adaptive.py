@@ -0,0 +1,67 @@
+"""Questions saved by adaptive.py over every possible answer vector.
+
+Runs all 2^15 yes/no answer vectors through a Session in each question
+mode. For every vector and mode it checks that analyze_results() (the
+category, description and tasks) equals the full-length run, then
+reports how many questions were asked on average.
+
+Exits with status 1 if any classification differs.
+
+    python benchmarks/check_adaptive.py
+"""
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import adaptive
+import classification
+import scoring
+from session_manager import Session
+
+
+def run_session(answers, mode):
+    session = Session("check", mode=mode)
+    while True:
+        question = session.question()
+        if question is None:
+            break
+        index = scoring.QUESTIONS.index(question)
+        session.answer(answers >> index & 1)
+    return session
+
+
+def main():
+    total = len(scoring.QUESTIONS)
+    vectors = 1 << total
+    asked = {mode: Counter() for mode in adaptive.QUESTION_MODES}
+    mismatches = 0
+
+    for answers in range(vectors):
+        expected = classification.classify(
+            scoring.score_answers([answers >> i & 1 for i in range(total)]))
+        for mode in adaptive.QUESTION_MODES:
+            session = run_session(answers, mode)
+            if session.result() != expected:
+                mismatches += 1
+                print(f"MISMATCH mode={mode} answers={answers:#06x}: "
+                      f"{session.result().category} != {expected.category}")
+            asked[mode][session.current_question] += 1
+
+    start = ((0,) * len(scoring.CATEGORIES),
+             tuple(scoring.question_categories().count(c) for c in range(len(scoring.CATEGORIES))))
+    print(f"{vectors} answer vectors, {total} questions")
+    print(f"{'mode':8s} {'avg asked':>10s} {'avg saved':>10s} {'min':>4s} {'max':>4s}")
+    for mode, counts in asked.items():
+        average = sum(n * c for n, c in counts.items()) / vectors
+        print(f"{mode:8s} {average:10.3f} {total - average:10.3f} {min(counts):4d} {max(counts):4d}")
+    print(f"expected questions for 'reorder' computed by adaptive.py: {adaptive.expected_questions(*start):.3f}")
+    if mismatches:
+        print(f"{mismatches} classification mismatches")
+        sys.exit(1)
+    print("classification identical to the full-length run for every vector and mode")
+
+
+if __name__ == "__main__":
+    main()
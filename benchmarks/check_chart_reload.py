@@ -0,0 +1,181 @@
+"""Check that reloading results does not grow memory or the figure count.
+
+Drives PersonalityAnalyzer.create_chart() (what show_results() and
+show_loaded_results() call on every session) through many reloads, with
+stand-ins for the Tk image and label, and fails if pyplot's figure
+registry, the number of live Figure objects or the process's resident
+memory keeps growing after the warm-up.
+
+The chart cache gets a small memory budget so nearly every reload is a
+miss that redraws on the cached figure, rather than a PNG lookup. Memory
+is sampled every --sample-every reloads instead of being traced, so the
+check runs at about the speed of the reloads themselves. Resident memory
+is read from /proc (Linux); elsewhere the peak RSS is used, and without
+either only the figure count is checked.
+
+    python benchmarks/check_chart_reload.py --reloads 1000
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+
+import AltF4
+import scoring
+from chart_cache import ChartCache
+from theme import COLORS
+
+WARMUP = 50
+# Small enough that the cache holds a few dozen PNGs, so reloads render
+CACHE_MEMORY_BUDGET = 1024 * 1024
+# Allowed RSS growth after warm-up; the allocator and matplotlib's text and
+# font caches settle within a few MB, a leaked figure per reload does not
+MAX_GROWTH_BYTES = 8 * 1024 * 1024
+
+
+class _Image:
+    # Stands in for tk.PhotoImage; keeps the PNG alive like the real one
+    def __init__(self, data=None, **options):
+        self.data = data
+
+
+class _Label:
+    # Stands in for the tk.Label create_chart() shows the image in
+    def __init__(self, master=None, **options):
+        self.options = options
+
+    def pack(self, **options):
+        pass
+
+    def config(self, **options):
+        self.options.update(options)
+
+    def destroy(self):
+        pass
+
+
+class _Name:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+def headless_analyzer():
+    """A PersonalityAnalyzer with just the state create_chart() uses."""
+    app = object.__new__(AltF4.PersonalityAnalyzer)
+    app.chart_cache = ChartCache(None, memory_budget=CACHE_MEMORY_BUDGET)
+    app.chart = None
+    app.chart_image = None
+    app.chart_frame = None
+    app.name = _Name()
+    app.scores = scoring.empty_scores()
+    return app
+
+
+def resident_memory():
+    """Current RSS in bytes (peak RSS where /proc is unavailable), or None."""
+    try:
+        with open("/proc/self/statm", 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def live_figures():
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, Figure))
+
+
+def sample():
+    gc.collect()
+    return {"memory": resident_memory(),
+            "figures": (len(plt.get_fignums()), live_figures())}
+
+
+def reload(app, rng):
+    app.scores = {key: rng.randint(0, 5) for key in scoring.SCORE_KEYS}
+    app.name.set(f"user{rng.randint(0, 20)}")
+    app.create_chart()
+
+
+def run(reloads=1000, sample_every=100, seed=0):
+    rng = random.Random(seed)
+    app = headless_analyzer()
+    samples = []
+
+    with mock.patch.object(AltF4.tk, "PhotoImage", _Image), \
+            mock.patch.object(AltF4.tk, "Label", _Label):
+        for _ in range(WARMUP):
+            reload(app, rng)
+        samples.append(sample())
+
+        elapsed = 0.0
+        for done in range(1, reloads + 1):
+            start = time.perf_counter()
+            reload(app, rng)
+            elapsed += time.perf_counter() - start
+            if done % sample_every == 0 or done == reloads:
+                samples.append(sample())
+        renders = app.chart_cache.renders
+        app.close_chart()
+
+    memory = [s["memory"] for s in samples]
+    return {
+        "reloads": reloads,
+        "renders": renders,
+        "ms_per_reload": elapsed / reloads * 1000,
+        "memory_samples": memory,
+        "memory_growth_bytes": None if None in memory else memory[-1] - memory[0],
+        "figures_before": samples[0]["figures"],
+        "figures_after": samples[-1]["figures"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reloads", type=int, default=1000)
+    parser.add_argument("--sample-every", type=int, default=100,
+                        help="reloads between memory and figure samples")
+    args = parser.parse_args()
+
+    result = run(args.reloads, args.sample_every)
+    print(f"{result['reloads']} reloads ({result['renders']} rendered), "
+          f"{result['ms_per_reload']:.2f} ms each")
+    print(f"pyplot/live figures: {result['figures_before']} -> {result['figures_after']}")
+
+    if result['figures_after'] != result['figures_before']:
+        sys.exit("FAIL: figure count grew")
+    if result['memory_growth_bytes'] is None:
+        print("resident memory not available on this platform; not checked")
+    else:
+        print("resident memory (MB): " +
+              " ".join(f"{value / (1024 * 1024):.1f}" for value in result['memory_samples']))
+        print(f"growth after warm-up: {result['memory_growth_bytes']} bytes")
+        if result['memory_growth_bytes'] > MAX_GROWTH_BYTES:
+            sys.exit("FAIL: memory grew")
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Load generator for scoring_server.py.
+
+Opens --connections keep-alive connections at once and sends --requests
+POST /score requests over each, one after another, with random answers
+(or --batch answer sets per request). Reports latency percentiles and
+throughput over every request.
+
+By default it starts its own server in a subprocess on a free port;
+--url points it at one that is already running instead. 1k connections
+need an open-file limit above 1024 on both sides (ulimit -n).
+
+    python benchmarks/load_generator.py --connections 1000 --requests 20
+    python benchmarks/load_generator.py --url http://127.0.0.1:8765 --batch 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+QUESTIONS = 15
+
+
+def request_bytes(host, body):
+    return (f"POST /score HTTP/1.1\r\nHost: {host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n").encode() + body
+
+
+def payloads(rng, count, batch):
+    bodies = []
+    for _ in range(count):
+        items = [{"answers": [rng.getrandbits(1) for _ in range(QUESTIONS)]} for _ in range(batch)]
+        bodies.append(json.dumps(items[0] if batch == 1 else {"batch": items}).encode())
+    return bodies
+
+
+async def read_response(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head.split(b" ", 2)[1])
+    length = 0
+    for line in head.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            length = int(value)
+    body = await reader.readexactly(length)
+    return status, body
+
+
+async def client(host, port, bodies, latencies, errors, start_gate):
+    await start_gate.wait()
+    try:
+        reader, writer = await asyncio.open_connection(host, port)
+    except OSError:
+        errors.append("connect")
+        return
+    try:
+        for body in bodies:
+            start = time.perf_counter()
+            writer.write(request_bytes(host, body))
+            status, _ = await read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    except (OSError, asyncio.IncompleteReadError) as e:
+        errors.append(type(e).__name__)
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+
+async def run_load(host, port, connections, requests, batch, seed):
+    rng = random.Random(seed)
+    bodies = payloads(rng, 256, batch)
+    latencies = []
+    errors = []
+    start_gate = asyncio.Event()
+    tasks = [asyncio.create_task(client(host, port, [rng.choice(bodies) for _ in range(requests)],
+                                        latencies, errors, start_gate))
+             for _ in range(connections)]
+    start = time.perf_counter()
+    start_gate.set()
+    await asyncio.gather(*tasks)
+    return latencies, errors, time.perf_counter() - start
+
+
+def start_server():
+    process = subprocess.Popen([sys.executable, os.path.join(REPO_ROOT, "scoring_server.py"),
+                                "--port", "0", "--backlog", "4096"],
+                               cwd=REPO_ROOT, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line:
+        process.kill()
+        raise RuntimeError("scoring server did not start")
+    return process, urlsplit(line.split()[-1])
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="server to load (default: start one)")
+    parser.add_argument("--connections", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=20, help="requests per connection")
+    parser.add_argument("--batch", type=int, default=1, help="answer sets per request")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    process = None
+    if args.url:
+        url = urlsplit(args.url)
+    else:
+        process, url = start_server()
+    try:
+        latencies, errors, elapsed = asyncio.run(
+            run_load(url.hostname, url.port, args.connections, args.requests, args.batch, args.seed))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    if not latencies:
+        print(f"no successful requests ({len(errors)} errors)")
+        return
+    latencies.sort()
+    print(f"{args.connections} connections x {args.requests} requests, "
+          f"{args.batch} answer set(s) per request")
+    print(f"requests   {len(latencies)} in {elapsed:.2f} s, {len(errors)} errors")
+    print(f"throughput {len(latencies) / elapsed:10.0f} req/s   "
+          f"{len(latencies) * args.batch / elapsed:10.0f} scores/s")
+    print(f"latency    p50 {statistics.median(latencies) * 1000:7.2f} ms   "
+          f"p99 {percentile(latencies, 0.99) * 1000:7.2f} ms   "
+          f"max {latencies[-1] * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
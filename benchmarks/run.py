@@ -0,0 +1,415 @@
+"""Headless benchmark suite with baseline comparison.
+
+Times the hot paths of the Personality Analyzer on synthetic data:
+
+  scoring         per-answer scoring (PersonalityAnalyzer.process_answer
+                  through the SessionManager, with stand-in widgets) and
+                  batch scoring
+  classification  analyze_results lookups
+  persistence     task progress (save_task_progress / load_task_progress
+                  through ProgressStore) and results files
+                  (save_results / load_results JSON, plus the journal)
+  charts          create_chart's ChartCache lookups, misses (rendered on
+                  the Agg canvas) and hits
+  gui             full sessions through PersonalityAnalyzer (needs Tk)
+
+Charts always use Agg. The gui group needs a display: it uses $DISPLAY,
+or starts an Xvfb virtual display if Xvfb is installed, otherwise it is
+reported as skipped.
+
+Every metric is seconds per operation (best of --repeat runs) and is
+written as JSON. Each run is compared with the baseline file: any metric
+slower than baseline * (1 + --tolerance) is listed and the exit status
+is 1, as is any baseline metric that a group which ran no longer
+reports, or a missing baseline file (record one with --save-baseline;
+timings are machine-specific, so none is checked in). Metrics of skipped
+groups are listed as not compared.
+
+    python benchmarks/run.py --output bench.json
+    python benchmarks/run.py --save-baseline          # record this machine's baseline
+    python benchmarks/run.py --baseline benchmarks/baseline.json
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import matplotlib
+matplotlib.use('Agg')
+
+import classification
+import scoring
+from autosave import atomic_write_json
+from chart_cache import ChartCache
+from progress_store import ProgressStore
+from results_journal import ResultsJournal
+from session_manager import SessionManager
+from session_record import SessionRecord, compact_record, expand_record
+from theme import COLORS
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def best_of(repeat, func, ops):
+    """Best seconds per operation over `repeat` runs of func (which does `ops` operations)."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = (time.perf_counter() - start) / ops
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def synthetic_answers(rng, count):
+    return [[rng.getrandbits(1) for _ in scoring.QUESTIONS] for _ in range(count)]
+
+
+def synthetic_tasks(count):
+    return [f"{i + 1}. Synthetic task number {i + 1}" for i in range(count)]
+
+
+def synthetic_result(rng, name):
+    session = SessionRecord()
+    for _ in scoring.QUESTIONS:
+        session.record(rng.getrandbits(1))
+    return compact_record(name, f"2024-01-{rng.randint(1, 28):02d} 12:00:00", session)
+
+
+class _Widget:
+    # Stands in for the Tk widgets show_question() updates
+    def config(self, **options):
+        pass
+
+    def __setitem__(self, key, value):
+        pass
+
+
+def headless_analyzer():
+    """A PersonalityAnalyzer with just the state process_answer() uses, and no Tk."""
+    import AltF4
+
+    app = object.__new__(AltF4.PersonalityAnalyzer)
+    app.sessions = SessionManager(ttl=None)
+    app.active_session = None
+    app.questions = scoring.QUESTIONS
+    app.question_label = _Widget()
+    app.progress = _Widget()
+    # The results screen is Tk only; the session's scores are what it reads
+    app.show_results = lambda: setattr(app, "scores", app.active_session.scores())
+    return app
+
+
+def bench_scoring(config, rng):
+    answers = synthetic_answers(rng, config.respondents)
+    app = headless_analyzer()
+
+    def per_answer():
+        for i, row in enumerate(answers):
+            app.active_session = app.sessions.create(f"user{i}")
+            for answer in row:
+                app.process_answer(answer)
+            app.sessions.end(app.active_session.session_id)
+
+    results = {
+        "scoring.process_answer": best_of(config.repeat, per_answer,
+                                          len(answers) * len(scoring.QUESTIONS)),
+        "scoring.batch_python": best_of(config.repeat,
+                                        lambda: scoring.score_batch(answers, use_numpy=False),
+                                        len(answers)),
+    }
+    try:
+        import numpy as np
+    except ImportError:
+        return results
+    matrix = np.asarray(answers, dtype=np.uint8)
+    results["scoring.batch_numpy"] = best_of(config.repeat,
+                                             lambda: scoring.score_batch(matrix),
+                                             len(answers))
+    return results
+
+
+def bench_classification(config, rng):
+    score_dicts = [scoring.score_answers(row) for row in synthetic_answers(rng, config.respondents)]
+
+    def classify_all():
+        for scores in score_dicts:
+            classification.classify(scores)
+
+    return {"classification.analyze_results": best_of(config.repeat, classify_all, len(score_dicts))}
+
+
+def bench_persistence(config, rng):
+    results = {}
+    tasks = synthetic_tasks(config.tasks)
+    names = [f"user{i}" for i in range(config.users)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ProgressStore(os.path.join(tmp, "progress.db"))
+
+        def save_sessions():
+            for i, name in enumerate(names):
+                store.save_session(f"{name}-{rng.random()}", name, "2024-01-01 12:00:00",
+                                   [(task, (i + j) % 2 == 0) for j, task in enumerate(tasks)])
+
+        results["persistence.progress_save_session"] = best_of(config.repeat, save_sessions, len(names))
+
+        session_keys = [key for key, _, _ in store.sessions()][:len(names)]
+
+        def toggle_tasks():
+            for key, name in zip(session_keys, names):
+                store.save_tasks({(key, rng.randrange(len(tasks))): (name, "2024-01-02 12:00:00",
+                                                                     "toggled", True)})
+
+        results["persistence.progress_toggle_task"] = best_of(config.repeat, toggle_tasks, len(names))
+        results["persistence.progress_load_latest"] = best_of(
+            config.repeat, lambda: [store.load_latest(name) for name in names], len(names))
+        store.close()
+
+        records = [synthetic_result(rng, name) for name in names[:config.result_files]]
+        results_dir = os.path.join(tmp, "results")
+        os.makedirs(results_dir)
+
+        def save_files():
+            for record in records:
+                path = os.path.join(results_dir, f"personality_analysis_{record['name']}.json")
+                atomic_write_json(path, record)
+
+        def load_files():
+            for record in records:
+                path = os.path.join(results_dir, f"personality_analysis_{record['name']}.json")
+                with open(path, 'r') as f:
+                    expand_record(json.load(f))
+
+        results["persistence.save_results_file"] = best_of(config.repeat, save_files, len(records))
+        results["persistence.load_results_file"] = best_of(config.repeat, load_files, len(records))
+
+        journal_path = os.path.join(tmp, "results.jsonl")
+        journal = ResultsJournal(journal_path)
+        results["persistence.journal_append"] = best_of(
+            config.repeat, lambda: [journal.append(record) for record in records], len(records))
+        results["persistence.journal_latest"] = best_of(
+            config.repeat, lambda: [journal.latest(record["name"]) for record in records], len(records))
+        results["persistence.journal_open"] = best_of(
+            config.repeat, lambda: ResultsJournal(journal_path), 1)
+    return results
+
+
+def bench_charts(config, rng):
+    # The chart cache is what create_chart() renders through; without a
+    # cache_dir only its memory level is timed
+    cache = ChartCache(None)
+    charts = [(scoring.score_answers(row), f"user{i}")
+              for i, row in enumerate(synthetic_answers(rng, config.charts))]
+
+    def render_all():
+        cache.clear()
+        for scores, name in charts:
+            cache.chart("activity", scores, name, COLORS)
+
+    def hit_all():
+        for scores, name in charts:
+            cache.chart("activity", scores, name, COLORS)
+
+    render_all()  # warm font and layout caches
+    results = {
+        "charts.create_chart_miss": best_of(config.repeat, render_all, len(charts)),
+        "charts.create_chart_hit": best_of(config.repeat, hit_all, len(charts)),
+    }
+    cache.close()
+    return results
+
+
+GUI_SCRIPT = """
+import json, random, sys, time
+import tkinter as tk
+import AltF4
+from chart_cache import ChartCache
+
+sessions = int(sys.argv[1])
+rng = random.Random(0)
+root = tk.Tk()
+app = AltF4.PersonalityAnalyzer(root, preload_charts=False, autosave_delay=0.05,
+                                chart_cache=ChartCache(None))
+
+def run_session(i):
+    app.name.set(f"user{i}")
+    app.start_analysis()
+    for _ in app.questions:
+        app.process_answer(bool(rng.getrandbits(1)))
+    root.update()
+    app.start_over()
+    root.update()
+
+run_session(-1)  # first session loads matplotlib
+start = time.perf_counter()
+for i in range(sessions):
+    run_session(i)
+print(json.dumps({"gui.session": (time.perf_counter() - start) / sessions}))
+app.exit_app()
+root.destroy()
+"""
+
+
+@contextlib.contextmanager
+def virtual_display():
+    """Yield a usable DISPLAY value, starting Xvfb if needed (None if impossible)."""
+    if os.environ.get("DISPLAY"):
+        yield os.environ["DISPLAY"]
+        return
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        yield None
+        return
+    display = ":97"
+    process = subprocess.Popen([xvfb, display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        time.sleep(1.0)
+        yield display if process.poll() is None else None
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def bench_gui(config, rng):
+    with virtual_display() as display:
+        if display is None:
+            print("gui: skipped, no display ($DISPLAY is not set and Xvfb is not installed)",
+                  file=sys.stderr)
+            return {}
+        best = None
+        for _ in range(config.repeat):
+            with tempfile.TemporaryDirectory() as home:
+                # A scratch HOME keeps the progress database and logs out of the real one
+                env = dict(os.environ, DISPLAY=display, HOME=home, PYTHONPATH=REPO_ROOT,
+                           PERSONALITY_ANALYZER_PROGRESS_DB=os.path.join(home, "progress.db"))
+                output = subprocess.run([sys.executable, "-c", GUI_SCRIPT, str(config.sessions)],
+                                        cwd=home, env=env, capture_output=True, text=True)
+            if output.returncode != 0:
+                print(output.stderr, file=sys.stderr)
+                print("gui: skipped, the GUI session script failed", file=sys.stderr)
+                return {}
+            value = json.loads(output.stdout.strip().splitlines()[-1])["gui.session"]
+            best = value if best is None else min(best, value)
+        return {"gui.session": best}
+
+
+GROUPS = {
+    "scoring": bench_scoring,
+    "classification": bench_classification,
+    "persistence": bench_persistence,
+    "charts": bench_charts,
+    "gui": bench_gui,
+}
+
+
+def compare(results, baseline, tolerance):
+    """Return (metric, baseline, current) for every regression beyond tolerance."""
+    regressions = []
+    for name, value in sorted(results.items()):
+        reference = baseline.get(name)
+        if reference and value > reference * (1 + tolerance):
+            regressions.append((name, reference, value))
+    return regressions
+
+
+def missing_metrics(results, baseline, groups_run):
+    """Baseline metrics of groups that ran and produced results, but not this metric."""
+    reported = {name.split(".")[0] for name in results}
+    return sorted(name for name in baseline
+                  if name not in results and name.split(".")[0] in groups_run
+                  and name.split(".")[0] in reported)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", nargs="+", choices=sorted(GROUPS), default=list(GROUPS))
+    parser.add_argument("--respondents", type=int, default=20000, help="synthetic answer sets")
+    parser.add_argument("--users", type=int, default=500, help="synthetic users for progress storage")
+    parser.add_argument("--tasks", type=int, default=12, help="tasks per user")
+    parser.add_argument("--result-files", type=int, default=500, help="synthetic results files")
+    parser.add_argument("--charts", type=int, default=20, help="charts rendered per run")
+    parser.add_argument("--sessions", type=int, default=20, help="GUI sessions per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per metric (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write results JSON here (default: stdout only)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="baseline JSON to compare against (required unless --save-baseline)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write this run's results to --baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown before a metric counts as a regression")
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    results = {}
+    skipped = []
+    for group in args.groups:
+        group_results = GROUPS[group](args, rng)
+        if not group_results:
+            skipped.append(group)
+        results.update(group_results)
+
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "config": {key: getattr(args, key) for key in
+                   ("respondents", "users", "tasks", "result_files", "charts", "sessions", "repeat", "seed")},
+        "skipped": skipped,
+        "results": results,
+    }
+    text = json.dumps(report, indent=4)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + "\n")
+    for name, value in sorted(results.items()):
+        print(f"{name:40s} {value * 1e6:12.2f} us/op")
+    for group in skipped:
+        print(f"{group:40s} skipped")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            f.write(text + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+        return 1
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    missing = missing_metrics(results, baseline, args.groups)
+    not_compared = sorted(name for name in baseline if name not in results and name not in missing)
+    for name in sorted(set(results) - set(baseline)):
+        print(f"new metric, not in the baseline: {name}")
+    for name in not_compared:
+        print(f"not compared (group skipped or not selected): {name}")
+    if missing:
+        print("\nMISSING (in the baseline but no longer reported):")
+        for name in missing:
+            print(f"  {name}")
+    if regressions:
+        print(f"\nREGRESSIONS (more than {args.tolerance:.0%} slower than baseline):")
+        for name, reference, value in regressions:
+            print(f"  {name:38s} {reference * 1e6:10.2f} -> {value * 1e6:10.2f} us/op "
+                  f"({value / reference - 1:+.0%})")
+    if missing or regressions:
+        return 1
+    print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,305 @@
+"""Content-addressed cache of rendered score charts.
+
+A chart is fully determined by its kind, score vector, name, theme and
+size, and there are few score vectors (216 for the Personality Analyzer,
+1024 for the personality assessment), so PNGs are cached under a
+SHA-256 of those values instead of being redrawn with matplotlib:
+
+- in memory, in an OrderedDict in least-recently-used order, evicted
+  when the PNG bytes held exceed `memory_budget`;
+- on disk, as <key>.png in `cache_dir`, evicted oldest-first (by last
+  use) when the files exceed `disk_budget`.
+
+Without a cache_dir only the memory level is used. matplotlib is only
+loaded when a chart has to be rendered. Kinds:
+
+  activity  the Personality Analyzer chart (plotting.ScoreChart), themed
+            by a colour dict such as theme.COLORS
+  traits    the personality assessment chart (plotting.TraitChart), themed
+            by its bar colour
+
+The prewarm command renders every score vector ahead of time for the
+given names:
+
+    python chart_cache.py prewarm --kind all --name Alice --name Bob
+    python chart_cache.py prewarm --kind activity --names-file roster.txt
+"""
+import argparse
+import hashlib
+import io
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import plotting
+from theme import COLORS
+
+# Part of every key; bump when rendering changes so old PNGs are not reused
+CACHE_FORMAT = 1
+DEFAULT_CACHE_DIR = os.environ.get("PERSONALITY_ANALYZER_CHART_CACHE",
+                                   os.path.join(os.path.expanduser("~"), ".personality_analyzer_charts"))
+DEFAULT_MEMORY_BUDGET = 32 * 1024 * 1024
+DEFAULT_DISK_BUDGET = 256 * 1024 * 1024
+
+# kind -> (renderer factory taking (theme, figsize), default theme, default figsize)
+RENDERERS = {
+    "activity": (lambda theme, figsize: plotting.ScoreChart(theme, figsize=figsize), COLORS, (8, 4)),
+    "traits": (lambda theme, figsize: plotting.TraitChart(theme, figsize=figsize), 'skyblue', (10, 6)),
+}
+
+
+def _resolve(kind, theme, figsize):
+    factory, default_theme, default_figsize = RENDERERS[kind]
+    theme = default_theme if theme is None else theme
+    return factory, theme, tuple(default_figsize if figsize is None else figsize)
+
+
+def chart_key(kind, scores, name, theme, figsize):
+    payload = json.dumps([CACHE_FORMAT, kind, list(scores.items()), name, theme, list(figsize)],
+                         sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ChartCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, memory_budget=DEFAULT_MEMORY_BUDGET,
+                 disk_budget=DEFAULT_DISK_BUDGET):
+        self.cache_dir = cache_dir
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self.memory = 0
+        self.disk = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+        self._memory = OrderedDict()
+        self._disk = OrderedDict()
+        self._renderers = {}
+        self._lock = threading.RLock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._scan_disk()
+
+    def __len__(self):
+        return len(self._memory)
+
+    @property
+    def disk_entries(self):
+        return len(self._disk)
+
+    def _scan_disk(self):
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".png"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self.disk += size
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + ".png")
+
+    def get(self, key):
+        """PNG bytes for key, or None if neither level has it."""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return data
+            data = self._read_disk(key)
+            if data is not None:
+                self.disk_hits += 1
+                self._remember(key, data)
+            return data
+
+    def put(self, key, data):
+        with self._lock:
+            self._remember(key, data)
+            if self.cache_dir:
+                try:
+                    self._write_disk(key, data)
+                except OSError as e:
+                    logging.error(f"Error writing chart cache entry {key}: {str(e)}")
+
+    def _remember(self, key, data):
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self.memory -= len(old)
+        self._memory[key] = data
+        self.memory += len(data)
+        while self.memory > self.memory_budget and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self.memory -= len(evicted)
+
+    def _read_disk(self, key):
+        if not self.cache_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # mtime records the last use, which orders eviction
+            os.utime(path)
+        except FileNotFoundError:
+            # Possibly evicted by another process sharing the directory
+            if key in self._disk:
+                self.disk -= self._disk.pop(key)
+            return None
+        except OSError as e:
+            logging.error(f"Error reading chart cache entry {key}: {str(e)}")
+            return None
+        # Another process may have written it since the directory was scanned
+        if key in self._disk:
+            self._disk.move_to_end(key)
+        else:
+            self._disk[key] = len(data)
+            self.disk += len(data)
+        return data
+
+    def _write_disk(self, key, data):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.disk -= self._disk.pop(key, 0)
+        self._disk[key] = len(data)
+        self.disk += len(data)
+        while self.disk > self.disk_budget and len(self._disk) > 1:
+            evicted, size = self._disk.popitem(last=False)
+            self.disk -= size
+            try:
+                os.remove(self._path(evicted))
+            except FileNotFoundError:
+                pass
+
+    def chart(self, kind, scores, name, theme=None, figsize=None):
+        """PNG bytes of the chart, rendered (and cached) only on a miss."""
+        factory, theme, figsize = _resolve(kind, theme, figsize)
+        key = chart_key(kind, scores, name, theme, figsize)
+        with self._lock:
+            data = self.get(key)
+            if data is None:
+                data = self._render(factory, kind, scores, name, theme, figsize)
+                self.renders += 1
+                self.put(key, data)
+            return data
+
+    def export(self, kind, scores, name, format="png", theme=None, figsize=None):
+        """The chart as bytes in any format matplotlib writes.
+
+        PNGs go through chart(); other formats (e.g. SVG) are not cached but
+        are drawn on the same reused figure.
+        """
+        if format == "png":
+            return self.chart(kind, scores, name, theme, figsize)
+        factory, theme, figsize = _resolve(kind, theme, figsize)
+        with self._lock:
+            return self._render(factory, kind, scores, name, theme, figsize, format)
+
+    def _render(self, factory, kind, scores, name, theme, figsize, format="png"):
+        # One renderer per kind, theme and size; updates move its bars in place
+        renderer_key = (kind, json.dumps(theme, sort_keys=True), figsize)
+        renderer = self._renderers.get(renderer_key)
+        if renderer is None:
+            renderer = self._renderers[renderer_key] = factory(theme, figsize)
+        renderer.update(scores, name)
+        buffer = io.BytesIO()
+        renderer.save(buffer, format=format)
+        return buffer.getvalue()
+
+    def clear(self):
+        """Drop every cached chart, in memory and on disk; returns how many files were removed."""
+        with self._lock:
+            self._memory.clear()
+            self.memory = 0
+            removed = 0
+            for key in list(self._disk):
+                try:
+                    os.remove(self._path(key))
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+            self._disk.clear()
+            self.disk = 0
+            return removed
+
+    def close(self):
+        with self._lock:
+            for renderer in self._renderers.values():
+                renderer.close()
+            self._renderers.clear()
+
+
+def activity_score_vectors():
+    import classification
+    import scoring
+
+    for values in itertools.product(range(classification.MAX_SCORE + 1), repeat=len(scoring.SCORE_KEYS)):
+        yield dict(zip(scoring.SCORE_KEYS, values))
+
+
+def trait_score_vectors():
+    import personality_assessment
+
+    traits = list(personality_assessment.empty_scores())
+    limits = [personality_assessment.TRAITS.count(trait) for trait in traits]
+    for values in itertools.product(*(range(limit + 1) for limit in limits)):
+        yield dict(zip(traits, values))
+
+
+def prewarm(cache, names, kinds=("activity", "traits"), theme=None):
+    """Render every score vector of each kind for each name; returns charts rendered.
+
+    theme=None uses each kind's default theme.
+    """
+    rendered = cache.renders
+    vectors = {"activity": activity_score_vectors, "traits": trait_score_vectors}
+    for kind in kinds:
+        for name in names:
+            for scores in vectors[kind]():
+                cache.chart(kind, scores, name, theme)
+    return cache.renders - rendered
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Score chart cache")
+    commands = parser.add_subparsers(dest="command", required=True)
+    warm = commands.add_parser("prewarm", help="render every score vector ahead of time")
+    warm.add_argument("--kind", choices=("activity", "traits", "all"), default="all")
+    warm.add_argument("--name", action="append", default=[], help="name to render charts for (repeatable)")
+    warm.add_argument("--names-file", help="file with one name per line")
+    for command in (warm, commands.add_parser("clear", help="delete every cached chart")):
+        command.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+        command.add_argument("--disk-budget-mb", type=float, default=DEFAULT_DISK_BUDGET / (1024 * 1024))
+    args = parser.parse_args(argv)
+
+    cache = ChartCache(args.cache_dir, memory_budget=0,
+                       disk_budget=int(args.disk_budget_mb * 1024 * 1024))
+    if args.command == "clear":
+        print(f"Removed {cache.clear()} charts from {args.cache_dir}")
+        return
+
+    names = list(args.name)
+    if args.names_file:
+        with open(args.names_file, 'r', encoding='utf-8') as f:
+            names.extend(line.strip() for line in f if line.strip())
+    if not names:
+        parser.error("give at least one --name or a --names-file")
+    kinds = ("activity", "traits") if args.kind == "all" else (args.kind,)
+
+    start = time.perf_counter()
+    rendered = prewarm(cache, names, kinds)
+    elapsed = time.perf_counter() - start
+    cache.close()
+    print(f"Rendered {rendered} charts in {elapsed:.1f} s; "
+          f"{cache.disk_entries} charts, {cache.disk / (1024 * 1024):.1f} MB in {args.cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
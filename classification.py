@@ -0,0 +1,271 @@
+"""Personality categories for the Personality Analyzer.
+
+analyze_results() used to walk an if/elif chain and rebuild long string
+literals on every call. The outcome only depends on which categories have
+a score of at least one, and each category score is 0-5, so the rules are
+compiled once at import into a dense table with one entry per score tuple
+(6 x 6 x 6 = 216). Every entry points at one of the shared, immutable
+Classification records below, so classifying is a single index lookup.
+"""
+import itertools
+from collections import namedtuple
+from operator import itemgetter
+
+import scoring
+
+# tasks is a tuple of lines: "" separators, "...:" headers and task items
+Classification = namedtuple("Classification", ["category", "description", "tasks"])
+
+BORDER_COLLIE_SCHOLAR = Classification(
+    "1. 📚 The Border Collie Scholar",
+    "Like a Border Collie, you're highly intelligent and focused on learning. You excel in academic pursuits and enjoy mental challenges, but might need encouragement to take breaks and explore other activities.",
+    (
+        "🎨 Creative Tasks:",
+        "1. Try painting or drawing for 30 minutes",
+        "2. Learn to play a musical instrument",
+        "3. Write a short story or poem",
+        "4. Take a photography walk",
+        "",
+        "💪 Fitness Tasks:",
+        "5. Go for a 20-minute walk",
+        "6. Try yoga or stretching",
+        "7. Join a beginner's sports class",
+        "8. Do 10 minutes of home exercises",
+        "",
+        "📚 Study Balance:",
+        "9. Take regular study breaks",
+        "10. Set a timer for study sessions",
+        "11. Create a balanced daily schedule",
+        "12. Try studying in different environments",
+    ),
+)
+
+GOLDEN_RETRIEVER_CREATIVE = Classification(
+    "2. 🎨 The Golden Retriever Creative",
+    "Like a Golden Retriever, you're friendly, enthusiastic, and love engaging in creative activities. You bring joy to others through your hobbies and artistic pursuits, always ready to try something new and fun.",
+    (
+        "📚 Study Tasks:",
+        "1. Read a non-fiction book for 30 minutes",
+        "2. Take an online course in a new subject",
+        "3. Learn a new language basics",
+        "4. Study a topic you're curious about",
+        "5. Watch educational documentaries",
+        "6. Practice mental math exercises",
+        "",
+        "💪 Fitness Tasks:",
+        "7. Start with 10 minutes of daily exercise",
+        "8. Try a new sport or physical activity",
+        "9. Join a fitness class",
+        "",
+        "🎨 Creative Balance:",
+        "10. Set time limits for creative projects",
+        "11. Schedule regular study breaks",
+        "12. Create a balanced weekly routine",
+    ),
+)
+
+SIBERIAN_HUSKY_ATHLETE = Classification(
+    "3. 💪 The Siberian Husky Athlete",
+    "Like a Siberian Husky, you're energetic, athletic, and love physical challenges. You thrive on exercise and outdoor activities, always ready for the next adventure or workout.",
+    (
+        "📚 Study Tasks:",
+        "1. Read for 20 minutes daily",
+        "2. Take an online course",
+        "3. Learn about nutrition and health",
+        "4. Study exercise science basics",
+        "5. Watch educational fitness videos",
+        "6. Read sports psychology articles",
+        "",
+        "🎨 Creative Tasks:",
+        "7. Try a creative hobby",
+        "8. Learn to cook healthy meals",
+        "9. Start a fitness journal",
+        "",
+        "💪 Fitness Balance:",
+        "10. Schedule rest days",
+        "11. Try different types of exercise",
+        "12. Set realistic fitness goals",
+    ),
+)
+
+POODLE_POLYMATH = Classification(
+    "4. 📚🎨 The Poodle Polymath",
+    "Like a Poodle, you're both intelligent and creative. You excel in both academic and artistic pursuits, showing versatility and adaptability in your interests. You might need a nudge to get more physically active.",
+    (
+        "💪 Fitness Tasks:",
+        "1. Start with 10 minutes of daily exercise",
+        "2. Try yoga or stretching",
+        "3. Go for a 20-minute walk",
+        "4. Join a beginner's fitness class",
+        "5. Try home workout videos",
+        "6. Set step goals for the day",
+        "",
+        "📚 Study Balance:",
+        "7. Take active study breaks",
+        "8. Try studying while walking",
+        "9. Create an exercise schedule",
+        "",
+        "🎨 Creative Balance:",
+        "10. Combine art with movement",
+        "11. Try outdoor photography",
+        "12. Set fitness-related creative goals",
+    ),
+)
+
+GERMAN_SHEPHERD_SCHOLAR_ATHLETE = Classification(
+    "5. 📚💪 The German Shepherd Scholar-Athlete",
+    "Like a German Shepherd, you're both intelligent and physically capable. You excel in both academic and physical pursuits, showing discipline and dedication in everything you do. You might want to explore more creative outlets.",
+    (
+        "🎨 Creative Tasks:",
+        "1. Try drawing or painting",
+        "2. Learn to play an instrument",
+        "3. Start a creative journal",
+        "4. Take a photography class",
+        "5. Try creative writing",
+        "6. Explore digital art",
+        "",
+        "📚 Study Balance:",
+        "7. Study in creative environments",
+        "8. Try mind mapping for notes",
+        "9. Use creative study techniques",
+        "",
+        "💪 Fitness Balance:",
+        "10. Try creative movement",
+        "11. Join a dance class",
+        "12. Combine art with exercise",
+    ),
+)
+
+LABRADOR_ADVENTURER = Classification(
+    "6. 🎨💪 The Labrador Adventurer",
+    "Like a Labrador, you're both creative and athletic. You love exploring new hobbies and staying active, bringing energy and enthusiasm to everything you do. You might want to balance your activities with some academic pursuits.",
+    (
+        "📚 Study Tasks:",
+        "1. Read for 30 minutes daily",
+        "2. Take an online course",
+        "3. Learn about a new subject",
+        "4. Study exercise science",
+        "5. Read about art history",
+        "6. Learn about nutrition",
+        "7. Study time management",
+        "8. Read about psychology",
+        "",
+        "🎨 Creative Balance:",
+        "9. Set study goals",
+        "10. Create a study schedule",
+        "",
+        "💪 Fitness Balance:",
+        "11. Study while walking",
+        "12. Take active study breaks",
+    ),
+)
+
+MIXED_BREED_ALL_ROUNDER = Classification(
+    "🌟 The Mixed Breed All-Rounder",
+    "Like a well-balanced mixed breed, you show interest in multiple areas, making you a versatile and well-rounded individual! You adapt well to different situations and can excel in various pursuits.",
+    (
+        "📚 Study Tasks:",
+        "1. Set specific learning goals",
+        "2. Try new study techniques",
+        "",
+        "🎨 Creative Tasks:",
+        "3. Explore new creative outlets",
+        "4. Challenge your artistic skills",
+        "",
+        "💪 Fitness Tasks:",
+        "5. Try new physical activities",
+        "6. Set fitness challenges",
+        "",
+        "🌟 Balance Tasks:",
+        "7. Create a weekly schedule",
+        "8. Track your progress",
+        "9. Set new goals regularly",
+        "10. Try cross-training activities",
+        "11. Maintain variety in activities",
+        "12. Review and adjust your routine",
+    ),
+)
+
+# (studying, hobbies, fitness): True means a score of at least one, False
+# means a score of exactly zero. Anything that matches no rule (including
+# all three or none of them) is the all-rounder.
+RULES = (
+    ((True, False, False), BORDER_COLLIE_SCHOLAR),
+    ((False, True, False), GOLDEN_RETRIEVER_CREATIVE),
+    ((False, False, True), SIBERIAN_HUSKY_ATHLETE),
+    ((True, True, False), POODLE_POLYMATH),
+    ((True, False, True), GERMAN_SHEPHERD_SCHOLAR_ATHLETE),
+    ((False, True, True), LABRADOR_ADVENTURER),
+)
+DEFAULT = MIXED_BREED_ALL_ROUNDER
+
+# Every distinct outcome; classify_batch() returns indexes into this tuple
+OUTCOMES = tuple(record for _, record in RULES) + (DEFAULT,)
+
+# Highest possible score per category (number of questions in it)
+MAX_SCORE = max(scoring.question_categories().count(i) for i in range(len(scoring.CATEGORIES)))
+_BASE = MAX_SCORE + 1
+
+
+def classify_by_rules(scores):
+    """Evaluate RULES directly for a tuple of category scores."""
+    for pattern, record in RULES:
+        if all(score >= 1 if nonzero else score == 0
+               for score, nonzero in zip(scores, pattern)):
+            return record
+    return DEFAULT
+
+
+def _table_index(scores):
+    index = 0
+    for score in scores:
+        index = index * _BASE + int(score)
+    return index
+
+
+def _compile_table():
+    outcome_ids = {record: i for i, record in enumerate(OUTCOMES)}
+    table = [None] * (_BASE ** len(scoring.CATEGORIES))
+
+    for scores in itertools.product(range(_BASE), repeat=len(scoring.CATEGORIES)):
+        table[_table_index(scores)] = outcome_ids[classify_by_rules(scores)]
+    return tuple(table)
+
+
+# Outcome index (into OUTCOMES) for every score tuple, in row-major order
+OUTCOME_TABLE = _compile_table()
+
+# The same table keyed by score tuple, for single lookups
+_RECORDS_BY_SCORES = {
+    scores: OUTCOMES[OUTCOME_TABLE[_table_index(scores)]]
+    for scores in itertools.product(range(_BASE), repeat=len(scoring.CATEGORIES))
+}
+_score_tuple = itemgetter(*scoring.SCORE_KEYS)
+
+
+def classify_scores(scores):
+    """Classify a tuple of category scores (in scoring.CATEGORIES order)."""
+    record = _RECORDS_BY_SCORES.get(scores)
+    if record is None:
+        # Out-of-range values (e.g. hand-edited result files) use the rules
+        return classify_by_rules(scores)
+    return record
+
+
+def classify(scores):
+    """Classify a scores dict keyed by scoring.SCORE_KEYS."""
+    return classify_scores(_score_tuple(scores))
+
+
+def classify_batch(score_rows):
+    """Outcome indexes (into OUTCOMES) for an (n, 3) array of scores.
+
+    Scores must be within 0..MAX_SCORE, as produced by scoring.score_batch().
+    """
+    try:
+        import numpy as np
+    except ImportError:  # NumPy is optional; only classify_batch uses it
+        return [OUTCOME_TABLE[_table_index(row)] for row in score_rows]
+    score_rows = np.asarray(score_rows)
+    weights = _BASE ** np.arange(score_rows.shape[1] - 1, -1, -1)
+    return np.asarray(OUTCOME_TABLE, dtype=np.uint8)[score_rows @ weights]
@@ -0,0 +1,137 @@
+"""Cohort aggregates over Student Academic Questionnaire submissions.
+
+Every multiselect answer is unpacked into one wide 0/1 matrix with a
+column per (field, option) pair (38 columns). Two count matrices are kept:
+
+  class_counts   classes x options: how often each option was ticked,
+                 per class/grade
+  cooccurrence   options x options (M^T @ M): how often two options were
+                 ticked together, which holds every cross-tab between two
+                 multiselect fields at once
+
+plus a Counter of the subjects listed under needs_help_with. They are
+built in one pass over a StudentStore and updated in place by add() and
+refresh(), so queries only slice matrices that already exist.
+"""
+from collections import Counter
+
+import numpy as np
+
+from student_store import MULTISELECT_FIELDS, unpack
+
+# Column range of each multiselect field in the wide option matrix
+OFFSETS = {}
+_column = 0
+for _key, _options in MULTISELECT_FIELDS.items():
+    OFFSETS[_key] = (_column, _column + len(_options))
+    _column += len(_options)
+OPTION_COUNT = _column
+
+
+def class_label(value):
+    return (value or "").strip()
+
+
+def help_subjects(value):
+    # needs_help_with is free text, usually comma separated; subjects are
+    # counted case-insensitively
+    return [subject.strip().lower() for subject in (value or "").split(",") if subject.strip()]
+
+
+def option_matrix(masks):
+    """(n, OPTION_COUNT) 0/1 matrix from {key: bitmask array}."""
+    return np.hstack([unpack(key, masks[key]) for key in MULTISELECT_FIELDS]).astype(np.float64)
+
+
+class CohortAnalytics:
+    def __init__(self):
+        self.classes = []
+        self.class_index = {}
+        self.class_counts = np.zeros((0, OPTION_COUNT), dtype=np.int64)
+        self.class_totals = np.zeros(0, dtype=np.int64)
+        self.cooccurrence = np.zeros((OPTION_COUNT, OPTION_COUNT), dtype=np.int64)
+        self.help_counts = Counter()
+        self.rows = 0
+
+    @classmethod
+    def from_store(cls, store):
+        analytics = cls()
+        analytics.refresh(store)
+        return analytics
+
+    def _class_ids(self, labels):
+        ids = np.empty(len(labels), dtype=np.intp)
+        for i, label in enumerate(labels):
+            index = self.class_index.get(label)
+            if index is None:
+                index = self.class_index[label] = len(self.classes)
+                self.classes.append(label)
+            ids[i] = index
+        grow = len(self.classes) - len(self.class_totals)
+        if grow:
+            self.class_counts = np.vstack([self.class_counts,
+                                           np.zeros((grow, OPTION_COUNT), dtype=np.int64)])
+            self.class_totals = np.concatenate([self.class_totals, np.zeros(grow, dtype=np.int64)])
+        return ids
+
+    def _accumulate(self, matrix, labels, help_texts):
+        ids = self._class_ids(labels)
+        # Float matmul goes through BLAS; counts stay exact far beyond any
+        # realistic number of submissions
+        self.cooccurrence += (matrix.T @ matrix).astype(np.int64)
+        flat = np.bincount((ids[:, None] * OPTION_COUNT + np.arange(OPTION_COUNT))[matrix > 0],
+                           minlength=len(self.classes) * OPTION_COUNT)
+        self.class_counts += flat.reshape(len(self.classes), OPTION_COUNT)
+        self.class_totals += np.bincount(ids, minlength=len(self.classes))
+        # Many submissions share the same text; split each distinct one once
+        for text, n in Counter(help_texts).items():
+            for subject in help_subjects(text):
+                self.help_counts[subject] += n
+        self.rows += len(labels)
+
+    def refresh(self, store):
+        """Fold in the submissions appended to store since the last refresh."""
+        if len(store) <= self.rows:
+            return 0
+        start = self.rows
+        labels = []
+        help_texts = []
+        for text in store.text_column(start):
+            labels.append(class_label(text["class"]))
+            help_texts.append(text["needs_help_with"])
+        self._accumulate(option_matrix(store.to_numpy(start)), labels, help_texts)
+        return self.rows - start
+
+    def add(self, data):
+        """Fold in one submission (the dict StudentForm.save_data builds)."""
+        row = np.zeros((1, OPTION_COUNT))
+        for key, options in MULTISELECT_FIELDS.items():
+            first = OFFSETS[key][0]
+            for label in data.get(key, []):
+                row[0, first + options.index(label)] = 1
+        self._accumulate(row, [class_label(data.get("class"))], [data.get("needs_help_with")])
+
+    def option_counts(self, key, by_class=True):
+        """{class: {option: count}}, or {option: count} over everyone."""
+        first, last = OFFSETS[key]
+        options = MULTISELECT_FIELDS[key]
+        if not by_class:
+            totals = self.class_counts[:, first:last].sum(axis=0)
+            return dict(zip(options, totals.tolist()))
+        return {label: dict(zip(options, row))
+                for label, row in zip(self.classes, self.class_counts[:, first:last].tolist())}
+
+    def crosstab(self, row_key, column_key):
+        """Counts of (row option, column option) ticked together, as an array.
+
+        Rows follow MULTISELECT_FIELDS[row_key], columns MULTISELECT_FIELDS[column_key].
+        """
+        r0, r1 = OFFSETS[row_key]
+        c0, c1 = OFFSETS[column_key]
+        return self.cooccurrence[r0:r1, c0:c1].copy()
+
+    def class_sizes(self):
+        return dict(zip(self.classes, self.class_totals.tolist()))
+
+    def top_help_subjects(self, n=10):
+        return self.help_counts.most_common(n)
@@ -0,0 +1,288 @@
+"""Asyncio conversation engine for the personality assessment chatbot.
+
+The one implementation of the chatbot's conversation (greeting, name, the
+ten yes/no questions with their retries, the trait insights and the
+chart); personality_assessment.run_conversation() drives it on the
+console. Nothing blocks: pauses use asyncio.sleep and all input and
+output goes through a channel, so one process can hold hundreds of
+conversations at once.
+
+Channels:
+
+  StreamChannel    an asyncio StreamReader/StreamWriter pair, e.g. a TCP or
+                   Unix socket connection, or pipes
+  ConsoleChannel   this process's stdin/stdout; the chart opens in a window
+                   or is saved as PNG/SVG
+  ScriptedChannel  canned answers in, messages collected in a list (tests)
+
+pace scales every pause: 1.0 keeps the original timing, 0 skips the
+pauses entirely (for tests and load runs).
+
+    python conversation.py                         # one conversation on the console
+    python conversation.py --serve --port 8766     # one conversation per connection
+    python conversation.py --serve --unix /tmp/chat.sock --pace 0
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from personality_assessment import (CHART_FORMATS, default_chart_path, empty_scores,
+                                    export_trait_chart, parse_answer, personalize, questions,
+                                    trait_chart_cache, trait_chart_window, trait_insights)
+
+DEFAULT_PORT = 8766
+NAME_PROMPT = "👤 What should I call you? "
+ANSWER_PROMPT = "Your answer (yes/no): "
+
+
+class ConversationClosed(Exception):
+    """The other side went away (end of input)."""
+
+
+class StreamChannel:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, text):
+        self.writer.write(text.encode('utf-8'))
+        await self.writer.drain()
+
+    async def receive(self):
+        line = await self.reader.readline()
+        if not line:
+            raise ConversationClosed()
+        return line.decode('utf-8', errors='replace').rstrip("\r\n")
+
+    def status(self, text):
+        logging.debug(text)
+
+    async def show_chart(self, name, scores):
+        await self.send(text_chart(name, scores))
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+class ConsoleChannel:
+    def __init__(self, chart_format=None, chart_output=None):
+        # chart_format "png" or "svg" saves the chart instead of showing it
+        self.chart_format = chart_format
+        self.chart_output = chart_output
+
+    async def send(self, text):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    async def receive(self):
+        line = await asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
+        if not line:
+            raise ConversationClosed()
+        return line.rstrip("\r\n")
+
+    def status(self, text):
+        print(text)
+
+    async def show_chart(self, name, scores):
+        # Drawing runs on a worker thread; a window is then polled until it
+        # is closed, so the event loop keeps running either way
+        if self.chart_format:
+            path = self.chart_output or default_chart_path(name, self.chart_format)
+            await asyncio.to_thread(export_trait_chart, name, scores, path, self.chart_format)
+            return f"Saved your trait graph to {path}"
+        png = await asyncio.to_thread(trait_chart_cache().chart, "traits", scores, name)
+        await wait_for_window(trait_chart_window(name, scores, png))
+
+    async def close(self):
+        pass
+
+
+class ScriptedChannel:
+    """Feeds `answers` as input lines and records everything sent."""
+
+    def __init__(self, answers):
+        self.answers = list(answers)
+        self.output = []
+
+    async def send(self, text):
+        self.output.append(text)
+
+    async def receive(self):
+        if not self.answers:
+            raise ConversationClosed()
+        return str(self.answers.pop(0))
+
+    def status(self, text):
+        pass
+
+    async def show_chart(self, name, scores):
+        self.output.append(text_chart(name, scores))
+
+    async def close(self):
+        pass
+
+
+async def wait_for_window(figure):
+    import matplotlib.pyplot as plt
+    from matplotlib.backend_bases import FigureManagerBase
+
+    plt.show(block=False)
+    # Non-interactive backends (e.g. Agg) have no window to wait for
+    if type(figure.canvas.manager) is FigureManagerBase:
+        return
+    while plt.fignum_exists(figure.number):
+        plt.pause(0.05)
+        await asyncio.sleep(0)
+
+
+def text_chart(name, scores):
+    width = max(len(trait) for trait in scores)
+    lines = [f"{name}'s Personality Trait Graph"]
+    lines += [f"  {trait:<{width}} {'█' * score} {score}" for trait, score in scores.items()]
+    return "\n".join(lines) + "\n"
+
+
+class Conversation:
+    def __init__(self, channel, pace=1.0):
+        self.channel = channel
+        self.pace = pace
+
+    async def say(self, message, delay=1):
+        await self.channel.send(f"🤖: {message}\n")
+        if self.pace:
+            await asyncio.sleep(delay * self.pace)
+
+    async def ask(self, prompt):
+        await self.channel.send(prompt)
+        return await self.channel.receive()
+
+    async def run(self):
+        """Hold one conversation; returns {"name", "scores", "insights"}."""
+        self.channel.status("Starting the conversation...")
+
+        scores = empty_scores()
+
+        await self.say("Hi there! I'm your friendly AI assistant.")
+        name = await self.ask(NAME_PROMPT)
+        await self.say(f"Nice to meet you, {name}! Let's explore your personality together.")
+        await self.say("Please answer each question with 'yes' or 'no'.\n")
+
+        question_texts = personalize(questions, name)
+
+        for q, question_text in zip(questions, question_texts):
+            while True:
+                try:
+                    await self.say(question_text, delay=0.8)
+                    answer = parse_answer(await self.ask(ANSWER_PROMPT))
+                    if answer is True:
+                        scores[q["trait"]] += 1
+                        await self.say("Got it! ✅\n", delay=0.5)
+                        break
+                    elif answer is False:
+                        await self.say("Got it! ✅\n", delay=0.5)
+                        break
+                    else:
+                        await self.say("Please answer with 'yes' or 'no'.")
+                except (ConversationClosed, asyncio.CancelledError):
+                    raise
+                except Exception as e:
+                    await self.say("Hmm, something went wrong. Try again!")
+
+        self.channel.status("All questions answered")
+
+        await self.say("Thanks for your answers! Calculating your personality insights... 🧠", delay=2)
+
+        await self.say(f"\n🔍 Here's what I learned about you, {name}:")
+
+        insights = trait_insights(scores)
+        for insight in insights:
+            await self.say(insight)
+
+        self.channel.status("Generating graph...")
+        await self.say("\n📊 Now visualizing your personality traits...")
+
+        # A channel may report where the chart went (e.g. a saved file)
+        message = await self.channel.show_chart(name, scores)
+        if message:
+            await self.say(message)
+
+        await self.say(f"That's a wrap, {name}! Hope you enjoyed the personality deep dive. 🌟")
+        return {"name": name, "scores": scores, "insights": insights}
+
+
+class ConversationServer:
+    """One Conversation per connection on a TCP or Unix socket."""
+
+    def __init__(self, pace=1.0):
+        self.pace = pace
+        self.server = None
+        self.active = 0
+        self.completed = 0
+
+    async def handle_connection(self, reader, writer):
+        channel = StreamChannel(reader, writer)
+        self.active += 1
+        try:
+            await Conversation(channel, self.pace).run()
+            self.completed += 1
+        except (ConversationClosed, ConnectionError):
+            pass
+        except Exception as e:
+            logging.error(f"Error in conversation: {str(e)}")
+        finally:
+            self.active -= 1
+            await channel.close()
+
+    async def start(self, host="127.0.0.1", port=DEFAULT_PORT, unix_path=None, backlog=1024):
+        if unix_path:
+            self.server = await asyncio.start_unix_server(self.handle_connection, unix_path,
+                                                          backlog=backlog)
+        else:
+            self.server = await asyncio.start_server(self.handle_connection, host, port,
+                                                     backlog=backlog)
+        return self
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Asyncio personality assessment conversations")
+    parser.add_argument("--serve", action="store_true",
+                        help="hold one conversation per socket connection instead of the console")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--pace", type=float, default=1.0,
+                        help="pause multiplier (1 = original timing, 0 = no pauses)")
+    parser.add_argument("--chart", choices=CHART_FORMATS,
+                        help="on the console, save the trait graph instead of showing it")
+    parser.add_argument("--chart-output", metavar="PATH",
+                        help="file for --chart (default: <name>_traits.<format>)")
+    args = parser.parse_args(argv)
+
+    async def serve():
+        server = await ConversationServer(args.pace).start(args.host, args.port, args.unix)
+        where = args.unix or "{}:{}".format(*server.server.sockets[0].getsockname()[:2])
+        print(f"Conversation server listening on {where}", flush=True)
+        async with server.server:
+            await server.server.serve_forever()
+
+    try:
+        if args.serve:
+            asyncio.run(serve())
+        else:
+            asyncio.run(Conversation(ConsoleChannel(args.chart, args.chart_output), args.pace).run())
+    except (KeyboardInterrupt, ConversationClosed):
+        pass
+
+
+if __name__ == "__main__":
+    main()
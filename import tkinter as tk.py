@@ -1,133 +1,150 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-import json
+import question_bank
+from student_store import MULTISELECT_FIELDS, StudentStore
+
+# Form layout from question_bank.json: (section title, [(kind, label, key), ...]);
+# kind is "entry", "text" (multiline) or "multiselect" (options come from
+# student_store)
+SECTIONS = [
+    (section["title"], [(field["kind"], field["label"], field["id"]) for field in section["fields"]])
+    for section in question_bank.load()["student_form"]["sections"]
+]
 
 class StudentForm(tk.Tk):
-    def __init__(self):
+    def __init__(self, eager=False):
         super().__init__()
         self.title("Student Academic Questionnaire")
         self.geometry("700x700")
         self.entries = {}
+        self.store = None
+        # Section widgets are built the first time a section is shown;
+        # eager=True builds them all up front (the old behaviour)
+        self.section_frames = [None] * len(SECTIONS)
+        self.current_section = None
+        self._scrollregion_pending = False
         self.create_form()
+        if eager:
+            for index in range(len(SECTIONS)):
+                self.build_section(index)
+        self.show_section(0)
 
     def create_form(self):
-        canvas = tk.Canvas(self)
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
+        header = ttk.Frame(self)
+        header.pack(side="top", fill="x", padx=10, pady=(10, 0))
+        self.section_title = tk.Label(header, font=("Segoe UI", 14, "bold"), anchor='w')
+        self.section_title.pack(side="left")
+        self.section_step = tk.Label(header, anchor='e')
+        self.section_step.pack(side="right")
+
+        nav = ttk.Frame(self)
+        nav.pack(side="bottom", fill="x", padx=10, pady=10)
+        self.back_btn = tk.Button(nav, text="Back", command=lambda: self.show_section(self.current_section - 1))
+        self.back_btn.pack(side="left")
+        self.submit_btn = tk.Button(nav, text="Submit", command=self.save_data, bg="#4CAF50", fg="white")
+        self.submit_btn.pack(side="right")
+        self.next_btn = tk.Button(nav, text="Next", command=lambda: self.show_section(self.current_section + 1))
+        self.next_btn.pack(side="right", padx=10)
+
+        self.canvas = tk.Canvas(self)
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.canvas.yview)
+        self.scrollable_frame = ttk.Frame(self.canvas)
+
+        # Recomputing the scroll region is deferred to idle time, so a burst
+        # of <Configure> events (resizing, building a section) costs one bbox
+        self.scrollable_frame.bind("<Configure>", lambda e: self.schedule_scrollregion())
+
+        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+
+        self.canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+    def schedule_scrollregion(self):
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.after_idle(self.update_scrollregion)
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(
-                scrollregion=canvas.bbox("all")
-            )
-        )
+    def update_scrollregion(self):
+        self._scrollregion_pending = False
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+    def build_section(self, index):
+        if self.section_frames[index] is not None:
+            return self.section_frames[index]
 
+        frame = ttk.Frame(self.scrollable_frame)
         row = 0
 
         def add_entry(label, key, is_multiline=False):
             nonlocal row
-            tk.Label(scrollable_frame, text=label, anchor='w').grid(row=row, column=0, sticky='w', pady=4)
+            tk.Label(frame, text=label, anchor='w').grid(row=row, column=0, sticky='w', pady=4)
             if is_multiline:
-                entry = tk.Text(scrollable_frame, height=4, width=60)
+                entry = tk.Text(frame, height=4, width=60)
             else:
-                entry = tk.Entry(scrollable_frame, width=60)
+                entry = tk.Entry(frame, width=60)
             entry.grid(row=row, column=1, pady=4)
             self.entries[key] = entry
             row += 1
 
-        def add_multiselect(label, key, options):
+        def add_multiselect(label, key):
             nonlocal row
-            tk.Label(scrollable_frame, text=label, anchor='w').grid(row=row, column=0, sticky='w', pady=4)
+            options = MULTISELECT_FIELDS[key]
+            tk.Label(frame, text=label, anchor='w').grid(row=row, column=0, sticky='w', pady=4)
             vars_list = []
             for i, option in enumerate(options):
                 var = tk.BooleanVar()
-                chk = tk.Checkbutton(scrollable_frame, text=option, variable=var)
+                chk = tk.Checkbutton(frame, text=option, variable=var)
                 chk.grid(row=row, column=1, sticky='w', padx=20)
                 row += 1
                 vars_list.append((option, var))
             self.entries[key] = vars_list
 
-        # Basic Info
-        add_entry("Full Name", "name")
-        add_entry("Email (optional)", "email")
-        add_entry("Class/Grade", "class")
-        add_entry("Institution (optional)", "institution")
-
-        # Subjects
-        add_entry("Subjects you're studying (comma separated)", "subjects")
-        add_entry("Subjects you find interesting", "interests")
-        add_entry("Subjects you need help with", "needs_help_with")
-        add_entry("Are there upcoming exams/assignments? Describe:", "exam_preparation", is_multiline=True)
-
-        # Study Habits
-        add_multiselect("Study hours per day", "study_hours_per_day", [
-            "Less than 1 hour", "1-2 hours", "2-4 hours", "More than 4 hours"
-        ])
-
-        add_multiselect("Preferred study time", "study_time_preference", [
-            "Morning", "Afternoon", "Evening", "Late night"
-        ])
-
-        add_entry("Do you follow a timetable? If yes, describe:", "study_plan")
-
-        add_multiselect("Do you study alone or in groups?", "study_mode", [
-            "Alone", "In a group", "Both"
-        ])
-
-        add_multiselect("Study resources used:", "study_resources", [
-            "Textbooks", "Online courses", "YouTube tutorials", "Coaching/tutors",
-            "Study apps", "College/School Notes", "Others"
-        ])
-
-        # Learning Preferences
-        add_multiselect("Preferred learning style:", "learning_preference", [
-            "Step-by-step explanation", "Visual aids", "Practice problems",
-            "Real-life examples", "Group discussion"
-        ])
-        add_entry("Topics you need help with right now", "current_difficult_topics")
-        add_multiselect("What do you want help with?", "support_needed", [
-            "Understanding concepts", "Solving problems", "Making study plans",
-            "Time management", "All of the above"
-        ])
-
-        # Goals & Motivation
-        add_entry("Short-term academic goals", "short_term_goals")
-        add_entry("Long-term goal (if any)", "long_term_goal")
-        add_entry("What motivates you to study?", "motivation")
-
-        # Support Preferences
-        add_multiselect("How often would you like support?", "help_frequency", [
-            "Daily", "Few times a week", "Weekly", "Occasionally"
-        ])
-        add_multiselect("Interested in:", "interested_in", [
-            "Personalized study suggestions", "Reminders and schedules",
-            "Practice quizzes", "Peer study groups", "Revision tools", "All of the above"
-        ])
-
-        submit_btn = tk.Button(scrollable_frame, text="Submit", command=self.save_data, bg="#4CAF50", fg="white")
-        submit_btn.grid(row=row+1, column=0, columnspan=2, pady=20)
-
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        for kind, label, key in SECTIONS[index][1]:
+            if kind == "multiselect":
+                add_multiselect(label, key)
+            else:
+                add_entry(label, key, is_multiline=(kind == "text"))
+
+        self.section_frames[index] = frame
+        return frame
+
+    def show_section(self, index):
+        if self.current_section is not None:
+            self.section_frames[self.current_section].pack_forget()
+        # Widgets of hidden sections stay alive, so entered values are kept
+        self.build_section(index).pack(fill="both", expand=True, padx=10, pady=10)
+        self.current_section = index
+        self.canvas.yview_moveto(0)
+
+        self.section_title.config(text=SECTIONS[index][0])
+        self.section_step.config(text=f"Section {index + 1} of {len(SECTIONS)}")
+        self.back_btn.config(state="normal" if index > 0 else "disabled")
+        self.next_btn.config(state="normal" if index < len(SECTIONS) - 1 else "disabled")
 
     def save_data(self):
         data = {}
-        for key, widget in self.entries.items():
-            if isinstance(widget, list):
-                # multiselect checkboxes
-                data[key] = [label for label, var in widget if var.get()]
-            elif isinstance(widget, tk.Text):
-                data[key] = widget.get("1.0", tk.END).strip()
-            else:
-                data[key] = widget.get().strip()
+        for _, fields in SECTIONS:
+            for kind, _, key in fields:
+                widget = self.entries.get(key)
+                if widget is None:
+                    # section never opened
+                    data[key] = [] if kind == "multiselect" else ""
+                elif isinstance(widget, list):
+                    # multiselect checkboxes
+                    data[key] = [label for label, var in widget if var.get()]
+                elif isinstance(widget, tk.Text):
+                    data[key] = widget.get("1.0", tk.END).strip()
+                else:
+                    data[key] = widget.get().strip()
 
         try:
-            with open("student_data_gui.json", "w") as f:
-                json.dump(data, f, indent=4)
-            messagebox.showinfo("Success", "Data saved to student_data_gui.json!")
+            # Every submission is appended; see student_store.py
+            if self.store is None:
+                self.store = StudentStore()
+            self.store.append(data)
+            messagebox.showinfo("Success", f"Data saved to {self.store.directory}/ "
+                                           f"({len(self.store)} submissions)!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {e}")
 
@@ -0,0 +1,119 @@
+"""Opt-in timing instrumentation for the Personality Analyzer.
+
+Metrics.instrument() replaces selected methods on one object with timed
+wrappers. Each call's duration goes into a fixed-bucket histogram: one
+bisect and a few integer increments per call. Histograms can be exported
+as JSON or in the Prometheus text format.
+
+Nothing is wrapped unless instrumentation is switched on, so when it is
+off the methods run exactly as written, with no extra cost.
+"""
+import bisect
+import functools
+import json
+import os
+import threading
+import time
+
+METRICS_ENV = "PERSONALITY_ANALYZER_METRICS"
+METRIC_NAME = "personality_analyzer_method_duration_seconds"
+
+# Upper bounds of the histogram buckets, in seconds
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+           0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def enabled_from_env():
+    return os.environ.get(METRICS_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+class Histogram:
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        # One slot per bucket plus one for values above the last bound
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "sum_seconds": self.total,
+            "mean_seconds": self.total / self.count if self.count else 0.0,
+            "max_seconds": self.max,
+            "buckets": {str(bound): n for bound, n in zip(BUCKETS + ("+Inf",), self.counts)},
+        }
+
+
+class Metrics:
+    def __init__(self):
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name):
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            return histogram
+
+    def observe(self, name, seconds):
+        self.histogram(name).observe(seconds)
+
+    def timed(self, name, func):
+        # The histogram is looked up once here, not on every call
+        observe = self.histogram(name).observe
+        perf_counter = time.perf_counter
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                observe(perf_counter() - start)
+        return wrapper
+
+    def instrument(self, obj, method_names):
+        """Time the named methods of obj (this instance only)."""
+        for name in method_names:
+            setattr(obj, name, self.timed(name, getattr(obj, name)))
+
+    def to_json(self):
+        with self._lock:
+            return json.dumps({name: h.to_dict() for name, h in sorted(self.histograms.items())},
+                              indent=4)
+
+    def to_prometheus(self):
+        lines = [
+            f"# HELP {METRIC_NAME} Time spent in instrumented Personality Analyzer methods.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        with self._lock:
+            for name, histogram in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, n in zip(BUCKETS + ("+Inf",), histogram.counts):
+                    cumulative += n
+                    lines.append(f'{METRIC_NAME}_bucket{{method="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{METRIC_NAME}_sum{{method="{name}"}} {histogram.total}')
+                lines.append(f'{METRIC_NAME}_count{{method="{name}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, directory=".", basename="personality_analyzer_metrics"):
+        """Write <basename>.json and <basename>.prom; returns both paths."""
+        json_path = os.path.join(directory, basename + ".json")
+        prom_path = os.path.join(directory, basename + ".prom")
+        with open(json_path, 'w') as f:
+            f.write(self.to_json())
+        with open(prom_path, 'w') as f:
+            f.write(self.to_prometheus())
+        return json_path, prom_path
@@ -0,0 +1,82 @@
+"""Logging setup for the Personality Analyzer.
+
+Log calls on the Tk thread only put the record on a queue. A background
+QueueListener does the formatting and the file and console I/O. The log
+file rotates by size, or by time when `when` is given (e.g. "midnight").
+The level comes from the argument, else PERSONALITY_ANALYZER_LOG_LEVEL,
+else DEBUG.
+"""
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+
+LOG_FILE = 'personality_analyzer.log'
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+LOG_LEVEL_ENV = "PERSONALITY_ANALYZER_LOG_LEVEL"
+DEFAULT_LEVEL = "DEBUG"
+
+_listener = None
+
+
+def resolve_level(level=None):
+    level = level or os.environ.get(LOG_LEVEL_ENV) or DEFAULT_LEVEL
+    if isinstance(level, int):
+        return level
+    if str(level).isdigit():
+        return int(level)
+    value = logging.getLevelName(str(level).upper())
+    if not isinstance(value, int):
+        raise ValueError(f"Unknown log level: {level}")
+    return value
+
+
+def configure_logging(level=None, log_file=LOG_FILE, max_bytes=1024 * 1024, backup_count=5,
+                      when=None, stream=None):
+    """Route the root logger through a queue to file and console handlers.
+
+    Returns the running QueueListener. Calling it again replaces the
+    previous configuration.
+    """
+    global _listener
+    stop_logging()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = []
+    if log_file:
+        if when:
+            file_handler = logging.handlers.TimedRotatingFileHandler(
+                log_file, when=when, backupCount=backup_count, encoding='utf-8', delay=True)
+        else:
+            file_handler = logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+        handlers.append(file_handler)
+    handlers.append(logging.StreamHandler(stream if stream is not None else sys.stderr))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(resolve_level(level))
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.unregister(stop_logging)
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """Drain the queue and close the handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
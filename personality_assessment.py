@@ -1,121 +1,252 @@
-import time
-import matplotlib.pyplot as plt
+import argparse
+import csv
+import io
+import json
+import re
 import sys
 import traceback
 
-print("Starting the program...")
-
-try:
-    print("Importing modules...")
-    questions = [
-        {"text": "Hey {name}, do you feel energized when spending time with others?", "trait": "extroversion"},
-        {"text": "Do you prefer spending time alone to recharge after social activities?", "trait": "introversion"},
-        {"text": "{name}, do you like to make detailed plans before starting a project?", "trait": "conscientiousness"},
-        {"text": "Do you often make decisions based on your gut feeling?", "trait": "spontaneity"},
-        {"text": "Can you easily understand and share other people's feelings, {name}?", "trait": "empathy"},
-        {"text": "Do you prefer making decisions based on facts and data?", "trait": "logic"},
-        {"text": "Do you enjoy trying new and different experiences?", "trait": "openness"},
-        {"text": "{name}, do you prefer following a regular daily routine?", "trait": "stability"},
-        {"text": "Do you remain calm and composed in stressful situations?", "trait": "emotional_stability"},
-        {"text": "Do you often feel anxious about future events, {name}?", "trait": "anxiety"}
-    ]
-
-    print("Questions defined successfully")
-
-    scores = {
-        "extroversion": 0,
-        "introversion": 0,
-        "conscientiousness": 0,
-        "spontaneity": 0,
-        "empathy": 0,
-        "logic": 0,
-        "openness": 0,
-        "stability": 0,
-        "emotional_stability": 0,
-        "anxiety": 0
-    }
-
-    print("Scores dictionary created")
-
-    def chatbot_say(message, delay=1):
-        print("🤖:", message)
-        time.sleep(delay)
-
-    print("Starting the conversation...")
-    
-    chatbot_say("Hi there! I'm your friendly AI assistant.")
-    name = input("👤 What should I call you? ")
-    chatbot_say(f"Nice to meet you, {name}! Let's explore your personality together.")
-    chatbot_say("Please answer each question with 'yes' or 'no'.\n")
-
-    for q in questions:
-        while True:
-            try:
-                question_text = q["text"].format(name=name)
-                chatbot_say(question_text, delay=0.8)
-                ans = input("Your answer (yes/no): ").lower().strip()
-                if ans in ['yes', 'y']:
-                    scores[q["trait"]] += 1
-                    chatbot_say("Got it! ✅\n", delay=0.5)
-                    break
-                elif ans in ['no', 'n']:
-                    chatbot_say("Got it! ✅\n", delay=0.5)
-                    break
-                else:
-                    chatbot_say("Please answer with 'yes' or 'no'.")
-            except Exception as e:
-                chatbot_say("Hmm, something went wrong. Try again!")
-
-    print("All questions answered")
-
-    chatbot_say("Thanks for your answers! Calculating your personality insights... 🧠", delay=2)
-
-    chatbot_say(f"\n🔍 Here's what I learned about you, {name}:")
-
-    if scores["extroversion"] > scores["introversion"]:
-        chatbot_say("You're more extroverted — you feel energized around others.")
-    else:
-        chatbot_say("You're more introverted — you recharge with quiet time.")
+import question_bank
 
-    if scores["conscientiousness"] > scores["spontaneity"]:
-        chatbot_say("You're a planner who values order and organization.")
-    else:
-        chatbot_say("You're spontaneous and embrace the moment!")
+# Read-only dicts with "id", "trait" and "text"; text may contain {name}
+questions = question_bank.load()["personality_assessment"]["questions"]
 
-    if scores["empathy"] > scores["logic"]:
-        chatbot_say("You lean toward empathy and emotional understanding.")
-    else:
-        chatbot_say("You value logic and thoughtful analysis.")
+TRAITS = [q["trait"] for q in questions]
 
-    if scores["openness"] > scores["stability"]:
-        chatbot_say("You love new experiences and exploring the unknown.")
-    else:
-        chatbot_say("You find comfort in routine and structure.")
+CHART_FORMATS = ("png", "svg")
 
-    if scores["emotional_stability"] > scores["anxiety"]:
-        chatbot_say("You handle stress well and stay calm.")
-    else:
-        chatbot_say("You might experience more anxiety or worry than average.")
+# (trait, opposing trait, insight if trait scores higher, insight otherwise)
+TRAIT_COMPARISONS = [
+    ("extroversion", "introversion",
+     "You're more extroverted — you feel energized around others.",
+     "You're more introverted — you recharge with quiet time."),
+    ("conscientiousness", "spontaneity",
+     "You're a planner who values order and organization.",
+     "You're spontaneous and embrace the moment!"),
+    ("empathy", "logic",
+     "You lean toward empathy and emotional understanding.",
+     "You value logic and thoughtful analysis."),
+    ("openness", "stability",
+     "You love new experiences and exploring the unknown.",
+     "You find comfort in routine and structure."),
+    ("emotional_stability", "anxiety",
+     "You handle stress well and stay calm.",
+     "You might experience more anxiety or worry than average."),
+]
+
+
+def empty_scores():
+    return {trait: 0 for trait in TRAITS}
+
+
+def parse_answer(ans):
+    # True for yes, False for no, None for anything else
+    if isinstance(ans, bool):
+        return ans
+    if isinstance(ans, int):
+        # Only 1 and 0; any other number is not a yes/no answer
+        return {1: True, 0: False}.get(ans)
+    ans = str(ans).lower().strip()
+    # "1"/"0" and "true"/"false" as well, since CSV cells are strings
+    if ans in ['yes', 'y', '1', 'true']:
+        return True
+    if ans in ['no', 'n', '0', 'false']:
+        return False
+    return None
+
+
+def trait_insights(scores):
+    return [higher if scores[trait] > scores[opposite] else otherwise
+            for trait, opposite, higher, otherwise in TRAIT_COMPARISONS]
+
+
+def personalize(questions, name):
+    return [q["text"].format(name=name) for q in questions]
 
-    print("Generating graph...")
-    chatbot_say("\n📊 Now visualizing your personality traits...")
 
-    plt.figure(figsize=(10, 6))
-    plt.bar(scores.keys(), scores.values(), color='skyblue')
-    plt.xticks(rotation=45)
-    plt.ylabel("Trait Score")
-    plt.title(f"{name}'s Personality Trait Graph")
-    plt.tight_layout()
+_chart_cache = None
+
+
+def trait_chart_cache():
+    # Trait charts are cached by score vector and name (see chart_cache.py)
+    global _chart_cache
+    if _chart_cache is None:
+        from chart_cache import ChartCache
+
+        _chart_cache = ChartCache()
+    return _chart_cache
+
+
+def trait_chart_window(name, scores, png=None):
+    """A pyplot figure showing the cached trait chart PNG pixel for pixel."""
+    import matplotlib.pyplot as plt
+
+    if png is None:
+        png = trait_chart_cache().chart("traits", scores, name)
+    image = plt.imread(io.BytesIO(png), format='png')
+    height, width = image.shape[:2]
+    figure = plt.figure(figsize=(width / 100, height / 100), dpi=100)
+    figure.figimage(image)
+    return figure
+
+
+def show_trait_chart(name, scores):
+    import matplotlib.pyplot as plt
+
+    trait_chart_window(name, scores)
     plt.show()
 
-    chatbot_say(f"That's a wrap, {name}! Hope you enjoyed the personality deep dive. 🌟")
-
-except Exception as e:
-    print("\nAn error occurred!")
-    print(f"Error type: {type(e).__name__}")
-    print(f"Error message: {str(e)}")
-    print("\nFull error traceback:")
-    traceback.print_exc()
-    print("\nPlease make sure you have all required packages installed.")
-    print("You can install them using: pip install matplotlib")
-    input("Press Enter to exit...") 
\ No newline at end of file
+
+def export_trait_chart(name, scores, target=None, format="png"):
+    """Render the trait graph headless (Agg) instead of opening a window.
+
+    target is a path or binary file; with no target the image bytes are
+    returned. PNGs come from the chart cache; every format is drawn on
+    the same reused figure.
+    """
+    data = trait_chart_cache().export("traits", scores, name, format)
+    if target is None:
+        return data
+    if hasattr(target, "write"):
+        target.write(data)
+    else:
+        with open(target, 'wb') as f:
+            f.write(data)
+    return target
+
+
+def default_chart_path(name, format="png"):
+    stem = re.sub(r'[^\w-]+', '_', name).strip('_') or 'personality'
+    return f"{stem}_traits.{format}"
+
+
+def run_conversation(chart_format=None, chart_output=None):
+    """Hold the chatbot conversation on the console (see conversation.py).
+
+    chart_format ("png" or "svg") saves the trait graph to chart_output
+    instead of showing it in a window. Returns the name, scores and
+    insights, or None if the input ended early.
+    """
+    import asyncio
+
+    from conversation import ConsoleChannel, Conversation, ConversationClosed
+
+    try:
+        return asyncio.run(Conversation(ConsoleChannel(chart_format, chart_output)).run())
+    except ConversationClosed:
+        return None
+
+
+def score_record(record):
+    """Score one stored respondent without prompts or pauses.
+
+    record has a "name" and "answers", either a list in question order or a
+    dict keyed by trait. Answers may be booleans, 0/1 or yes/no strings.
+    """
+    name = record.get("name", "")
+    answers = record.get("answers")
+    if isinstance(answers, dict):
+        answers = [answers.get(trait) for trait in TRAITS]
+    if not isinstance(answers, list) or len(answers) != len(questions):
+        return {"name": name, "error": f"expected {len(questions)} answers"}
+
+    scores = empty_scores()
+    for q, ans in zip(questions, answers):
+        answer = parse_answer(ans)
+        if answer is None:
+            return {"name": name, "error": f"invalid answer for {q['trait']}: {ans!r}"}
+        if answer:
+            scores[q["trait"]] += 1
+    return {"name": name, "scores": scores, "insights": trait_insights(scores)}
+
+
+class _ReadError(dict):
+    # {"error": ...} for an input line that could not be read as a record
+    pass
+
+
+def read_jsonl(stream):
+    for number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield _ReadError(error=f"line {number}: invalid JSON: {e.msg}")
+            continue
+        if not isinstance(record, dict):
+            yield _ReadError(error=f"line {number}: expected a JSON object")
+            continue
+        yield record
+
+
+def read_csv(stream):
+    # One row per respondent: a "name" column plus one column per trait
+    for row in csv.DictReader(stream):
+        yield {"name": row.get("name", ""), "answers": {trait: row.get(trait) for trait in TRAITS}}
+
+
+def run_batch(input_stream, output_stream, input_format="jsonl"):
+    """Score records from input_stream and write one JSON line per record.
+
+    Records are processed one at a time, so memory use does not depend on
+    the size of the input. Returns the number of records written.
+    """
+    reader = read_csv if input_format == "csv" else read_jsonl
+    count = 0
+    for record in reader(input_stream):
+        result = record if isinstance(record, _ReadError) else score_record(record)
+        output_stream.write(json.dumps(result, ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def _open_stream(path, mode):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Personality assessment chatbot")
+    parser.add_argument("--batch", metavar="PATH",
+                        help="score stored answers from a JSONL or CSV file ('-' for stdin) "
+                             "instead of running the conversation")
+    parser.add_argument("--format", choices=["jsonl", "csv"],
+                        help="input format for --batch (default: from the file extension)")
+    parser.add_argument("--output", default="-", metavar="PATH",
+                        help="where --batch writes JSONL results (default: stdout)")
+    parser.add_argument("--chart", choices=CHART_FORMATS,
+                        help="save the trait graph as PNG or SVG instead of showing it in a window")
+    parser.add_argument("--chart-output", metavar="PATH",
+                        help="file for --chart (default: <name>_traits.<format>)")
+    args = parser.parse_args(argv)
+
+    if args.batch:
+        input_format = args.format or ("csv" if args.batch.lower().endswith(".csv") else "jsonl")
+        input_stream = _open_stream(args.batch, "r")
+        output_stream = _open_stream(args.output, "w")
+        try:
+            run_batch(input_stream, output_stream, input_format)
+        finally:
+            for stream in (input_stream, output_stream):
+                if stream not in (sys.stdin, sys.stdout):
+                    stream.close()
+        return
+
+    print("Starting the program...")
+    try:
+        run_conversation(args.chart, args.chart_output)
+    except Exception as e:
+        print("\nAn error occurred!")
+        print(f"Error type: {type(e).__name__}")
+        print(f"Error message: {str(e)}")
+        print("\nFull error traceback:")
+        traceback.print_exc()
+        print("\nPlease make sure you have all required packages installed.")
+        print("You can install them using: pip install matplotlib")
+        input("Press Enter to exit...")
+
+
+if __name__ == "__main__":
+    main()
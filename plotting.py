@@ -0,0 +1,166 @@
+"""Lazy matplotlib layer for the Personality Analyzer.
+
+Importing matplotlib (and building its font cache) is the slowest part of
+starting the app, but nothing is plotted until the results screen. Charts
+are drawn headless on the Agg canvas and shown in Tk as PNGs (see
+chart_cache.py). The Figure and Agg canvas classes are loaded, and the
+chart style applied, the first time they are needed. warm_up() can do
+that work on a background thread while the user is answering questions.
+"""
+import logging
+import threading
+
+PLOT_STYLE = 'dark_background'
+
+_load_lock = threading.Lock()
+_modules = {}
+
+
+def _load():
+    # The lock makes a UI-thread caller wait for an in-flight warm up
+    # instead of importing matplotlib a second time.
+    with _load_lock:
+        if not _modules:
+            logging.info("Loading matplotlib")
+            import matplotlib.style
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            matplotlib.style.use(PLOT_STYLE)
+            _modules['Figure'] = Figure
+            _modules['FigureCanvasAgg'] = FigureCanvasAgg
+    return _modules
+
+
+def is_loaded():
+    return bool(_modules)
+
+
+def warm_up():
+    """Start loading matplotlib on a daemon thread; returns the thread."""
+    def run():
+        try:
+            _load()
+        except Exception as e:
+            # The UI thread will hit (and report) the same error on first use
+            logging.error(f"Error warming up matplotlib: {str(e)}")
+
+    thread = threading.Thread(target=run, name="matplotlib-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+class ScoreChart:
+    """A single bar chart of the activity scores, updated in place.
+
+    The Figure is created once, without going through pyplot, so it is never
+    left behind in pyplot's figure registry. Each update() only moves the
+    existing bars and labels; save() renders through the Agg canvas.
+    """
+
+    def __init__(self, colors, figsize=(8, 4)):
+        # The style has to be in place before the figure picks up rcParams
+        modules = _load()
+
+        self.colors = colors
+        self.figure = modules['Figure'](figsize=figsize, facecolor=colors['bg'])
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_facecolor(colors['bg'])
+        self.ax.set_ylabel("Interest Level", fontsize=10, color=colors['fg'])
+        self.ax.tick_params(axis='both', labelcolor=colors['fg'])
+        self.ax.grid(axis='y', linestyle='--', alpha=0.3, color=colors['fg'])
+        self.bars = []
+        self.value_labels = []
+        self.labels = ()
+        self.canvas = modules['FigureCanvasAgg'](self.figure)
+
+    def _build_bars(self, count):
+        for artist in self.bars + self.value_labels:
+            artist.remove()
+        palette = [self.colors['accent'], self.colors['success'], self.colors['warning']]
+        self.bars = list(self.ax.bar(range(count), [0] * count,
+                                     color=[palette[i % len(palette)] for i in range(count)]))
+        self.value_labels = [
+            self.ax.text(bar.get_x() + bar.get_width() / 2., 0, '0',
+                         ha='center', va='bottom', color=self.colors['fg'])
+            for bar in self.bars
+        ]
+
+    def update(self, scores, name):
+        labels = tuple(scores.keys())
+        values = list(scores.values())
+
+        if len(values) != len(self.bars):
+            self._build_bars(len(values))
+        for bar, text, value in zip(self.bars, self.value_labels, values):
+            bar.set_height(value)
+            text.set_y(value)
+            text.set_text(f'{int(value)}')
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+        self.ax.set_title(f"{name}'s Activity Preferences",
+                          fontsize=12, pad=20, color=self.colors['fg'])
+        if labels != self.labels:
+            self.ax.set_xticks(range(len(labels)))
+            self.ax.set_xticklabels(labels, rotation=45, ha='right', color=self.colors['fg'])
+            self.labels = labels
+            self.figure.tight_layout()
+
+    def save(self, target, format=None):
+        self.figure.savefig(target, format=format, facecolor=self.figure.get_facecolor())
+
+    def close(self):
+        self.figure.clear()
+        self.bars = []
+        self.value_labels = []
+
+
+class TraitChart:
+    """The personality assessment trait chart (see show_trait_chart), headless.
+
+    Drawn in matplotlib's default style whatever style the process uses
+    elsewhere, on one Agg Figure whose bars are updated in place.
+    """
+
+    def __init__(self, color='skyblue', figsize=(10, 6), style='default'):
+        import matplotlib.style
+
+        modules = _load()
+        self.color = color
+        self.style = style
+        with matplotlib.style.context(style):
+            self.figure = modules['Figure'](figsize=figsize)
+            self.ax = self.figure.add_subplot(111)
+            self.ax.set_ylabel("Trait Score")
+        self.canvas = modules['FigureCanvasAgg'](self.figure)
+        self.bars = []
+        self.labels = ()
+
+    def update(self, scores, name):
+        import matplotlib.style
+
+        labels = tuple(scores.keys())
+        values = list(scores.values())
+        with matplotlib.style.context(self.style):
+            if labels != self.labels:
+                for bar in self.bars:
+                    bar.remove()
+                self.bars = list(self.ax.bar(range(len(labels)), [0] * len(labels), color=self.color))
+                self.ax.set_xticks(range(len(labels)))
+                self.ax.set_xticklabels(labels, rotation=45)
+            for bar, value in zip(self.bars, values):
+                bar.set_height(value)
+            self.ax.relim()
+            self.ax.autoscale_view()
+            self.ax.set_title(f"{name}'s Personality Trait Graph")
+            if labels != self.labels:
+                self.labels = labels
+                self.figure.tight_layout()
+
+    def save(self, target, format=None):
+        self.figure.savefig(target, format=format, facecolor=self.figure.get_facecolor())
+
+    def close(self):
+        self.figure.clear()
+        self.bars = []
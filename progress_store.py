@@ -0,0 +1,191 @@
+"""SQLite-backed task progress for many users.
+
+Replaces the single ~/.personality_analyzer_tasks.json file, which held
+one user's progress at a time. Every analysis session gets its own row,
+keyed by a session key and indexed by (name, date), and task states are
+upserted one row per task, so a checkbox click writes only that task.
+
+The database runs in WAL mode with a busy timeout, so several app
+instances on a shared machine can write to it at the same time. Each
+thread gets its own connection.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+
+DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"),
+                               ".personality_analyzer_progress.db")
+LEGACY_JSON_PATH = os.path.join(os.path.expanduser("~"),
+                                ".personality_analyzer_tasks.json")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_key TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_name_date ON sessions (name, date);
+CREATE INDEX IF NOT EXISTS idx_sessions_date ON sessions (date);
+CREATE TABLE IF NOT EXISTS tasks (
+    session_id INTEGER NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (session_id, position)
+) WITHOUT ROWID;
+"""
+
+
+def new_session_key():
+    return uuid.uuid4().hex
+
+
+class ProgressStore:
+    def __init__(self, path=DEFAULT_DB_PATH, timeout=30.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode; transactions are opened explicitly below
+            conn = sqlite3.connect(self.path, timeout=self.timeout,
+                                   isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _transaction(self):
+        return _Transaction(self._connection())
+
+    def save_tasks(self, changes):
+        """Upsert task states.
+
+        changes maps (session_key, position) to (name, date, text, completed);
+        all of them are written in a single transaction.
+        """
+        with self._transaction() as conn:
+            self._upsert_tasks(conn, changes)
+
+    def _upsert_tasks(self, conn, changes):
+        session_ids = {}
+        for (session_key, position), (name, date, text, completed) in changes.items():
+            if session_key not in session_ids:
+                conn.execute(
+                    "INSERT INTO sessions (session_key, name, date) VALUES (?, ?, ?) "
+                    "ON CONFLICT (session_key) DO UPDATE SET date = excluded.date",
+                    (session_key, name, date))
+                session_ids[session_key] = conn.execute(
+                    "SELECT id FROM sessions WHERE session_key = ?",
+                    (session_key,)).fetchone()[0]
+            conn.execute(
+                "INSERT INTO tasks (session_id, position, text, completed) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (session_id, position) DO UPDATE "
+                "SET text = excluded.text, completed = excluded.completed",
+                (session_ids[session_key], position, text, int(completed)))
+
+    def save_session(self, session_key, name, date, tasks):
+        """Write a whole session; tasks is a list of (text, completed)."""
+        self.save_tasks({(session_key, position): (name, date, text, completed)
+                         for position, (text, completed) in enumerate(tasks)})
+
+    def load_latest(self, name):
+        """Return the most recent session for name, or None."""
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT id, session_key, date FROM sessions WHERE name = ? "
+            "ORDER BY date DESC, id DESC LIMIT 1", (name,)).fetchone()
+        if row is None:
+            return None
+        session_id, session_key, date = row
+        tasks = conn.execute(
+            "SELECT text, completed FROM tasks WHERE session_id = ? ORDER BY position",
+            (session_id,)).fetchall()
+        return {
+            "name": name,
+            "date": date,
+            "session": session_key,
+            "tasks": [{"text": text, "completed": bool(completed)} for text, completed in tasks]
+        }
+
+    def sessions(self, name=None, since=None):
+        """Yield (session_key, name, date) rows, newest first."""
+        query = "SELECT session_key, name, date FROM sessions"
+        clauses, params = [], []
+        if name is not None:
+            clauses.append("name = ?")
+            params.append(name)
+        if since is not None:
+            clauses.append("date >= ?")
+            params.append(since)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY date DESC, id DESC"
+        yield from self._connection().execute(query, params)
+
+    def import_json(self, path):
+        """Import a progress file in the old single-user JSON layout.
+
+        Re-importing the same file is a no-op. Returns True if a session
+        was added.
+        """
+        with open(path, 'r') as f:
+            progress = json.load(f)
+        session_key = f"json:{progress['name']}:{progress['date']}"
+        with self._transaction() as conn:
+            if conn.execute("SELECT 1 FROM sessions WHERE session_key = ?",
+                            (session_key,)).fetchone():
+                return False
+            self._upsert_tasks(conn, {
+                (session_key, position): (progress["name"], progress["date"],
+                                          task["text"], task["completed"])
+                for position, task in enumerate(progress["tasks"])})
+        return True
+
+    def close(self):
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+        self._local = threading.local()
+
+
+class _Transaction:
+    # BEGIN IMMEDIATE takes the write lock up front, so concurrent writers
+    # wait on the busy timeout instead of failing on a lock upgrade
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+def migrate_legacy_json(store, path=LEGACY_JSON_PATH):
+    """Import the old JSON progress file once, then rename it aside."""
+    if not os.path.exists(path):
+        return False
+    try:
+        store.import_json(path)
+        os.replace(path, path + ".migrated")
+        logging.info(f"Migrated task progress from {path}")
+        return True
+    except Exception as e:
+        logging.error(f"Error migrating task progress: {str(e)}")
+        return False
@@ -0,0 +1,177 @@
+"""Shared question bank for the Personality Analyzer, the personality
+assessment chatbot and the Student Academic Questionnaire.
+
+question_bank.json holds one bank per app. Each bank has its own version
+number and every question or form field has a stable id:
+
+  personality_analyzer    categories (id, emoji) and yes/no questions
+                          (id, category, text)
+  personality_assessment  yes/no questions (id, trait, text); text may
+                          contain a {name} placeholder
+  student_form            sections (title, fields); a field has an id, a
+                          kind (entry, text or multiselect), a label and,
+                          for multiselects, its options
+
+load() checks the file, fills in derived values (e.g. each analyzer
+question's emoji) and returns the result frozen: dicts become read-only
+FrozenDicts and lists become tuples. The frozen result is pickled to
+__pycache__/ next to the JSON file under the file's SHA-256, so later
+launches unpickle it instead of parsing, checking and freezing the JSON
+again. Editing the file changes the hash, and the next load recompiles it.
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+BANK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "question_bank.json")
+FORMAT = 1
+FIELD_KINDS = ("entry", "text", "multiselect")
+
+# Bump when compile_bank() output changes, so stale caches are ignored
+_COMPILER_VERSION = 1
+
+_loaded = {}
+
+
+class QuestionBankError(ValueError):
+    pass
+
+
+class FrozenDict(dict):
+    """A dict that cannot be changed after it is built."""
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("question bank entries are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        # Rebuilt from a plain dict, since unpickling item by item would
+        # go through __setitem__
+        return (FrozenDict, (dict(self),))
+
+
+def _require(item, keys, where):
+    for key in keys:
+        if key not in item:
+            raise QuestionBankError(f"{where}: missing '{key}'")
+
+
+def _check_ids(items, where):
+    seen = set()
+    for item in items:
+        _require(item, ("id",), where)
+        if item["id"] in seen:
+            raise QuestionBankError(f"{where}: duplicate id '{item['id']}'")
+        seen.add(item["id"])
+
+
+def _compile_analyzer(bank):
+    _require(bank, ("version", "categories", "questions"), "personality_analyzer")
+    _check_ids(bank["categories"], "personality_analyzer categories")
+    _check_ids(bank["questions"], "personality_analyzer questions")
+    emojis = {}
+    for category in bank["categories"]:
+        _require(category, ("emoji",), f"category '{category['id']}'")
+        emojis[category["id"]] = category["emoji"]
+    questions = []
+    for question in bank["questions"]:
+        _require(question, ("category", "text"), f"question '{question['id']}'")
+        if question["category"] not in emojis:
+            raise QuestionBankError(f"question '{question['id']}': unknown category '{question['category']}'")
+        questions.append(dict(question, emoji=emojis[question["category"]]))
+    return {"version": bank["version"], "categories": bank["categories"], "questions": questions}
+
+
+def _compile_assessment(bank):
+    _require(bank, ("version", "questions"), "personality_assessment")
+    _check_ids(bank["questions"], "personality_assessment questions")
+    for question in bank["questions"]:
+        _require(question, ("trait", "text"), f"question '{question['id']}'")
+    return bank
+
+
+def _compile_form(bank):
+    _require(bank, ("version", "sections"), "student_form")
+    fields = [field for section in bank["sections"] for field in section["fields"]]
+    _check_ids(fields, "student_form fields")
+    for field in fields:
+        _require(field, ("kind", "label"), f"field '{field['id']}'")
+        if field["kind"] not in FIELD_KINDS:
+            raise QuestionBankError(f"field '{field['id']}': unknown kind '{field['kind']}'")
+        if field["kind"] == "multiselect":
+            _require(field, ("options",), f"field '{field['id']}'")
+    return bank
+
+
+def compile_bank(raw):
+    """Check a parsed question_bank.json and return the compiled (unfrozen) banks."""
+    if raw.get("format") != FORMAT:
+        raise QuestionBankError(f"Unsupported question bank format: {raw.get('format')!r}")
+    banks = raw.get("banks", {})
+    _require(banks, ("personality_analyzer", "personality_assessment", "student_form"), "banks")
+    return {
+        "personality_analyzer": _compile_analyzer(banks["personality_analyzer"]),
+        "personality_assessment": _compile_assessment(banks["personality_assessment"]),
+        "student_form": _compile_form(banks["student_form"]),
+    }
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def cache_path(path, digest):
+    directory, filename = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, "__pycache__", f"{filename}.{digest[:16]}.pickle")
+
+
+def _read_cache(path, digest):
+    try:
+        with open(cache_path(path, digest), 'rb') as f:
+            compiler_version, cached_digest, banks = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError, TypeError):
+        return None
+    if compiler_version != _COMPILER_VERSION or cached_digest != digest:
+        return None
+    return banks
+
+
+def _write_cache(path, digest, banks):
+    target = cache_path(path, digest)
+    try:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        temp = f"{target}.{os.getpid()}.tmp"
+        with open(temp, 'wb') as f:
+            pickle.dump((_COMPILER_VERSION, digest, banks), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp, target)
+    except OSError as e:
+        # A read-only install still works, it just recompiles every launch
+        logging.debug(f"Could not cache question bank: {str(e)}")
+
+
+def load(path=BANK_PATH):
+    """Return the frozen banks from path, compiling them only if the file changed."""
+    path = os.path.abspath(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256(data).hexdigest()
+
+    loaded = _loaded.get(path)
+    if loaded is not None and loaded[0] == digest:
+        return loaded[1]
+
+    banks = _read_cache(path, digest)
+    if banks is None:
+        banks = freeze(compile_bank(json.loads(data.decode('utf-8'))))
+        _write_cache(path, digest, banks)
+    _loaded[path] = (digest, banks)
+    return banks
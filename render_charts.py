@@ -0,0 +1,116 @@
+"""Headless chart rendering for saved Personality Analyzer results.
+
+Renders the activity-preference chart for personality_analysis_<name>.json
+files (as written by PersonalityAnalyzer.save_results) to PNG and/or SVG,
+with the same styling as the in-app chart but on the Agg canvas, so no
+display or Tk is needed. Files are spread over a process pool. Each worker
+keeps a single ScoreChart and reuses it for every file it renders.
+
+    python render_charts.py results/ --out-dir charts --format png svg
+"""
+import argparse
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import plotting
+from session_record import expand_record
+from theme import COLORS
+
+_chart = None
+
+
+def _init_worker(figsize):
+    global _chart
+    _chart = plotting.ScoreChart(COLORS, figsize=figsize)
+
+
+def render_file(path, out_dir, formats=("png",), dpi=100):
+    """Render one results file; returns (path, output paths, error)."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            results = expand_record(json.load(f))
+        _chart.update(results["scores"], results["name"])
+
+        stem = os.path.splitext(os.path.basename(path))[0]
+        outputs = []
+        for fmt in formats:
+            out_path = os.path.join(out_dir, f"{stem}.{fmt}")
+            _chart.figure.savefig(out_path, format=fmt, dpi=dpi,
+                                  facecolor=_chart.figure.get_facecolor())
+            outputs.append(out_path)
+        return path, outputs, None
+    except Exception as e:
+        return path, [], f"{type(e).__name__}: {str(e)}"
+
+
+def _render_task(args):
+    return render_file(*args)
+
+
+def find_results(inputs):
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(sorted(glob.glob(os.path.join(item, "personality_analysis_*.json"))))
+        else:
+            paths.append(item)
+    return paths
+
+
+def render_all(paths, out_dir, formats=("png",), workers=None, dpi=100, figsize=(8, 4)):
+    """Render every path, yielding render_file() results as they finish.
+
+    workers=1 renders in this process; otherwise a process pool with
+    `workers` processes (default: one per core) is used.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    tasks = [(path, out_dir, tuple(formats), dpi) for path in paths]
+    if workers == 1:
+        _init_worker(figsize)
+        for task in tasks:
+            yield _render_task(task)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    # Batches amortize inter-process overhead without starving workers
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(figsize,)) as pool:
+        yield from pool.map(_render_task, tasks, chunksize=chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render chart images for saved results")
+    parser.add_argument("inputs", nargs="+",
+                        help="results files, or directories of personality_analysis_*.json files")
+    parser.add_argument("--out-dir", default="charts", help="directory for the images")
+    parser.add_argument("--format", nargs="+", default=["png"], choices=["png", "svg"],
+                        dest="formats", help="image formats to write")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: one per core, 1: no pool)")
+    parser.add_argument("--dpi", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    paths = find_results(args.inputs)
+    start = time.perf_counter()
+    rendered = failed = 0
+    for path, outputs, error in render_all(paths, args.out_dir, args.formats,
+                                           args.workers, args.dpi):
+        if error:
+            failed += 1
+            print(f"{path}: {error}")
+        else:
+            rendered += 1
+    elapsed = time.perf_counter() - start
+
+    images = rendered * len(args.formats)
+    rate = rendered / elapsed if elapsed > 0 else 0.0
+    print(f"Rendered {rendered} results ({images} images) in {elapsed:.2f} s "
+          f"- {rate:.1f} results/s, {failed} failed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Append-only journal of Personality Analyzer results.
+
+An alternative to one pretty-printed JSON file per saved session. Results
+are appended as one compact JSON line each to a journal file (e.g.
+results.jsonl). A sidecar index (results.jsonl.idx) gets one line per
+record with the record's name, date, byte offset and length.
+
+- Appending is O(1): one write to each file.
+- Loading a user's latest result is a dict lookup in the index plus a
+  single seek and read in the journal.
+- scan() streams the whole journal one record at a time.
+
+If the app stops between the two writes, the index misses the newest
+records. They are re-indexed from the journal the next time it is opened.
+A record torn by a crash mid-write (no trailing newline) is cut off before
+the next append; lines that are not valid JSON are skipped.
+"""
+import json
+import os
+
+
+class ResultsJournal:
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + ".idx"
+        # name -> (date, offset, length) of that name's newest record
+        self._latest = {}
+        self._indexed_end = 0
+        self._load_index()
+
+    def _load_index(self):
+        if os.path.exists(self.index_path):
+            good_end = 0
+            with open(self.index_path, 'rb') as f:
+                for line in f:
+                    try:
+                        name, date, offset, length = json.loads(line)
+                    except ValueError:
+                        break  # torn last line; re-indexed from the journal below
+                    self._remember(name, date, offset, length)
+                    good_end += len(line)
+            if good_end < os.path.getsize(self.index_path):
+                os.truncate(self.index_path, good_end)
+
+        # Index anything the journal has beyond the last indexed record
+        if os.path.exists(self.path) and os.path.getsize(self.path) > self._indexed_end:
+            with open(self.path, 'rb') as f, \
+                    open(self.index_path, 'a', encoding='utf-8') as index:
+                f.seek(self._indexed_end)
+                offset = self._indexed_end
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # torn last record
+                    record = _decode(line)
+                    if record is not None:
+                        self._write_index(index, record, offset, len(line))
+                    offset += len(line)
+
+    def _remember(self, name, date, offset, length):
+        latest = self._latest.get(name)
+        if latest is None or (date, offset) >= latest[:2]:
+            self._latest[name] = (date, offset, length)
+        self._indexed_end = max(self._indexed_end, offset + length)
+
+    def _write_index(self, index, record, offset, length):
+        name, date = record.get("name", ""), record.get("date", "")
+        index.write(json.dumps([name, date, offset, length], ensure_ascii=False) + "\n")
+        self._remember(name, date, offset, length)
+
+    def append(self, record):
+        """Append one result record; returns its byte offset."""
+        data = (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+        self._drop_torn_record()
+        with open(self.path, 'ab') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            offset = f.tell() - len(data)
+        with open(self.index_path, 'a', encoding='utf-8') as index:
+            self._write_index(index, record, offset, len(data))
+        return offset
+
+    def _drop_torn_record(self):
+        # Truncate back to the last complete line, so a record torn by a crash
+        # is not glued onto the next one
+        try:
+            with open(self.path, 'rb+') as f:
+                end = f.seek(0, os.SEEK_END)
+                if end == 0:
+                    return
+                f.seek(end - 1)
+                if f.read(1) == b"\n":
+                    return
+                position = end
+                while position > 0:
+                    start = max(0, position - 4096)
+                    f.seek(start)
+                    newline = f.read(position - start).rfind(b"\n")
+                    if newline != -1:
+                        f.truncate(start + newline + 1)
+                        return
+                    position = start
+                f.truncate(0)
+        except FileNotFoundError:
+            pass
+
+    def names(self):
+        return sorted(self._latest)
+
+    def read_at(self, offset, length):
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.read(length))
+
+    def latest(self, name):
+        """Return the newest record for name, or None."""
+        entry = self._latest.get(name)
+        if entry is None:
+            return None
+        _, offset, length = entry
+        return self.read_at(offset, length)
+
+    def scan(self):
+        """Yield every record in append order without loading the whole file."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if line.endswith(b"\n"):
+                    record = _decode(line)
+                    if record is not None:
+                        yield record
+
+
+def _decode(line):
+    # None for a line that is not a JSON object (corrupted on disk)
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    return record if isinstance(record, dict) else None
@@ -0,0 +1,104 @@
+"""Headless scoring for the Personality Analyzer questionnaire.
+
+Exposes the analyzer's questions (from question_bank.json) and the
+yes/no scoring rules without any Tk dependency, so answers can be scored
+outside the GUI. score_batch() scores many respondents at once: with
+NumPy it is a single matrix product of the answers against a
+question-to-category matrix; without NumPy it falls back to plain Python
+and returns the same numbers. NumPy is only imported by the batch helpers,
+so importing this module stays cheap.
+"""
+import question_bank
+
+_BANK = question_bank.load()["personality_analyzer"]
+
+QUESTION_BANK_VERSION = _BANK["version"]
+
+# (category, emoji) in score/display order
+CATEGORIES = tuple((category["id"], category["emoji"]) for category in _BANK["categories"])
+
+# Read-only dicts with "id", "category", "text" and "emoji"
+QUESTIONS = _BANK["questions"]
+
+# Keys of the scores dict, e.g. "📚 studying"
+SCORE_KEYS = tuple(f"{emoji} {category}" for category, emoji in CATEGORIES)
+_CATEGORY_INDEX = {category: i for i, (category, _) in enumerate(CATEGORIES)}
+
+
+def score_key(question):
+    return f"{question['emoji']} {question['category']}"
+
+
+def _numpy():
+    """The numpy module, or None if it is not installed (imported on first use)."""
+    try:
+        import numpy
+    except ImportError:  # NumPy is optional; score_batch falls back to pure Python
+        return None
+    return numpy
+
+
+def empty_scores():
+    return {key: 0 for key in SCORE_KEYS}
+
+
+def question_categories(questions=QUESTIONS):
+    """Category index (into CATEGORIES) of each question."""
+    return [_CATEGORY_INDEX[question["category"]] for question in questions]
+
+
+def category_matrix(questions=QUESTIONS):
+    """Question-to-category matrix: row q has a 1 in question q's category."""
+    np = _numpy()
+    if np is None:
+        raise ImportError("category_matrix() requires NumPy")
+    matrix = np.zeros((len(questions), len(CATEGORIES)), dtype=np.int32)
+    matrix[np.arange(len(questions)), question_categories(questions)] = 1
+    return matrix
+
+
+def score_answers(answers, questions=QUESTIONS):
+    """Score one respondent's yes/no answers into a scores dict."""
+    scores = empty_scores()
+    for question, answer in zip(questions, answers):
+        if answer:
+            scores[score_key(question)] += 1
+    return scores
+
+
+def score_batch(answers, questions=QUESTIONS, use_numpy=None):
+    """Score many respondents at once.
+
+    answers is a 2-D array-like of yes/no values (bool or 0/1), one row per
+    respondent and one column per question. Returns per-category scores in
+    CATEGORIES order: an (n, len(CATEGORIES)) integer array with NumPy, or a
+    list of lists with the pure-Python path (use_numpy=False, or NumPy not
+    installed).
+    """
+    np = None if use_numpy is False else _numpy()
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        if np is None:
+            raise ImportError("score_batch(use_numpy=True) requires NumPy")
+        answers = np.asarray(answers)
+        if answers.ndim != 2 or answers.shape[1] != len(questions):
+            raise ValueError(f"answers must have shape (n, {len(questions)}), got {answers.shape}")
+        return (answers != 0).astype(np.int32) @ category_matrix(questions)
+
+    categories = question_categories(questions)
+    results = []
+    for row in answers:
+        if len(row) != len(questions):
+            raise ValueError(f"each answer row must have {len(questions)} values, got {len(row)}")
+        totals = [0] * len(CATEGORIES)
+        for category, answer in zip(categories, row):
+            if answer:
+                totals[category] += 1
+        results.append(totals)
+    return results
+
+
+def scores_to_dict(row):
+    """Turn one row of score_batch() output back into a scores dict."""
+    return {key: int(value) for key, value in zip(SCORE_KEYS, row)}
@@ -0,0 +1,428 @@
+"""Local HTTP scoring service for the personality analyzers.
+
+Serves the same scoring as PersonalityAnalyzer and personality_assessment.py
+over HTTP/1.1 using only asyncio from the standard library, so web or LMS
+front ends can score answers without starting Tk.
+
+  POST /score        Personality Analyzer answers -> scores, category,
+                     description and tasks (as analyze_results returns them)
+  POST /assessment   personality_assessment answers -> trait scores and
+                     insights (as --batch writes them)
+  GET  /questions    both question banks from question_bank.json
+  GET  /health       {"status": "ok"}
+
+  POST   /sessions              start a one-question-at-a-time session
+                                ({"name": ..., "mode": ...}, mode as in
+                                adaptive.QUESTION_MODES); returns its id
+                                and state
+  GET    /sessions/<id>         the next question, or the result once done
+  POST   /sessions/<id>/answer  answer the next question ({"answer": "yes"})
+  DELETE /sessions/<id>         end the session
+
+Sessions are held by a session_manager.SessionManager (see --session-*).
+
+/score takes {"answers": [...]} with one yes/no value per question (true/
+false, 1/0 or "yes"/"no"), {"answers": {question_id: value, ...}}, or
+{"session": [version, count, mask]} as stored by session_record. A JSON
+list, or {"batch": [...]}, scores many at once and returns {"results":
+[...]} in the same order; an invalid item gets {"error": ...} in its slot.
+/assessment takes the records that personality_assessment.py --batch reads.
+
+Connections are kept alive (HTTP/1.1 default) until the client sends
+"Connection: close" or stays idle for --idle-timeout seconds. Every
+analyzer outcome is one of 216 score vectors, so the JSON for each is
+encoded once at startup and responses are joined from those pieces.
+
+    python scoring_server.py --port 8765
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+
+import adaptive
+import classification
+import personality_assessment
+import question_bank
+import scoring
+from log_setup import configure_logging
+from session_manager import DEFAULT_MEMORY_BUDGET, DEFAULT_TTL, SessionManager
+from session_record import SessionRecord
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 8 * 1024 * 1024
+IDLE_TIMEOUT = 30.0
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    408: "Request Timeout", 411: "Length Required", 413: "Payload Too Large",
+    431: "Request Header Fields Too Large", 500: "Internal Server Error",
+    501: "Not Implemented",
+}
+
+_QUESTION_IDS = [question["id"] for question in scoring.QUESTIONS]
+_QUESTION_CATEGORIES = scoring.question_categories()
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _encode_outcome(scores):
+    scores_dict = dict(zip(scoring.SCORE_KEYS, scores))
+    category, description, tasks = classification.classify_scores(scores)
+    return _dumps({"scores": scores_dict, "category": category,
+                   "description": description, "tasks": list(tasks)})
+
+
+# Response JSON for every in-range score vector
+_OUTCOME_JSON = {scores: _encode_outcome(scores)
+                 for scores in itertools.product(range(classification.MAX_SCORE + 1),
+                                                 repeat=len(scoring.CATEGORIES))}
+
+
+def answer_list(item):
+    """The yes/no answers of one /score item, in question order."""
+    if not isinstance(item, dict):
+        raise ValueError("each item must be a JSON object")
+    if "session" in item:
+        session = SessionRecord.decode(item["session"])
+        if (session.count != len(scoring.QUESTIONS) or session.asked is not None
+                or session.questions is not scoring.QUESTIONS):
+            raise ValueError("session does not cover the current questions")
+        return session.answer_list()
+
+    answers = item.get("answers")
+    if isinstance(answers, dict):
+        missing = [qid for qid in _QUESTION_IDS if qid not in answers]
+        if missing:
+            raise ValueError(f"missing answers for {', '.join(missing)}")
+        answers = [answers[qid] for qid in _QUESTION_IDS]
+    if not isinstance(answers, list) or len(answers) != len(scoring.QUESTIONS):
+        raise ValueError(f"expected {len(scoring.QUESTIONS)} answers")
+
+    parsed = []
+    for index, answer in enumerate(answers):
+        value = personality_assessment.parse_answer(answer)
+        if value is None:
+            raise ValueError(f"invalid answer for {_QUESTION_IDS[index]}: {answer!r}")
+        parsed.append(value)
+    return parsed
+
+
+def score_item(item):
+    """Response JSON for one /score item."""
+    totals = [0] * len(scoring.CATEGORIES)
+    for category, answer in zip(_QUESTION_CATEGORIES, answer_list(item)):
+        if answer:
+            totals[category] += 1
+    return _OUTCOME_JSON[tuple(totals)]
+
+
+def _batch_items(payload):
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict) and isinstance(payload.get("batch"), list):
+        return payload["batch"]
+    return None
+
+
+def handle_score(payload):
+    items = _batch_items(payload)
+    if items is None:
+        try:
+            return score_item(payload)
+        except (ValueError, TypeError) as e:
+            raise RequestError(400, str(e))
+    parts = []
+    for item in items:
+        try:
+            parts.append(score_item(item))
+        except (ValueError, TypeError) as e:
+            parts.append(_dumps({"error": str(e)}))
+    return '{"results":[' + ",".join(parts) + ']}'
+
+
+def handle_assessment(payload):
+    items = _batch_items(payload)
+    if items is None:
+        if not isinstance(payload, dict):
+            raise RequestError(400, "expected a JSON object or list")
+        result = personality_assessment.score_record(payload)
+        if "error" in result:
+            raise RequestError(400, result["error"])
+        return _dumps(result)
+    results = [personality_assessment.score_record(item) if isinstance(item, dict)
+               else {"error": "each item must be a JSON object"} for item in items]
+    return _dumps({"results": results})
+
+
+def _questions_json():
+    banks = question_bank.load()
+    return _dumps({"personality_analyzer": banks["personality_analyzer"],
+                   "personality_assessment": banks["personality_assessment"]})
+
+
+POST_ROUTES = {
+    "/score": handle_score,
+    "/assessment": handle_assessment,
+}
+
+GET_ROUTES = {
+    "/health": lambda: '{"status":"ok"}',
+    "/questions": _questions_json,
+}
+
+
+def _parse_json(body):
+    try:
+        return json.loads(body) if body else {}
+    except ValueError as e:
+        raise RequestError(400, f"invalid JSON: {str(e)}")
+
+
+def session_state(session):
+    state = {"id": session.session_id, "name": session.name, "mode": session.mode,
+             "answered": session.current_question, "total": len(session.record.questions)}
+    question = session.question()
+    if question is not None:
+        state["question"] = {"id": question["id"], "text": question["text"]}
+        return _dumps(state)
+    # Finished: append the same outcome JSON /score returns
+    outcome = _OUTCOME_JSON[tuple(session.scores().values())]
+    return _dumps(state)[:-1] + ',"result":' + outcome + "}"
+
+
+def handle_sessions(method, parts, body, sessions):
+    if not parts:
+        if method != "POST":
+            raise RequestError(405, "use POST")
+        payload = _parse_json(body)
+        if not isinstance(payload, dict):
+            raise RequestError(400, "expected a JSON object")
+        mode = payload.get("mode", adaptive.DEFAULT_MODE)
+        if mode not in adaptive.QUESTION_MODES:
+            raise RequestError(400, f"mode must be one of {', '.join(adaptive.QUESTION_MODES)}")
+        return session_state(sessions.create(str(payload.get("name", "")), mode=mode))
+
+    try:
+        session = sessions.get(parts[0])
+    except KeyError:
+        raise RequestError(404, f"no such session: {parts[0]}")
+    action = parts[1:]
+    if not action:
+        if method == "DELETE":
+            sessions.end(session.session_id)
+            return '{"ended":true}'
+        if method not in ("GET", "HEAD"):
+            raise RequestError(405, "use GET or DELETE")
+        return session_state(session)
+    if action == ["answer"]:
+        if method != "POST":
+            raise RequestError(405, "use POST")
+        payload = _parse_json(body)
+        answer = personality_assessment.parse_answer(payload.get("answer") if isinstance(payload, dict) else None)
+        if answer is None:
+            raise RequestError(400, "answer must be yes or no")
+        try:
+            session.answer(answer)
+        except ValueError as e:
+            raise RequestError(400, str(e))
+        return session_state(session)
+    raise RequestError(404, "no such endpoint")
+
+
+def dispatch(method, path, body, sessions=None):
+    """Return (status, response JSON) for one request."""
+    path = path.split("?", 1)[0]
+    if path in POST_ROUTES:
+        if method != "POST":
+            raise RequestError(405, "use POST")
+        return 200, POST_ROUTES[path](_parse_json(body))
+    parts = path.strip("/").split("/")
+    if parts[0] == "sessions" and sessions is not None:
+        return 200, handle_sessions(method, parts[1:], body, sessions)
+    if path in GET_ROUTES:
+        if method not in ("GET", "HEAD"):
+            raise RequestError(405, "use GET")
+        return 200, GET_ROUTES[path]()
+    raise RequestError(404, f"no such endpoint: {path}")
+
+
+def _response(status, body, keep_alive, head=False):
+    body = body.encode('utf-8')
+    headers = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+               f"Content-Type: application/json; charset=utf-8\r\n"
+               f"Content-Length: {len(body)}\r\n"
+               f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+    return headers.encode('ascii') + (b"" if head else body)
+
+
+async def _read_request(reader):
+    """Return (method, path, version, headers, body), or None at end of stream."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if e.partial.strip():
+            raise RequestError(400, "incomplete request")
+        return None
+    except asyncio.LimitOverrunError:
+        raise RequestError(431, "request headers too large")
+
+    lines = head.decode('latin-1').split("\r\n")
+    try:
+        method, path, version = lines[0].split(" ")
+    except ValueError:
+        raise RequestError(400, "malformed request line")
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    if "transfer-encoding" in headers:
+        raise RequestError(501, "chunked request bodies are not supported")
+    length = headers.get("content-length")
+    if length is None:
+        if method == "POST":
+            raise RequestError(411, "Content-Length required")
+        return method, path, version, headers, b""
+    try:
+        length = int(length)
+    except ValueError:
+        raise RequestError(400, "invalid Content-Length")
+    if length < 0:
+        raise RequestError(400, "invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise RequestError(413, f"request body over {MAX_BODY_BYTES} bytes")
+    try:
+        body = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        raise RequestError(400, "incomplete request body")
+    return method, path, version, headers, body
+
+
+def _wants_keep_alive(version, headers):
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+class ScoringServer:
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, idle_timeout=IDLE_TIMEOUT, backlog=1024,
+                 sessions=None):
+        self.sessions = sessions if sessions is not None else SessionManager()
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.backlog = backlog
+        self.server = None
+        self.requests = 0
+        self._connections = set()
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port,
+                                                 backlog=self.backlog, limit=MAX_HEADER_BYTES)
+        # Port 0 picks a free port; report the real one
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            # Idle keep-alive connections would otherwise hold wait_closed()
+            for writer in list(self._connections):
+                writer.close()
+            await self.server.wait_closed()
+
+    async def handle_connection(self, reader, writer):
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    break
+                except RequestError as e:
+                    writer.write(_response(e.status, _dumps({"error": str(e)}), False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+
+                method, path, version, headers, body = request
+                keep_alive = _wants_keep_alive(version, headers)
+                try:
+                    status, response = dispatch(method, path, body, self.sessions)
+                except RequestError as e:
+                    status, response = e.status, _dumps({"error": str(e)})
+                except Exception as e:
+                    logging.error(f"Error handling {method} {path}: {str(e)}")
+                    status, response = 500, _dumps({"error": "internal error"})
+                self.requests += 1
+                writer.write(_response(status, response, keep_alive, head=method == "HEAD"))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP scoring service for the personality analyzers")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT,
+                        help="seconds an idle keep-alive connection stays open")
+    parser.add_argument("--backlog", type=int, default=1024, help="listen backlog")
+    parser.add_argument("--session-dir", help="snapshot evicted sessions here (default: drop them)")
+    parser.add_argument("--session-budget-mb", type=float, default=DEFAULT_MEMORY_BUDGET / (1024 * 1024),
+                        help="memory for in-memory sessions before the least recently used are evicted")
+    parser.add_argument("--session-ttl", type=float, default=DEFAULT_TTL,
+                        help="seconds an idle session stays in memory")
+    parser.add_argument("--log-level", help="logging level (default: WARNING)")
+    args = parser.parse_args(argv)
+
+    configure_logging(args.log_level or "WARNING", "scoring_server.log")
+    sessions = SessionManager(args.session_dir, int(args.session_budget_mb * 1024 * 1024), args.session_ttl)
+    server = ScoringServer(args.host, args.port, args.idle_timeout, args.backlog, sessions)
+
+    async def run():
+        await server.start()
+        print(f"Scoring server listening on http://{server.host}:{server.port}", flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.session_dir:
+            sessions.snapshot_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""Many independent Personality Analyzer sessions in one process.
+
+A Session is the state of one respondent: an id, a name, the
+SessionRecord with the answers given so far, the question mode (see
+adaptive.py) and when it was last used.
+SessionManager keeps sessions in an OrderedDict in least-recently-used
+order, so create(), get() and answer() are O(1):
+
+- A session idle for longer than `ttl` seconds is evicted the next time
+  the manager is used.
+- When the estimated memory of the sessions in memory exceeds
+  `memory_budget` bytes, the least recently used ones are evicted.
+
+Evicted sessions are written to `snapshot_dir` as <id>.json and loaded
+back transparently by get(). Without a snapshot_dir they are dropped.
+
+The manager has no Tk dependency. PersonalityAnalyzer drives one session
+at a time through it; scoring_server.py exposes it over HTTP.
+"""
+import json
+import logging
+import os
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import adaptive
+import classification
+from session_record import SessionRecord
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+DEFAULT_TTL = 30 * 60
+
+_SESSION_ID = re.compile(r"^[0-9a-f]{16}$")
+
+
+class Session:
+    __slots__ = ("session_id", "name", "record", "mode", "last_used")
+
+    def __init__(self, session_id, name="", record=None, last_used=0.0, mode=adaptive.DEFAULT_MODE):
+        if mode not in adaptive.QUESTION_MODES:
+            raise ValueError(f"Unknown question mode: {mode!r}")
+        self.session_id = session_id
+        self.name = name
+        self.record = record if record is not None else SessionRecord()
+        self.mode = mode
+        self.last_used = last_used
+
+    @property
+    def current_question(self):
+        """Number of questions answered so far."""
+        return self.record.count
+
+    @property
+    def finished(self):
+        return adaptive.next_question(self.record, self.mode) is None
+
+    def question(self):
+        """The next question, or None once the session is over."""
+        index = adaptive.next_question(self.record, self.mode)
+        return None if index is None else self.record.questions[index]
+
+    def answer(self, value):
+        index = adaptive.next_question(self.record, self.mode)
+        if index is None:
+            raise ValueError("the questionnaire is already finished")
+        self.record.record(value, index)
+
+    def scores(self):
+        return self.record.scores()
+
+    def result(self):
+        """(category, description, tasks), as analyze_results returns them."""
+        return classification.classify(self.record.scores())
+
+    def to_json(self):
+        return {"id": self.session_id, "name": self.name, "session": self.record.encode(),
+                "mode": self.mode}
+
+    @classmethod
+    def from_json(cls, data, last_used=0.0):
+        return cls(data["id"], data["name"], SessionRecord.decode(data["session"]), last_used,
+                   data.get("mode", adaptive.DEFAULT_MODE))
+
+
+def session_size(session):
+    """Rough bytes held by one in-memory session and its manager entry."""
+    return (sys.getsizeof(session) + sys.getsizeof(session.record)
+            + sys.getsizeof(session.record.answers) + sys.getsizeof(session.name)
+            + sys.getsizeof(session.session_id) + sys.getsizeof(session.last_used)
+            + (sys.getsizeof(session.record.asked) if session.record.asked is not None else 0)
+            + 100)  # OrderedDict entry and size bookkeeping
+
+
+class SessionManager:
+    def __init__(self, snapshot_dir=None, memory_budget=DEFAULT_MEMORY_BUDGET, ttl=DEFAULT_TTL,
+                 clock=time.monotonic):
+        self.snapshot_dir = snapshot_dir
+        self.memory_budget = memory_budget
+        self.ttl = ttl
+        self.clock = clock
+        self.memory = 0
+        self.evictions = 0
+        self._sessions = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.RLock()
+        if snapshot_dir:
+            os.makedirs(snapshot_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, session_id):
+        with self._lock:
+            if session_id in self._sessions:
+                return True
+            path = self._snapshot_path(session_id)
+            return path is not None and os.path.exists(path)
+
+    def _snapshot_path(self, session_id):
+        if not self.snapshot_dir or not _SESSION_ID.match(session_id):
+            return None
+        return os.path.join(self.snapshot_dir, session_id + ".json")
+
+    def _add(self, session):
+        size = session_size(session)
+        self._sessions[session.session_id] = session
+        self._sizes[session.session_id] = size
+        self.memory += size
+        self._enforce_limits(keep=session.session_id)
+
+    def create(self, name="", record=None, mode=adaptive.DEFAULT_MODE):
+        with self._lock:
+            session_id = secrets.token_hex(8)
+            while session_id in self._sessions:
+                session_id = secrets.token_hex(8)
+            session = Session(session_id, name, record, self.clock(), mode)
+            self._add(session)
+            return session
+
+    def get(self, session_id):
+        """Return the session, reloading it from its snapshot if it was evicted.
+
+        Raises KeyError for unknown or ended sessions.
+        """
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                session.last_used = self.clock()
+                self._sessions.move_to_end(session_id)
+                self._enforce_limits(keep=session_id)
+                return session
+            session = self._load_snapshot(session_id)
+            if session is None:
+                raise KeyError(session_id)
+            self._add(session)
+            return session
+
+    def answer(self, session_id, value):
+        session = self.get(session_id)
+        session.answer(value)
+        return session
+
+    def end(self, session_id):
+        """Forget a session, in memory and on disk."""
+        with self._lock:
+            if self._sessions.pop(session_id, None) is not None:
+                self.memory -= self._sizes.pop(session_id)
+            path = self._snapshot_path(session_id)
+            if path and os.path.exists(path):
+                os.remove(path)
+
+    def evict_idle(self):
+        with self._lock:
+            self._enforce_limits()
+
+    def _enforce_limits(self, keep=None):
+        # The front of the OrderedDict is the least recently used session, so
+        # expired sessions are always found there
+        if self.ttl is not None:
+            deadline = self.clock() - self.ttl
+            while self._sessions:
+                session = next(iter(self._sessions.values()))
+                if session.last_used > deadline or session.session_id == keep:
+                    break
+                self._evict_oldest()
+        while self.memory > self.memory_budget and len(self._sessions) > 1:
+            if next(iter(self._sessions)) == keep:
+                self._sessions.move_to_end(keep)
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        session_id, session = self._sessions.popitem(last=False)
+        self.memory -= self._sizes.pop(session_id)
+        self.evictions += 1
+        try:
+            self._write_snapshot(session)
+        except OSError as e:
+            logging.error(f"Error snapshotting session {session_id}: {str(e)}")
+
+    def _write_snapshot(self, session):
+        path = self._snapshot_path(session.session_id)
+        if path is None:
+            return
+        # Written then renamed, so a reader never sees half a snapshot; not
+        # fsynced, since an evicted session is a cache entry, not a record
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(session.to_json(), f)
+        os.replace(tmp_path, path)
+
+    def _load_snapshot(self, session_id):
+        path = self._snapshot_path(session_id)
+        if path is None:
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logging.error(f"Error loading session snapshot {session_id}: {str(e)}")
+            return None
+        os.remove(path)
+        return Session.from_json(data, self.clock())
+
+    def snapshot_all(self):
+        """Write every in-memory session to snapshot_dir (e.g. at shutdown)."""
+        with self._lock:
+            for session in self._sessions.values():
+                self._write_snapshot(session)
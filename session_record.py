@@ -0,0 +1,155 @@
+"""Compact record of one Personality Analyzer session.
+
+A session used to be a list of {"question": text, "answer": "Yes"/"No"}
+dicts. The answers are yes/no in a fixed question order, so one integer is
+enough: bit i is set when question i was answered "Yes". Together with
+the number of questions answered and the version of the question bank
+they were asked from, it rebuilds the scores, the classification and the
+old responses list.
+
+On disk a session is stored as [version, count, bitmask], e.g.
+{"name": ..., "date": ..., "session": [1, 15, 20511]}. Sessions that
+skipped questions (see adaptive.py) add a fourth element, the bitmask of
+the questions that were asked; without it the first `count` were. expand_record()
+turns such a record back into the layout save_results() used to write,
+and leaves records that already have "responses" untouched.
+"""
+import classification
+import scoring
+
+QUESTION_BANK_VERSION = scoring.QUESTION_BANK_VERSION
+
+# Question order of every analyzer question bank version that sessions may
+# refer to. When the bank in question_bank.json changes, keep the previous
+# version's questions listed here so older sessions still decode.
+QUESTION_BANKS = {
+    QUESTION_BANK_VERSION: scoring.QUESTIONS,
+}
+
+
+def _category_masks(questions):
+    masks = [0] * len(scoring.CATEGORIES)
+    for bit, category in enumerate(scoring.question_categories(questions)):
+        masks[category] |= 1 << bit
+    return masks
+
+
+_CATEGORY_MASKS = {version: _category_masks(questions) for version, questions in QUESTION_BANKS.items()}
+
+
+class SessionRecord:
+    __slots__ = ("answers", "asked", "count", "version")
+
+    def __init__(self, answers=0, count=0, version=QUESTION_BANK_VERSION, asked=None):
+        if version not in QUESTION_BANKS:
+            raise ValueError(f"Unknown question bank version: {version}")
+        self.answers = answers
+        # None while the questions were asked in order (the first `count`),
+        # which keeps the common case down to two small ints
+        self.asked = None if asked == (1 << count) - 1 else asked
+        self.count = count
+        self.version = version
+
+    def __eq__(self, other):
+        if not isinstance(other, SessionRecord):
+            return NotImplemented
+        return ((self.answers, self.asked_mask(), self.version)
+                == (other.answers, other.asked_mask(), other.version))
+
+    def __repr__(self):
+        return (f"SessionRecord(answers={self.answers:#x}, count={self.count}, "
+                f"version={self.version}, asked={self.asked_mask():#x})")
+
+    def asked_mask(self):
+        """Bitmask of the questions that have been answered."""
+        return (1 << self.count) - 1 if self.asked is None else self.asked
+
+    @property
+    def questions(self):
+        return QUESTION_BANKS[self.version]
+
+    def next_index(self):
+        """Index of the first question not asked yet."""
+        if self.asked is None:
+            return self.count
+        return (~self.asked & (self.asked + 1)).bit_length() - 1
+
+    def record(self, answer, index=None):
+        """Record the answer to question `index` (default: the first one not asked yet)."""
+        if index is None:
+            index = self.next_index()
+        asked = self.asked_mask()
+        if asked >> index & 1:
+            raise ValueError(f"Question {index} was already answered")
+        if answer:
+            self.answers |= 1 << index
+        self.count += 1
+        asked |= 1 << index
+        self.asked = None if asked == (1 << self.count) - 1 else asked
+
+    def answer(self, index):
+        return bool(self.answers >> index & 1)
+
+    def answer_list(self):
+        """Answers (1 for "Yes") to the asked questions, in question order."""
+        asked = self.asked_mask()
+        return [self.answers >> i & 1 for i in range(asked.bit_length()) if asked >> i & 1]
+
+    def scores(self):
+        return {key: bin(self.answers & mask).count("1")
+                for key, mask in zip(scoring.SCORE_KEYS, _CATEGORY_MASKS[self.version])}
+
+    def progress(self):
+        """(scores, unanswered questions), each a tuple in scoring.CATEGORIES order."""
+        masks = _CATEGORY_MASKS[self.version]
+        asked = self.asked_mask()
+        return (tuple(bin(self.answers & mask).count("1") for mask in masks),
+                tuple(bin(mask & ~asked).count("1") for mask in masks))
+
+    def responses(self):
+        """The responses list in the old per-answer layout (asked questions only)."""
+        asked = self.asked_mask()
+        return [{"question": question["text"], "answer": "Yes" if self.answers >> i & 1 else "No"}
+                for i, question in enumerate(self.questions) if asked >> i & 1]
+
+    def encode(self):
+        if self.asked is None:
+            return [self.version, self.count, self.answers]
+        return [self.version, self.count, self.answers, self.asked]
+
+    @classmethod
+    def decode(cls, value):
+        version, count, answers = value[:3]
+        asked = value[3] if len(value) > 3 else None
+        if asked is not None and (asked < 0 or bin(asked).count("1") != count):
+            raise ValueError(f"asked mask must have {count} questions set")
+        return cls(answers, count, version, asked)
+
+    @classmethod
+    def from_responses(cls, responses, version=QUESTION_BANK_VERSION):
+        # Answers are taken in order; the question texts are not checked
+        session = cls(version=version)
+        for response in responses[:len(QUESTION_BANKS[version])]:
+            session.record(response["answer"] == "Yes")
+        return session
+
+
+def compact_record(name, date, session):
+    return {"name": name, "date": date, "session": session.encode()}
+
+
+def expand_record(record):
+    """Rebuild the old results layout (category, description, scores, responses)."""
+    if "session" not in record:
+        return record
+    session = SessionRecord.decode(record["session"])
+    scores = session.scores()
+    category, description, _ = classification.classify(scores)
+    return {
+        "name": record["name"],
+        "date": record["date"],
+        "category": f"Category: {category}",
+        "description": description,
+        "scores": scores,
+        "responses": session.responses(),
+    }
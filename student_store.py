@@ -0,0 +1,226 @@
+"""Append-only columnar store for Student Academic Questionnaire submissions.
+
+StudentForm.save_data() used to overwrite student_data_gui.json with the
+latest student. StudentStore appends every submission to a directory of
+column files instead:
+
+  <key>.u16        one little-endian uint16 per submission and multiselect
+                   field, with bit i set when option i was ticked
+  submitted_at.u32 submission time (Unix seconds)
+  text.jsonl       one JSON list per submission with the free-text fields
+  schema.json      the field and option lists the columns were written with
+
+Bulk reads stream or map whole columns: iter_rows() and export_csv()
+decode one submission at a time, and to_numpy() loads each bitmask column
+with a single np.fromfile call.
+"""
+import csv
+import json
+import os
+import sys
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # only needed for to_numpy()/unpack()
+    np = None
+
+import question_bank
+from autosave import atomic_write_json
+
+SCHEMA_VERSION = 1
+
+_FIELDS = [field for section in question_bank.load()["student_form"]["sections"]
+           for field in section["fields"]]
+
+# Free-text fields, in column order
+TEXT_FIELDS = tuple(field["id"] for field in _FIELDS if field["kind"] != "multiselect")
+
+# Multiselect fields and their options; an option's position is its bit
+MULTISELECT_FIELDS = {field["id"]: field["options"] for field in _FIELDS if field["kind"] == "multiselect"}
+
+DEFAULT_STORE_DIR = "student_data"
+
+
+def encode_options(key, selected):
+    options = MULTISELECT_FIELDS[key]
+    mask = 0
+    for label in selected:
+        try:
+            mask |= 1 << options.index(label)
+        except ValueError:
+            raise ValueError(f"Unknown option for {key}: {label!r}")
+    return mask
+
+
+def decode_options(key, mask):
+    return [label for bit, label in enumerate(MULTISELECT_FIELDS[key]) if mask >> bit & 1]
+
+
+def _schema():
+    return {
+        "version": SCHEMA_VERSION,
+        "text_fields": list(TEXT_FIELDS),
+        "multiselect_fields": {key: list(options) for key, options in MULTISELECT_FIELDS.items()},
+    }
+
+
+class StudentStore:
+    def __init__(self, directory=DEFAULT_STORE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        schema_path = os.path.join(directory, "schema.json")
+        if os.path.exists(schema_path):
+            with open(schema_path, 'r', encoding='utf-8') as f:
+                if json.load(f) != _schema():
+                    raise ValueError(f"{directory} was written with a different questionnaire layout")
+        else:
+            # A torn schema.json would make the store impossible to open
+            atomic_write_json(schema_path, _schema())
+        self._repair()
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _column_files(self):
+        files = [(self._path(f"{key}.u16"), 2) for key in MULTISELECT_FIELDS]
+        files.append((self._path("submitted_at.u32"), 4))
+        return files
+
+    def _text_lines(self):
+        path = self._path("text.jsonl")
+        if not os.path.exists(path):
+            return 0
+        with open(path, 'rb') as f:
+            return sum(1 for line in f if line.endswith(b"\n"))
+
+    def _repair(self):
+        # A crash mid-append can leave some columns one row ahead; cut every
+        # column back to the last submission that was written completely
+        counts = [os.path.getsize(path) // width if os.path.exists(path) else 0
+                  for path, width in self._column_files()]
+        rows = min(counts + [self._text_lines()])
+        for path, width in self._column_files():
+            if os.path.exists(path) and os.path.getsize(path) != rows * width:
+                os.truncate(path, rows * width)
+        text_path = self._path("text.jsonl")
+        if os.path.exists(text_path):
+            with open(text_path, 'rb+') as f:
+                end = 0
+                for _ in range(rows):
+                    end += len(f.readline())
+                f.truncate(end)
+        self._rows = rows
+
+    def __len__(self):
+        return self._rows
+
+    def append(self, data):
+        """Append one submission (the dict StudentForm.save_data builds)."""
+        self.extend([data])
+        return self._rows - 1
+
+    def extend(self, rows):
+        """Append several submissions with one write per column file."""
+        rows = list(rows)
+        if not rows:
+            return
+        columns = {key: array('H', [encode_options(key, data.get(key, [])) for data in rows])
+                   for key in MULTISELECT_FIELDS}
+        text = "".join(json.dumps([data.get(key, "") for key in TEXT_FIELDS], ensure_ascii=False) + "\n"
+                       for data in rows)
+
+        with open(self._path("text.jsonl"), 'a', encoding='utf-8') as f:
+            f.write(text)
+        for key, masks in columns.items():
+            self._append_column(f"{key}.u16", masks)
+        self._append_column("submitted_at.u32", array('I', [int(time.time())] * len(rows)))
+        self._rows += len(rows)
+
+    def _append_column(self, name, values):
+        if sys.byteorder != "little":
+            values.byteswap()
+        with open(self._path(name), 'ab') as f:
+            values.tofile(f)
+
+    def _read_column(self, name, typecode):
+        values = array(typecode)
+        path = self._path(name)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                values.fromfile(f, self._rows)
+            if sys.byteorder != "little":
+                values.byteswap()
+        return values
+
+    def iter_rows(self):
+        """Yield each submission as a dict in the save_data() layout."""
+        columns = {key: self._read_column(f"{key}.u16", 'H') for key in MULTISELECT_FIELDS}
+        submitted = self._read_column("submitted_at.u32", 'I')
+        text_path = self._path("text.jsonl")
+        if not os.path.exists(text_path):
+            return
+        with open(text_path, 'r', encoding='utf-8') as f:
+            for row, line in zip(range(self._rows), f):
+                data = dict(zip(TEXT_FIELDS, json.loads(line)))
+                for key, column in columns.items():
+                    data[key] = decode_options(key, column[row])
+                data["submitted_at"] = submitted[row]
+                yield data
+
+    def export_csv(self, target):
+        """Write every submission as CSV; multiselect values are joined with '; '."""
+        header = list(TEXT_FIELDS) + list(MULTISELECT_FIELDS) + ["submitted_at"]
+        stream = open(target, 'w', encoding='utf-8', newline='') if isinstance(target, str) else target
+        try:
+            writer = csv.writer(stream)
+            writer.writerow(header)
+            for data in self.iter_rows():
+                writer.writerow([data[key] for key in TEXT_FIELDS]
+                                + ["; ".join(data[key]) for key in MULTISELECT_FIELDS]
+                                + [data["submitted_at"]])
+        finally:
+            if stream is not target:
+                stream.close()
+
+    def to_numpy(self, start=0):
+        """Return {key: uint16 bitmask array} plus "submitted_at" (uint32).
+
+        start skips the first submissions, e.g. ones already aggregated.
+        """
+        if np is None:
+            raise ImportError("StudentStore.to_numpy() requires NumPy")
+        arrays = {}
+        for key in MULTISELECT_FIELDS:
+            arrays[key] = self._fromfile(f"{key}.u16", '<u2', start)
+        arrays["submitted_at"] = self._fromfile("submitted_at.u32", '<u4', start)
+        return arrays
+
+    def _fromfile(self, name, dtype, start=0):
+        path = self._path(name)
+        count = self._rows - start
+        if not os.path.exists(path) or count <= 0:
+            return np.zeros(0, dtype=dtype)
+        dtype = np.dtype(dtype)
+        return np.fromfile(path, dtype=dtype, count=count, offset=start * dtype.itemsize)
+
+    def text_column(self, start=0):
+        """Yield the free-text fields of each submission as a dict."""
+        text_path = self._path("text.jsonl")
+        if not os.path.exists(text_path):
+            return
+        with open(text_path, 'r', encoding='utf-8') as f:
+            for _, line in zip(range(self._rows), f):
+                if start:
+                    start -= 1
+                    continue
+                yield dict(zip(TEXT_FIELDS, json.loads(line)))
+
+
+def unpack(key, masks):
+    """Expand a bitmask column into an (n, options) boolean matrix."""
+    if np is None:
+        raise ImportError("unpack() requires NumPy")
+    bits = np.arange(len(MULTISELECT_FIELDS[key]), dtype=np.uint16)
+    return (np.asarray(masks, dtype=np.uint16)[:, None] >> bits & 1).astype(bool)
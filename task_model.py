@@ -0,0 +1,87 @@
+"""Task state for the results screen, independent of Tk.
+
+TaskModel holds the task texts in display order, whether each one is
+completed, a running count of completed tasks and an index from task text
+to its positions, so toggling a task, looking it up by text and reading
+the progress are all O(1) however long the list is.
+
+Views register listeners with add_listener(); every change calls them
+with the list of positions that changed, or None when the whole list was
+replaced. Tk variables and labels are only updated from those callbacks.
+"""
+
+
+class TaskModel:
+    def __init__(self):
+        self.texts = []
+        self.states = []
+        self.completed = 0
+        self._index = {}
+        self._repeated = {}
+        self._listeners = []
+
+    def __len__(self):
+        return len(self.texts)
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def _notify(self, positions):
+        for callback in self._listeners:
+            callback(positions)
+
+    def set_tasks(self, texts):
+        """Replace the task list; every task starts out not completed."""
+        self.texts = list(texts)
+        self.states = [False] * len(self.texts)
+        self.completed = 0
+        self._index = {text: position for position, text in enumerate(self.texts)}
+        # Texts listed more than once (rare) keep all their positions here
+        self._repeated = {}
+        if len(self._index) != len(self.texts):
+            for position, text in enumerate(self.texts):
+                self._repeated.setdefault(text, []).append(position)
+            self._repeated = {text: found for text, found in self._repeated.items() if len(found) > 1}
+        self._notify(None)
+
+    def positions(self, text):
+        """Positions of the tasks with this text (a text can appear twice)."""
+        if text in self._repeated:
+            return self._repeated[text]
+        position = self._index.get(text)
+        return () if position is None else (position,)
+
+    def is_completed(self, position):
+        return self.states[position]
+
+    def _apply(self, position, completed):
+        if self.states[position] == completed:
+            return False
+        self.states[position] = completed
+        self.completed += 1 if completed else -1
+        return True
+
+    def set(self, position, completed):
+        """Mark one task; returns True if its state changed."""
+        changed = self._apply(position, bool(completed))
+        if changed:
+            self._notify([position])
+        return changed
+
+    def toggle(self, position):
+        self.set(position, not self.states[position])
+        return self.states[position]
+
+    def update_by_text(self, completed_by_text):
+        """Apply {text: completed} (e.g. saved progress); unknown texts are ignored.
+
+        Costs O(len(completed_by_text)), not O(len(self)), and notifies once.
+        """
+        changed = []
+        for text, completed in completed_by_text.items():
+            for position in self.positions(text):
+                if self._apply(position, bool(completed)):
+                    changed.append(position)
+        if changed:
+            self._notify(changed)
+        return changed
@@ -0,0 +1,171 @@
+"""Recycled task list for the results screen.
+
+The results screen used to create a fresh canvas, scrollbar and one
+Checkbutton per task every time it was shown. TaskListView is built once:
+it owns a small pool of row widgets (enough to fill the visible area) and,
+when the list is scrolled or a new result is shown, rebinds those rows to
+different tasks instead of creating new widgets. Task state lives in a
+TaskModel (see task_model.py), so the number of Tk widgets and variables
+stays constant no matter how many sessions or tasks are shown, and a row's
+variable is only set when the model reports that its task changed.
+"""
+import tkinter as tk
+from tkinter import ttk
+
+from task_model import TaskModel
+
+
+class _Row:
+    def __init__(self, view, canvas, slot):
+        self.frame = ttk.Frame(canvas)
+        self.var = tk.BooleanVar(value=False)
+        self.header = ttk.Label(self.frame,
+                                font=('Segoe UI', 12, 'bold'),
+                                foreground=view.colors['fg'])
+        self.checkbutton = ttk.Checkbutton(self.frame,
+                                           variable=self.var,
+                                           command=lambda: view._on_row_toggle(slot),
+                                           style='TCheckbutton')
+        self.window = canvas.create_window(0, slot * view.ROW_HEIGHT,
+                                           window=self.frame, anchor="nw",
+                                           height=view.ROW_HEIGHT)
+        self.kind = None
+        for widget in (self.frame, self.header, self.checkbutton):
+            view._bind_wheel(widget)
+
+    def show_header(self, text):
+        if self.kind != 'header':
+            self.checkbutton.pack_forget()
+            self.header.pack(pady=(10, 0))
+            self.kind = 'header'
+        self.header.config(text=text)
+
+    def show_task(self, text, completed):
+        if self.kind != 'task':
+            self.header.pack_forget()
+            self.checkbutton.pack(anchor="w", padx=20, pady=5)
+            self.kind = 'task'
+        self.checkbutton.config(text=text)
+        self.var.set(completed)
+
+
+class TaskListView:
+    ROW_HEIGHT = 34
+
+    def __init__(self, parent, colors, on_toggle, model=None):
+        self.colors = colors
+        self.on_toggle = on_toggle
+        self.model = model if model is not None else TaskModel()
+        self.model.add_listener(self._on_model_change)
+
+        self.frame = ttk.Frame(parent)
+        ttk.Label(self.frame,
+                  text="Your Personalized Tasks",
+                  font=('Segoe UI', 16, 'bold'),
+                  foreground=colors['fg']).pack(pady=(0, 20))
+
+        body = ttk.Frame(self.frame)
+        body.pack(fill=tk.BOTH, expand=True)
+        self.canvas = tk.Canvas(body, bg=colors['bg'], highlightthickness=0)
+        self.scrollbar = ttk.Scrollbar(body, orient="vertical", command=self.yview)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.bind("<Configure>", self._on_resize)
+        self._bind_wheel(self.canvas)
+
+        self.rows = []
+        # One entry per displayed line: (text, task index or None for headers)
+        self.items = []
+        # Line of each task in self.items
+        self.task_items = []
+        self.top = 0
+
+    def set_tasks(self, tasks):
+        """Show a new task list (as returned by analyze_results)."""
+        self.items = []
+        self.task_items = []
+        texts = []
+        for task in tasks:
+            if not task:  # Skip empty lines
+                continue
+            if task.endswith(":"):  # Category headers
+                self.items.append((task, None))
+            else:
+                self.task_items.append(len(self.items))
+                self.items.append((task, len(texts)))
+                texts.append(task)
+        self.top = 0
+        self.model.set_tasks(texts)
+
+    def _on_model_change(self, positions):
+        if positions is None:
+            self._render()
+            return
+        for position in positions:
+            slot = self.task_items[position] - self.top
+            if 0 <= slot < len(self.rows):
+                self.rows[slot].var.set(self.model.states[position])
+
+    def _visible_count(self):
+        return max(1, self.canvas.winfo_height() // self.ROW_HEIGHT)
+
+    def _ensure_pool(self):
+        # The pool only grows to fill the tallest viewport seen so far
+        while len(self.rows) < self._visible_count():
+            self.rows.append(_Row(self, self.canvas, len(self.rows)))
+
+    def _render(self):
+        self._ensure_pool()
+        width = self.canvas.winfo_width()
+        for slot, row in enumerate(self.rows):
+            index = self.top + slot
+            if index < len(self.items):
+                text, task_index = self.items[index]
+                if task_index is None:
+                    row.show_header(text)
+                else:
+                    row.show_task(text, self.model.states[task_index])
+                self.canvas.itemconfigure(row.window, state='normal', width=width)
+            else:
+                self.canvas.itemconfigure(row.window, state='hidden')
+
+        if self.items:
+            first = self.top / len(self.items)
+            last = min(1.0, (self.top + self._visible_count()) / len(self.items))
+        else:
+            first, last = 0.0, 1.0
+        self.scrollbar.set(first, last)
+
+    def _clamp(self, top):
+        return max(0, min(top, len(self.items) - self._visible_count()))
+
+    def _scroll_to(self, top):
+        top = self._clamp(top)
+        if top != self.top:
+            self.top = top
+            self._render()
+
+    def yview(self, *args):
+        if args[0] == 'moveto':
+            self._scroll_to(round(float(args[1]) * len(self.items)))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self._visible_count()
+            self._scroll_to(self.top + step)
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", lambda e: self._scroll_to(self.top - (1 if e.delta > 0 else -1)))
+        widget.bind("<Button-4>", lambda e: self._scroll_to(self.top - 1))
+        widget.bind("<Button-5>", lambda e: self._scroll_to(self.top + 1))
+
+    def _on_resize(self, event):
+        self.top = self._clamp(self.top)
+        self._render()
+
+    def _on_row_toggle(self, slot):
+        row = self.rows[slot]
+        text, task_index = self.items[self.top + slot]
+        completed = row.var.get()
+        if self.model.set(task_index, completed):
+            self.on_toggle(task_index, text, completed)
@@ -0,0 +1,11 @@
+# Modern color scheme, shared by the Tk UI and the headless chart renderer
+COLORS = {
+    'bg': '#1E1E1E',
+    'fg': '#FFFFFF',
+    'accent': '#007ACC',
+    'secondary': '#2D2D2D',
+    'text': '#CCCCCC',
+    'success': '#4CAF50',
+    'warning': '#FFC107',
+    'error': '#F44336'
+}